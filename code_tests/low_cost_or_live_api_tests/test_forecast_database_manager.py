@@ -1,5 +1,3 @@
-import asyncio
-
 from forecasting_tools.forecasting.helpers.forecast_database_manager import (
     ForecastDatabaseManager,
     ForecastRunType,
@@ -37,24 +35,24 @@ def test_base_rate_report_turns_into_coda_row() -> None:
         )
 
 
-async def test_forecast_report_can_be_added_to_coda() -> None:
+def test_forecast_report_can_be_added_to_coda() -> None:
     example_reports = get_forecast_example_reports()[:2]
     for example_report in example_reports:
         ForecastDatabaseManager.add_forecast_report_to_database(
             example_report, ForecastRunType.UNIT_TEST_FORECAST
         )
-        await asyncio.sleep(5)
-    # No assert, make sure it doesn't error
+    ForecastDatabaseManager.flush_reports_to_database()
+    assert ForecastDatabaseManager.REPORTS_WRITER.stats.rows_failed == 0
 
 
-async def test_base_rate_report_can_be_added_to_coda() -> None:
+def test_base_rate_report_can_be_added_to_coda() -> None:
     example_reports = get_base_rate_example_reports()[:2]
     for example_report in example_reports:
         ForecastDatabaseManager.add_base_rate_report_to_database(
             example_report, ForecastRunType.UNIT_TEST_BASE_RATE
         )
-        await asyncio.sleep(5)
-    # No assert, make sure it doesn't error
+    ForecastDatabaseManager.flush_reports_to_database()
+    assert ForecastDatabaseManager.REPORTS_WRITER.stats.rows_failed == 0
 
 
 def get_forecast_example_reports() -> list[BinaryReport]:
@@ -0,0 +1,228 @@
+import json
+import subprocess
+import sys
+from unittest.mock import Mock
+
+from pydantic import BaseModel
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from code_tests.utilities_for_tests.performance_timer import PerformanceTimer
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+)
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
+    RefreshingBucketRateLimiter,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ReasonedPrediction,
+    ResearchWithPredictions,
+)
+from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
+    NumericDistribution,
+    Percentile,
+)
+from forecasting_tools.forecasting.questions_and_reports.report_section import (
+    ReportSection,
+)
+
+RESEARCH_PARAGRAPH = (
+    "Recent reporting suggests the trend is continuing, although several "
+    "analysts expect a slowdown before the resolution date. " * 10
+)
+
+
+class ParsedFactor(BaseModel):
+    name: str
+    description: str
+    weight: float
+
+
+def make_research_with_predictions() -> ResearchWithPredictions:
+    research = "\n".join(
+        f"## Source {i}\n{RESEARCH_PARAGRAPH}" for i in range(10)
+    )
+    return ResearchWithPredictions(
+        research_report=research,
+        summary_report=research[:2500],
+        predictions=[
+            ReasonedPrediction(
+                prediction_value=0.3 + i / 100,
+                reasoning=RESEARCH_PARAGRAPH * 3,
+            )
+            for i in range(5)
+        ],
+    )
+
+
+async def test_llm_invoke_overhead(mocker: Mock) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=500)
+    mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(Gpt4o),
+        return_value=TextTokenCostResponse(
+            data="Mock response",
+            prompt_tokens_used=500,
+            completion_tokens_used=2,
+            total_tokens_used=502,
+            model=Gpt4o.MODEL_NAME,
+            cost=0.001,
+        ),
+    )
+    model = Gpt4o()
+    prompt = RESEARCH_PARAGRAPH * 5
+
+    seconds_per_call = await PerformanceTimer.measure_async_seconds_per_call(
+        lambda: model.invoke(prompt), calls=50
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "llm_invoke_overhead", seconds_per_call
+    )
+
+
+async def test_limiter_acquire_throughput() -> None:
+    limiter = RefreshingBucketRateLimiter(capacity=1e9, refresh_rate=1e9)
+
+    seconds_per_call = await PerformanceTimer.measure_async_seconds_per_call(
+        lambda: limiter.wait_till_able_to_acquire_resources(1), calls=2000
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "limiter_acquire", seconds_per_call
+    )
+
+
+def test_cost_manager_bookkeeping() -> None:
+    def track_nested_costs() -> None:
+        with MonetaryCostManager(10):
+            with MonetaryCostManager(5):
+                for _ in range(10):
+                    MonetaryCostManager.raise_error_if_limit_would_be_reached()
+                    MonetaryCostManager.increase_current_usage_in_parent_managers(
+                        0.01
+                    )
+
+    seconds_per_call = PerformanceTimer.measure_seconds_per_call(
+        track_nested_costs, calls=1000
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "cost_manager_bookkeeping", seconds_per_call
+    )
+
+
+def test_structured_output_parsing() -> None:
+    response = "```json\n" + json.dumps(
+        [
+            {
+                "name": f"Factor {i}",
+                "description": RESEARCH_PARAGRAPH[:300],
+                "weight": i / 50,
+            }
+            for i in range(50)
+        ]
+    )
+    response += "\n```"
+
+    seconds_per_call = PerformanceTimer.measure_seconds_per_call(
+        lambda: Gpt4o.transform_response_to_type(response, list[ParsedFactor]),
+        calls=100,
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "structured_output_parsing", seconds_per_call
+    )
+
+
+def test_numeric_distribution_cdf() -> None:
+    distribution = NumericDistribution(
+        declared_percentiles=[
+            Percentile(value=10 + 8 * i, percentile=(i + 0.5) / 11)
+            for i in range(11)
+        ],
+        open_upper_bound=True,
+        open_lower_bound=False,
+        upper_bound=120,
+        lower_bound=0,
+        zero_point=None,
+    )
+
+    seconds_per_call = PerformanceTimer.measure_seconds_per_call(
+        lambda: distribution.cdf, calls=50
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "numeric_distribution_cdf", seconds_per_call
+    )
+
+
+async def test_report_assembly() -> None:
+    bot = StubForecastBot()
+    question = make_binary_question("Will the trend continue?")
+    research_with_predictions = [
+        make_research_with_predictions() for _ in range(3)
+    ]
+
+    seconds_per_call = await PerformanceTimer.measure_async_seconds_per_call(
+        lambda: bot._create_report(
+            question, research_with_predictions, 0.5, 3
+        ),
+        calls=50,
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "report_assembly", seconds_per_call
+    )
+
+
+def test_report_section_parsing() -> None:
+    markdown = "\n".join(
+        f"# Section {i}\n"
+        + "\n".join(
+            f"## Subsection {i}.{j}\n### Detail\n{RESEARCH_PARAGRAPH}"
+            for j in range(5)
+        )
+        for i in range(10)
+    )
+
+    seconds_per_call = PerformanceTimer.measure_seconds_per_call(
+        lambda: ReportSection.turn_markdown_into_report_sections(markdown),
+        calls=50,
+    )
+
+    PerformanceTimer.assert_within_baseline(
+        "report_section_parsing", seconds_per_call
+    )
+
+
+def test_package_import_time() -> None:
+    """Importing reports alone should not load the LLM SDKs"""
+    code = (
+        "import time; start_time = time.perf_counter();"
+        "from forecasting_tools import BinaryReport;"
+        "print(time.perf_counter() - start_time)"
+    )
+    import_seconds = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+
+    PerformanceTimer.assert_within_baseline(
+        "package_import", min(import_seconds)
+    )
@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import Mock
+
+from openai.types.chat import ChatCompletion
+
+from code_tests.utilities_for_tests.fake_openai_batch_server import (
+    FakeOpenAiBatchServer,
+    echo_last_message,
+)
+from forecasting_tools.ai_models.ai_utils.openai_batcher import OpenAiBatcher
+from forecasting_tools.ai_models.basic_model_interfaces.retryable_model import (
+    RetryableModel,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.gpto1 import GptO1
+from forecasting_tools.ai_models.perplexity import Perplexity
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.ai_models.resource_managers.retry_policy import (
+    Backoff,
+    ErrorClass,
+    RetryPolicy,
+)
+
+
+def make_batcher(server: FakeOpenAiBatchServer, **kwargs) -> OpenAiBatcher:
+    return OpenAiBatcher(
+        client=server.client,
+        seconds_to_collect_requests=0.05,
+        poll_interval_seconds=0.01,
+        **kwargs,
+    )
+
+
+async def test_concurrent_requests_share_a_discounted_batch(
+    mocker: Mock,
+) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    prompts = ["First", "Second", "Third"]
+    full_price = Gpt4o().calculate_cost_from_tokens(
+        prompt_tkns=1000, completion_tkns=100
+    )
+
+    async with FakeOpenAiBatchServer(polls_until_complete=3) as server:
+        with make_batcher(server) as batcher, MonetaryCostManager() as cost:
+            responses = await asyncio.gather(
+                *[Gpt4o().invoke(prompt) for prompt in prompts]
+            )
+
+    assert responses == [f"Echo: {prompt}" for prompt in prompts]
+    assert server.requests_per_batch == [3]
+    assert batcher.stats.batches_submitted == 1
+    assert batcher.stats.requests_succeeded == 3
+    assert round(cost.current_usage, 8) == round(3 * full_price / 2, 8)
+    assert round(batcher.stats.cost_saved, 8) == round(3 * full_price / 2, 8)
+
+
+async def test_full_batches_are_submitted_without_waiting(
+    mocker: Mock,
+) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    async with FakeOpenAiBatchServer() as server:
+        with make_batcher(server, max_batch_size=2):
+            await asyncio.gather(
+                *[Gpt4o().invoke(f"Prompt {i}") for i in range(3)]
+            )
+    assert sorted(server.requests_per_batch) == [1, 2]
+
+
+async def test_each_batch_holds_a_single_model(mocker: Mock) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    mocker.patch.object(GptO1, "input_to_tokens", return_value=10)
+    async with FakeOpenAiBatchServer() as server:
+        with make_batcher(server) as batcher:
+            responses = await asyncio.gather(
+                Gpt4o().invoke("First"),
+                GptO1().invoke("Second"),
+                Gpt4o().invoke("Third"),
+            )
+
+    assert responses == ["Echo: First", "Echo: Second", "Echo: Third"]
+    assert sorted(server.requests_per_batch) == [1, 2]
+    assert batcher.stats.requests_failed == 0
+
+
+async def test_failed_batch_requests_are_retried(mocker: Mock) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    no_wait = Backoff(min_wait=0, max_wait=0, multiplier=0)
+    mocker.patch.object(
+        RetryableModel,
+        "_retry_policy",
+        RetryPolicy(
+            backoffs={error_class: no_wait for error_class in ErrorClass}
+        ),
+    )
+    attempts = 0
+
+    def fail_first_attempt(body: dict) -> tuple[int, dict]:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return 500, {"error": {"message": "Server error"}}
+        return echo_last_message(body)
+
+    async with FakeOpenAiBatchServer(respond=fail_first_attempt) as server:
+        with make_batcher(server) as batcher:
+            response = await Gpt4o(allowed_tries=2).invoke("Hi")
+
+    assert response == "Echo: Hi"
+    assert server.requests_per_batch == [1, 1]
+    assert batcher.stats.requests_failed == 1
+
+
+async def test_non_openai_models_skip_the_batcher(mocker: Mock) -> None:
+    mocker.patch.object(Perplexity, "input_to_tokens", return_value=10)
+    _, response_body = echo_last_message(
+        {"model": Perplexity.MODEL_NAME, "messages": [{"content": "Hi"}]}
+    )
+    mocked_create = mocker.patch.object(
+        Perplexity._OPENAI_ASYNC_CLIENT.chat.completions,
+        "create",
+        new_callable=mocker.AsyncMock,
+        return_value=ChatCompletion.model_validate(response_body),
+    )
+
+    async with FakeOpenAiBatchServer() as server:
+        with make_batcher(server):
+            model = Perplexity()
+            timeout_time = model._get_timeout_time()
+            response = await model.invoke("Hi")
+
+    assert response == "Echo: Hi"
+    assert mocked_create.call_count == 1
+    assert server.requests_per_batch == []
+    assert timeout_time == Perplexity.TIMEOUT_TIME
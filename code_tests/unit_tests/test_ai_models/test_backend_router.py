@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from forecasting_tools.ai_models.backend_router import (
+    BackendRouter,
+    RoutedBackend,
+)
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+
+
+class FakeBackend:
+    def __init__(
+        self, name: str, latency: float = 0, error: Exception | None = None
+    ) -> None:
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+
+    async def invoke(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return f"{self.name}: {prompt}"
+
+
+async def test_fails_over_to_next_backend() -> None:
+    broken = FakeBackend("broken", error=RuntimeError("Provider down"))
+    healthy = FakeBackend("healthy")
+    router = BackendRouter(
+        [RoutedBackend("broken", broken), RoutedBackend("healthy", healthy)]
+    )
+
+    assert await router.invoke("Hi") == "healthy: Hi"
+    assert await router.invoke("Hi") == "healthy: Hi"
+    assert broken.calls == 1
+    health = {health.name: health for health in router.health_report}
+    assert health["broken"].error_rate == 1
+    assert health["healthy"].error_rate == 0
+
+
+async def test_routes_to_fastest_backend_once_latencies_are_known() -> None:
+    slow = FakeBackend("slow", latency=0.05)
+    fast = FakeBackend("fast", latency=0)
+    router = BackendRouter(
+        [RoutedBackend("slow", slow), RoutedBackend("fast", fast)]
+    )
+
+    for _ in range(5):
+        await router.invoke("Hi")
+
+    assert slow.calls == 1
+    assert fast.calls == 4
+    assert [backend.name for backend in router.rank_backends()] == [
+        "fast",
+        "slow",
+    ]
+
+
+async def test_unconfigured_backends_are_skipped() -> None:
+    preferred = FakeBackend("preferred")
+    fallback = FakeBackend("fallback")
+    router = BackendRouter(
+        [
+            RoutedBackend("preferred", preferred, is_configured=lambda: False),
+            RoutedBackend("fallback", fallback),
+        ]
+    )
+    assert await router.invoke("Hi") == "fallback: Hi"
+    assert preferred.calls == 0
+
+    unconfigured_router = BackendRouter(
+        [RoutedBackend("preferred", preferred, is_configured=lambda: False)]
+    )
+    assert not unconfigured_router.has_configured_backend
+    with pytest.raises(RuntimeError):
+        await unconfigured_router.invoke("Hi")
+
+
+async def test_last_error_is_raised_when_all_backends_fail() -> None:
+    router = BackendRouter(
+        [
+            RoutedBackend("a", FakeBackend("a", error=RuntimeError("A"))),
+            RoutedBackend("b", FakeBackend("b", error=ValueError("B"))),
+        ]
+    )
+    with pytest.raises(ValueError):
+        await router.invoke("Hi")
+
+
+async def test_cost_limit_errors_do_not_fail_over() -> None:
+    over_budget = FakeBackend("over_budget", error=HardLimitExceededError())
+    other = FakeBackend("other")
+    router = BackendRouter(
+        [
+            RoutedBackend("over_budget", over_budget),
+            RoutedBackend("other", other),
+        ]
+    )
+    with pytest.raises(HardLimitExceededError):
+        await router.invoke("Hi")
+    assert other.calls == 0
+
+
+async def test_failed_backend_is_retried_after_error_window() -> None:
+    flaky = FakeBackend("flaky", error=RuntimeError("Provider down"))
+    fallback = FakeBackend("fallback", latency=0.01)
+    router = BackendRouter(
+        [
+            RoutedBackend("flaky", flaky, error_window_seconds=0.05),
+            RoutedBackend("fallback", fallback),
+        ]
+    )
+    await router.invoke("Hi")
+    flaky.error = None
+    await router.invoke("Hi")
+    assert flaky.calls == 1
+
+    await asyncio.sleep(0.06)
+    assert await router.invoke("Hi") == "flaky: Hi"
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from forecasting_tools.ai_models.exa_searcher import ExaSearcher, SearchInput
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache() -> None:
+    ExaSearcher.clear_search_cache()
+
+
+def mock_exa_direct_call(mocker: Mock) -> Mock:
+    mock_function = mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(ExaSearcher)
+    )
+    mock_function.return_value = (
+        ExaSearcher._get_mock_return_for_direct_call_to_model_using_cheap_input()
+    )
+    return mock_function
+
+
+def make_search(
+    query: str = "Moko Research",
+    include_domains: list[str] | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> SearchInput:
+    return SearchInput(
+        web_search_query=query,
+        highlight_query=None,
+        include_domains=include_domains or [],
+        exclude_domains=[],
+        include_text=None,
+        start_published_date=start_date,
+        end_published_date=end_date,
+    )
+
+
+async def test_equivalent_searches_share_cached_results(mocker: Mock) -> None:
+    mocked_call = mock_exa_direct_call(mocker)
+    searcher = ExaSearcher(use_search_cache=True)
+
+    with MonetaryCostManager(1) as cost_manager:
+        await searcher.invoke(
+            make_search("Moko  Research", ["b.com", "A.com"])
+        )
+        cost_after_first_search = cost_manager.current_usage
+        await searcher.invoke(make_search("moko research", ["a.com", "b.com"]))
+
+    assert mocked_call.call_count == 1
+    assert cost_manager.current_usage == pytest.approx(cost_after_first_search)
+    stats = ExaSearcher.get_search_cache_stats()
+    assert stats.hits == 1
+    assert stats.saved_cost == pytest.approx(cost_after_first_search)
+
+
+async def test_different_searches_are_not_shared(mocker: Mock) -> None:
+    mocked_call = mock_exa_direct_call(mocker)
+    searcher = ExaSearcher(use_search_cache=True)
+
+    await searcher.invoke(make_search("Moko Research"))
+    await searcher.invoke(make_search("Moko Research", ["a.com"]))
+    await ExaSearcher(use_search_cache=True, num_results=10).invoke(
+        make_search("Moko Research")
+    )
+
+    assert mocked_call.call_count == 3
+
+
+async def test_concurrent_searches_are_coalesced(mocker: Mock) -> None:
+    async def slow_search(*args, **kwargs) -> list:
+        await asyncio.sleep(0.1)
+        return (
+            ExaSearcher._get_mock_return_for_direct_call_to_model_using_cheap_input()
+        )
+
+    mocked_call = mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(
+            ExaSearcher
+        ),
+        side_effect=slow_search,
+    )
+    searcher = ExaSearcher(use_search_cache=True)
+
+    await asyncio.gather(*[searcher.invoke(make_search()) for _ in range(4)])
+
+    assert mocked_call.call_count == 1
+    assert ExaSearcher.get_search_cache_stats().coalesced_requests == 3
+
+
+async def test_cache_is_off_by_default(mocker: Mock) -> None:
+    mocked_call = mock_exa_direct_call(mocker)
+    searcher = ExaSearcher()
+
+    await searcher.invoke(make_search())
+    await searcher.invoke(make_search())
+
+    assert mocked_call.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date, expected_ttl",
+    [
+        (None, None, ExaSearcher.OPEN_ENDED_SEARCH_CACHE_TTL),
+        (
+            datetime.now() - timedelta(days=365),
+            datetime.now() - timedelta(days=30),
+            ExaSearcher.HISTORICAL_SEARCH_CACHE_TTL,
+        ),
+        (
+            datetime.now() - timedelta(days=2),
+            None,
+            ExaSearcher.RECENT_SEARCH_CACHE_TTL,
+        ),
+    ],
+)
+def test_cache_ttl_depends_on_date_window(
+    start_date: datetime | None,
+    end_date: datetime | None,
+    expected_ttl: timedelta,
+) -> None:
+    searcher = ExaSearcher(use_search_cache=True)
+    ttl = searcher._ExaSearcher__get_cache_ttl(  # type: ignore
+        make_search(start_date=start_date, end_date=end_date)
+    )
+    assert ttl == expected_ttl
@@ -0,0 +1,154 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.ai_models.basic_model_interfaces.hedged_model import (
+    HedgingPolicy,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+
+COST_PER_CALL = 0.01
+
+
+def mock_direct_call_with_durations(
+    mocker: Mock, durations: list[float]
+) -> Mock:
+    call_durations = iter(durations)
+
+    async def delayed_response(prompt: str) -> TextTokenCostResponse:
+        duration = next(call_durations)
+        await asyncio.sleep(duration)
+        return TextTokenCostResponse(
+            data=f"Took {duration}",
+            prompt_tokens_used=10,
+            completion_tokens_used=10,
+            total_tokens_used=20,
+            model=Gpt4o.MODEL_NAME,
+            cost=COST_PER_CALL,
+        )
+
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    return mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(Gpt4o),
+        side_effect=delayed_response,
+    )
+
+
+def make_trained_policy(
+    typical_latency: float = 0.05, max_hedge_spend: float = 1
+) -> HedgingPolicy:
+    policy = HedgingPolicy(
+        latency_percentile=90,
+        min_latency_samples=10,
+        min_hedge_delay=0,
+        max_hedge_spend=max_hedge_spend,
+    )
+    for _ in range(10):
+        policy.record_primary_latency(typical_latency)
+    return policy
+
+
+async def test_slow_request_is_hedged_and_hedge_wins(mocker: Mock) -> None:
+    mocked_call = mock_direct_call_with_durations(mocker, [5, 0.01])
+    policy = make_trained_policy()
+    model = Gpt4o(hedging_policy=policy)
+
+    with MonetaryCostManager(1) as cost_manager:
+        response = await asyncio.wait_for(model.invoke("Hi"), timeout=2)
+
+    assert response == "Took 0.01"
+    assert mocked_call.call_count == 2
+    assert policy.stats.hedges_issued == 1
+    assert policy.stats.hedge_wins == 1
+    assert policy.stats.hedge_rate == pytest.approx(1)
+    assert cost_manager.current_usage == pytest.approx(COST_PER_CALL)
+    assert policy.hedge_cost_manager.current_usage == pytest.approx(
+        COST_PER_CALL
+    )
+
+
+async def test_fast_request_is_not_hedged(mocker: Mock) -> None:
+    mocked_call = mock_direct_call_with_durations(mocker, [0.01])
+    policy = make_trained_policy(typical_latency=0.5)
+    model = Gpt4o(hedging_policy=policy)
+
+    response = await model.invoke("Hi")
+
+    assert response == "Took 0.01"
+    assert mocked_call.call_count == 1
+    assert policy.stats.hedges_issued == 0
+
+
+async def test_no_hedging_before_latency_is_learned(mocker: Mock) -> None:
+    mocked_call = mock_direct_call_with_durations(mocker, [0.2])
+    policy = HedgingPolicy(min_latency_samples=10, min_hedge_delay=0)
+    model = Gpt4o(hedging_policy=policy)
+
+    await model.invoke("Hi")
+
+    assert mocked_call.call_count == 1
+    assert policy.stats.hedges_issued == 0
+    assert policy.get_hedge_delay() is None
+
+
+async def test_hedge_is_skipped_when_hedge_budget_is_spent(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_direct_call_with_durations(mocker, [0.01, 0.3])
+    policy = make_trained_policy(max_hedge_spend=COST_PER_CALL / 2)
+    model = Gpt4o(hedging_policy=policy)
+    await model.invoke("Hi")
+
+    response = await model.invoke("Hi")
+
+    assert response == "Took 0.3"
+    assert mocked_call.call_count == 2
+    assert policy.stats.hedges_skipped_for_budget == 1
+
+
+async def test_primary_is_used_when_hedge_fails(mocker: Mock) -> None:
+    mocked_call = mock_direct_call_with_durations(mocker, [0.3])
+    successful_response = mocked_call.side_effect
+
+    async def succeed_then_fail(prompt: str) -> TextTokenCostResponse:
+        if mocked_call.call_count == 1:
+            return await successful_response(prompt)
+        raise RuntimeError("Hedge failed")
+
+    mocked_call.side_effect = succeed_then_fail
+    policy = make_trained_policy()
+    model = Gpt4o(hedging_policy=policy, allowed_tries=1)
+
+    response = await model.invoke("Hi")
+
+    assert response == "Took 0.3"
+    assert policy.stats.hedges_issued == 1
+    assert policy.stats.hedge_wins == 0
+
+
+async def test_p99_improvement_is_reported(mocker: Mock) -> None:
+    mock_direct_call_with_durations(mocker, [5, 0.01])
+    policy = make_trained_policy(typical_latency=0.05)
+    for _ in range(10):
+        policy.record_primary_latency(0.05)
+    policy.record_primary_latency(1)
+    model = Gpt4o(hedging_policy=policy)
+    assert policy.stats.p99_latency is None
+
+    await model.invoke("Hi")
+
+    stats = policy.stats
+    assert stats.p99_latency is not None
+    assert stats.p99_latency < 0.5
+    assert stats.p99_improvement is not None
+    assert stats.p99_improvement > 0
@@ -0,0 +1,183 @@
+from unittest.mock import Mock
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from forecasting_tools.ai_models.claude35sonnet import Claude35Sonnet
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.ai_models.resource_managers.prompt_cache_tracker import (
+    PromptCacheTracker,
+)
+from forecasting_tools.forecasting.forecast_bots.main_bot import MainBot
+from forecasting_tools.forecasting.forecast_bots.template_bot import (
+    TemplateBot,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    QuestionState,
+)
+
+MIN_CACHEABLE_PREFIX_TOKENS = 1024
+REALISTIC_RESEARCH = """
+Here is a rundown of the most relevant recent news for this question.
+
+1. Launch schedule (SpaceNews, two weeks ago): The company told reporters that the next integrated flight test is scheduled for the second half of next month, pending a license modification from the FAA. A spokesperson said the vehicle has completed its static fire campaign and that the booster and ship have been stacked at the launch site for a final round of checks. Previous flights slipped by three to six weeks from their first announced dates, usually because of ground systems work or regulatory paperwork rather than problems with the vehicle itself.
+
+2. Regulatory status (FAA statement, last week): The FAA said it has received the final mishap report from the previous flight and is reviewing the corrective actions. The agency noted that it may allow the next flight to proceed before formally closing the investigation if it determines that public safety is not affected, which is what happened before the last two flights. The environmental assessment for a higher launch cadence is still open for public comment and is not expected to be finished before the resolution date.
+
+3. Previous flight results (company webcast and independent analysis): On the last flight the ship reached its planned suborbital trajectory, relit one engine in space and performed a controlled splashdown, but the booster was lost during its landing burn. Independent analysts said the ship was within a few hundred meters per second of orbital velocity, and that a true orbital attempt would mostly require a change in the planned trajectory rather than new hardware. The company has said it wants to demonstrate a reliable in-space relight before committing to an orbital flight.
+
+4. Stated plans (conference remarks by the company president, this month): The company president said the goal for this year is to reach orbit and begin deploying satellites from the ship, and suggested that the flight after next could be the first orbital attempt if the next flight goes well. She cautioned that the schedule depends on both regulatory approvals and the outcome of the upcoming test, and that the company would rather add another suborbital flight than take unnecessary risk.
+
+5. Expert and market expectations: Prediction markets currently put the chance of an orbital flight before the resolution date at between 25% and 35%. Several industry analysts quoted by Ars Technica said they expect one more suborbital flight first, and that an orbital attempt before the resolution date would require both flights to be completed with unusually short turnarounds. Historically the company has averaged about ten weeks between flights of this vehicle, with the shortest gap being just under six weeks.
+
+6. Infrastructure (local news and permit filings): A second launch tower is under construction but is not expected to be operational until late in the year, so all flights before the resolution date would use the existing pad. Repairs to the pad after the previous flight were reported to be minor. Permit filings show road closures requested for the target window of the next flight, which has historically been a reliable indicator that a launch attempt is near.
+
+7. Other considerations: Weather at the launch site is usually favorable during this season, although upper level winds have caused short delays before. The ship for the flight after next is reported to be in final assembly, and the matching booster has started cryogenic testing, which suggests that hardware should not be the limiting factor for two more flights. A government shutdown or a major anomaly on the next flight would almost certainly push an orbital attempt past the resolution date.
+
+Summary: Based on current information the question would resolve No today, because no flight has reached orbit yet. The most likely path to Yes is a successful suborbital flight next month followed by an orbital attempt roughly six to ten weeks later, which would land close to the resolution date. Both the company's stated intentions and the historical cadence make this possible but far from certain, and most outside observers expect the first orbital flight to happen shortly after the resolution date rather than before it.
+"""
+
+
+def make_realistic_question() -> BinaryQuestion:
+    return BinaryQuestion(
+        question_text="Will a fully reusable super heavy-lift rocket reach orbit before July 1, 2025?",
+        id_of_post=1,
+        state=QuestionState.OPEN,
+        background_info=(
+            "Several companies are developing fully reusable super heavy-lift "
+            "launch vehicles, which are intended to cut the cost of reaching "
+            "orbit by recovering and reflying both stages. The most advanced "
+            "program has flown several integrated suborbital test flights from "
+            "its site in Texas, each reaching space and ending with the upper "
+            "stage splashing down in the ocean. The company has said it intends "
+            "to reach orbit and begin deploying satellites once it has shown "
+            "that the upper stage can reliably relight its engines in space. "
+            "Each flight requires a launch license from the FAA, and previous "
+            "mishaps have led to investigations that delayed the following "
+            "flight by several weeks to several months. Competing programs in "
+            "the United States and China have announced first flights for the "
+            "coming years but have not yet flown integrated vehicles."
+        ),
+        resolution_criteria=(
+            "This question resolves Yes if, before July 1, 2025, a fully "
+            "reusable super heavy-lift launch vehicle completes at least one "
+            "full orbit of the Earth, as reported by the operating company or "
+            "by credible media reports. It resolves No otherwise. A flight "
+            "that reaches orbital velocity but is deliberately placed on a "
+            "suborbital trajectory does not count."
+        ),
+        fine_print=(
+            "Recovery of either stage is not required for Yes, only that the "
+            "vehicle is designed to be fully reusable. If there is ambiguity "
+            "about whether an orbit was completed, the question will resolve "
+            "based on orbital tracking data published by US Space Force."
+        ),
+    )
+
+
+def make_completion(cached_tokens: int) -> ChatCompletion:
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": "Answer"},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 1000,
+                "completion_tokens": 100,
+                "total_tokens": 1100,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+    )
+
+
+async def test_openai_cached_tokens_are_discounted_and_tracked(
+    mocker: Mock,
+) -> None:
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    mocked_create = mocker.patch.object(
+        Gpt4o._OPENAI_ASYNC_CLIENT.chat.completions,
+        "create",
+        new_callable=mocker.AsyncMock,
+        side_effect=[make_completion(0), make_completion(800)],
+    )
+    model = Gpt4o()
+
+    with PromptCacheTracker() as tracker, MonetaryCostManager() as cost:
+        await model.invoke("Question 1", cacheable_prefix="Instructions")
+        cost_without_cache = cost.current_usage
+        await model.invoke("Question 2", cacheable_prefix="Instructions")
+        cost_with_cache = cost.current_usage - cost_without_cache
+
+    user_message = mocked_create.call_args.kwargs["messages"][-1]
+    assert user_message["content"].startswith("Instructions")
+    assert user_message["content"].endswith("Question 2")
+    cached_prompt_savings = model.calculate_cost_from_tokens(
+        prompt_tkns=800, completion_tkns=0
+    ) * (1 - model.CACHED_PROMPT_TOKEN_PRICE_MULTIPLIER)
+    assert round(cost_with_cache, 10) == round(
+        cost_without_cache - cached_prompt_savings, 10
+    )
+    assert tracker.stats.requests == 2
+    assert tracker.stats.cached_token_ratio == 0.4
+
+
+def test_anthropic_prefix_is_marked_cacheable_and_priced() -> None:
+    model = Claude35Sonnet(system_prompt="System")
+    messages = model._turn_model_input_into_messages(
+        "Question", cacheable_prefix="Instructions"
+    )
+    content = messages[-1].content
+    assert isinstance(content, list)
+    assert content[0]["cache_control"] == {"type": "ephemeral"}  # type: ignore
+    assert content[0]["text"] == "Instructions"  # type: ignore
+    assert content[1]["text"] == "Question"  # type: ignore
+
+    uncached_cost = model.calculate_cost_from_tokens(1000, 0)
+    assert round(
+        model.calculate_cost_from_tokens(1000, 0, cached_prompt_tkns=1000), 10
+    ) == round(uncached_cost * model.CACHE_READ_PRICE_MULTIPLIER, 10)
+    assert round(
+        model.calculate_cost_from_tokens(
+            1000, 0, cache_write_prompt_tkns=1000
+        ),
+        10,
+    ) == round(uncached_cost * model.CACHE_WRITE_PRICE_MULTIPLIER, 10)
+
+
+@pytest.mark.parametrize("bot_class", [TemplateBot, MainBot])
+async def test_bots_cache_question_and_research_across_predictions(
+    mocker: Mock, bot_class: type[TemplateBot]
+) -> None:
+    final_decision_llm = Mock()
+    final_decision_llm.invoke = mocker.AsyncMock(
+        return_value="Probability: 40%"
+    )
+    mocker.patch.object(bot_class, "FINAL_DECISION_LLM", final_decision_llm)
+    question = make_realistic_question()
+    bot = bot_class()
+
+    await bot._run_forecast_on_binary(question, REALISTIC_RESEARCH)
+    await bot._run_forecast_on_binary(question, REALISTIC_RESEARCH)
+
+    first_call, second_call = final_decision_llm.invoke.call_args_list
+    cacheable_prefix = first_call.kwargs["cacheable_prefix"]
+    assert second_call.kwargs["cacheable_prefix"] == cacheable_prefix
+    assert question.question_text in cacheable_prefix
+    assert REALISTIC_RESEARCH.strip() in cacheable_prefix
+    assert REALISTIC_RESEARCH.strip() not in first_call.args[0]
+    # Tokenizers never merge words across whitespace, so the word count is
+    # a lower bound on the token count. Providers do not cache shorter prefixes
+    assert len(cacheable_prefix.split()) >= MIN_CACHEABLE_PREFIX_TOKENS
@@ -0,0 +1,144 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.util.deadline import Deadline, DeadlineExceededError
+
+COST_PER_CALL = 0.01
+
+
+def mock_slow_direct_call(mocker: Mock) -> Mock:
+    async def slow_response(prompt: str) -> TextTokenCostResponse:
+        await asyncio.sleep(0.1)
+        return TextTokenCostResponse(
+            data=f"Answer to {prompt}",
+            prompt_tokens_used=10,
+            completion_tokens_used=10,
+            total_tokens_used=20,
+            model=Gpt4o.MODEL_NAME,
+            cost=COST_PER_CALL,
+        )
+
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    return mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(Gpt4o),
+        side_effect=slow_response,
+    )
+
+
+async def test_identical_concurrent_requests_share_one_call(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model = Gpt4o(temperature=0, coalesce_identical_requests=True)
+
+    with MonetaryCostManager(1) as cost_manager:
+        responses = await asyncio.gather(
+            *[model.invoke("Same prompt") for _ in range(5)]
+        )
+
+    assert responses == ["Answer to Same prompt"] * 5
+    assert mocked_call.call_count == 1
+    assert cost_manager.current_usage == pytest.approx(COST_PER_CALL)
+
+
+async def test_different_prompts_are_not_shared(mocker: Mock) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model = Gpt4o(temperature=0, coalesce_identical_requests=True)
+
+    responses = await asyncio.gather(
+        model.invoke("Prompt 1"), model.invoke("Prompt 2")
+    )
+
+    assert responses == ["Answer to Prompt 1", "Answer to Prompt 2"]
+    assert mocked_call.call_count == 2
+
+
+async def test_requests_are_not_shared_across_system_prompts(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model_1 = Gpt4o(coalesce_identical_requests=True, system_prompt="A")
+    model_2 = Gpt4o(coalesce_identical_requests=True, system_prompt="B")
+
+    await asyncio.gather(model_1.invoke("Prompt"), model_2.invoke("Prompt"))
+
+    assert mocked_call.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "temperature, coalesce", [(0, False), (0.7, True), (0.7, False)]
+)
+async def test_requests_are_not_shared_unless_enabled_and_deterministic(
+    mocker: Mock, temperature: float, coalesce: bool
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model = Gpt4o(
+        temperature=temperature, coalesce_identical_requests=coalesce
+    )
+
+    await asyncio.gather(*[model.invoke("Same prompt") for _ in range(3)])
+
+    assert mocked_call.call_count == 3
+
+
+async def test_sequential_identical_requests_are_not_cached(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model = Gpt4o(temperature=0, coalesce_identical_requests=True)
+
+    await model.invoke("Same prompt")
+    await model.invoke("Same prompt")
+
+    assert mocked_call.call_count == 2
+
+
+async def test_cancelled_first_caller_does_not_cancel_shared_request(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    model = Gpt4o(temperature=0, coalesce_identical_requests=True)
+
+    first_caller = asyncio.create_task(model.invoke("Same prompt"))
+    await asyncio.sleep(0.02)
+    second_caller = asyncio.create_task(model.invoke("Same prompt"))
+    await asyncio.sleep(0.02)
+    first_caller.cancel()
+
+    assert await second_caller == "Answer to Same prompt"
+    assert first_caller.cancelled()
+    assert mocked_call.call_count == 1
+
+
+async def test_first_callers_deadline_does_not_cut_short_shared_request(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_slow_direct_call(mocker)
+    mocker.patch.object(Deadline, "CANCELLATION_GRACE_SECONDS", 0)
+    model = Gpt4o(temperature=0, coalesce_identical_requests=True)
+
+    async def invoke_within_deadline() -> str:
+        with Deadline(seconds=0.03):
+            return await model.invoke("Same prompt")
+
+    results = await asyncio.gather(
+        invoke_within_deadline(),
+        model.invoke("Same prompt"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], DeadlineExceededError)
+    assert results[1] == "Answer to Same prompt"
+    assert mocked_call.call_count == 1
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Callable, Coroutine
+from unittest.mock import Mock
+
+import pytest
+
+from forecasting_tools.ai_models.resource_managers.request_cache import (
+    RequestCache,
+)
+
+
+def make_counting_fetch(
+    results: list[str], delay: float = 0
+) -> tuple[Mock, Callable[[], Coroutine]]:
+    call_counter = Mock()
+
+    async def fetch() -> str:
+        call_counter()
+        await asyncio.sleep(delay)
+        return results[call_counter.call_count - 1]
+
+    return call_counter, fetch
+
+
+async def test_second_lookup_is_a_hit() -> None:
+    cache: RequestCache[str] = RequestCache()
+    call_counter, fetch = make_counting_fetch(["first", "second"])
+
+    result_1 = await cache.get_or_fetch("key", 60, fetch, lambda _: 0.5)
+    result_2 = await cache.get_or_fetch("key", 60, fetch, lambda _: 0.5)
+
+    assert result_1 == result_2 == "first"
+    assert call_counter.call_count == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.saved_cost == pytest.approx(0.5)
+    assert cache.stats.hit_rate == pytest.approx(0.5)
+
+
+async def test_expired_entry_is_refetched(mocker: Mock) -> None:
+    cache: RequestCache[str] = RequestCache()
+    call_counter, fetch = make_counting_fetch(["first", "second"])
+    mocked_time = mocker.patch(
+        "forecasting_tools.ai_models.resource_managers.request_cache.time.time",
+        return_value=1000,
+    )
+
+    await cache.get_or_fetch("key", 60, fetch, lambda _: 0)
+    mocked_time.return_value = 1061
+    result = await cache.get_or_fetch("key", 60, fetch, lambda _: 0)
+
+    assert result == "second"
+    assert call_counter.call_count == 2
+
+
+async def test_concurrent_identical_requests_are_coalesced() -> None:
+    cache: RequestCache[str] = RequestCache()
+    call_counter, fetch = make_counting_fetch(["only"], delay=0.1)
+
+    results = await asyncio.gather(
+        *[cache.get_or_fetch("key", 60, fetch, lambda _: 1) for _ in range(5)]
+    )
+
+    assert results == ["only"] * 5
+    assert call_counter.call_count == 1
+    assert cache.stats.coalesced_requests == 4
+    assert cache.stats.saved_cost == pytest.approx(4)
+
+
+async def test_errors_are_shared_and_not_cached() -> None:
+    cache: RequestCache[str] = RequestCache()
+    call_counter = Mock()
+
+    async def failing_fetch() -> str:
+        call_counter()
+        await asyncio.sleep(0.05)
+        raise RuntimeError("Request failed")
+
+    results = await asyncio.gather(
+        *[
+            cache.get_or_fetch("key", 60, failing_fetch, lambda _: 0)
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert call_counter.call_count == 1
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("key", 60, failing_fetch, lambda _: 0)
+    assert call_counter.call_count == 2
+
+
+async def test_cancelled_caller_does_not_fail_waiting_callers() -> None:
+    cache: RequestCache[str] = RequestCache()
+    call_counter, fetch = make_counting_fetch(["only"], delay=0.1)
+
+    leader = asyncio.create_task(cache.get_or_fetch("key", 60, fetch, len))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(cache.get_or_fetch("key", 60, fetch, len))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == "only"
+    assert leader.cancelled()
+    assert call_counter.call_count == 1
+    assert await cache.get_or_fetch("key", 60, fetch, len) == "only"
+    assert cache.stats.hits == 1
+
+
+async def test_fetch_is_cancelled_once_every_caller_is_cancelled() -> None:
+    cache: RequestCache[str] = RequestCache()
+    fetch_was_cancelled = asyncio.Event()
+
+    async def slow_fetch() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            fetch_was_cancelled.set()
+            raise
+        return "never"
+
+    callers = [
+        asyncio.create_task(cache.get_or_fetch("key", 60, slow_fetch, len))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    for caller in callers:
+        caller.cancel()
+
+    await asyncio.wait_for(fetch_was_cancelled.wait(), timeout=1)
+    assert len(cache) == 0
+
+
+async def test_least_recently_used_entry_is_evicted() -> None:
+    cache: RequestCache[str] = RequestCache(max_entries=2)
+    call_counter, fetch = make_counting_fetch(["a", "b", "c", "a2"])
+
+    await cache.get_or_fetch("a", 60, fetch, lambda _: 0)
+    await cache.get_or_fetch("b", 60, fetch, lambda _: 0)
+    await cache.get_or_fetch("c", 60, fetch, lambda _: 0)
+    result = await cache.get_or_fetch("a", 60, fetch, lambda _: 0)
+
+    assert len(cache) == 2
+    assert result == "a2"
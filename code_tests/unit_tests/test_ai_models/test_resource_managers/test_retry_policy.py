@@ -0,0 +1,321 @@
+import asyncio
+import json
+import time
+from unittest.mock import Mock
+
+import aiohttp
+import httpx
+import openai
+import pytest
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from forecasting_tools.ai_models.ai_utils.response_types import (
+    TextTokenCostResponse,
+)
+from forecasting_tools.ai_models.basic_model_interfaces.retryable_model import (
+    RetryableModel,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.resource_managers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+from forecasting_tools.ai_models.resource_managers.retry_policy import (
+    Backoff,
+    ErrorClass,
+    ErrorClassifier,
+    RetryBudget,
+    RetryPolicy,
+)
+
+NO_WAIT = Backoff(min_wait=0, max_wait=0, multiplier=0)
+GPT4O_DIRECT_CALL_PATH = (
+    AiModelMockManager.get_direct_call_function_path_as_string(Gpt4o)
+)
+
+
+def make_policy_without_waits(**kwargs) -> RetryPolicy:
+    return RetryPolicy(
+        backoffs={
+            ErrorClass.RATE_LIMIT: NO_WAIT,
+            ErrorClass.SERVER: NO_WAIT,
+            ErrorClass.TIMEOUT: NO_WAIT,
+        },
+        **kwargs,
+    )
+
+
+def make_openai_error(
+    status_code: int, headers: dict | None = None
+) -> openai.APIStatusError:
+    response = httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com"),
+    )
+    return openai.APIStatusError("Mock error", response=response, body=None)
+
+
+def make_aiohttp_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        request_info=Mock(), history=(), status=status
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_class"),
+    [
+        (make_openai_error(429), ErrorClass.RATE_LIMIT),
+        (make_openai_error(500), ErrorClass.SERVER),
+        (make_openai_error(400), ErrorClass.CLIENT),
+        (make_openai_error(408), ErrorClass.TIMEOUT),
+        (make_aiohttp_error(503), ErrorClass.SERVER),
+        (make_aiohttp_error(401), ErrorClass.CLIENT),
+        (asyncio.TimeoutError(), ErrorClass.TIMEOUT),
+        (json.JSONDecodeError("Bad json", "{", 0), ErrorClass.PARSE),
+        (ValueError("Bad output"), ErrorClass.PARSE),
+        (HardLimitExceededError(), ErrorClass.CLIENT),
+        (CircuitOpenError(), ErrorClass.CLIENT),
+        (Exception("Unknown"), ErrorClass.SERVER),
+    ],
+)
+def test_errors_are_classified(
+    error: Exception, expected_class: ErrorClass
+) -> None:
+    assert ErrorClassifier.classify(error) == expected_class
+
+
+def test_wrapped_errors_are_classified_by_their_cause() -> None:
+    try:
+        try:
+            raise make_openai_error(429)
+        except Exception as e:
+            raise RuntimeError(f"Wrapped: {e}")
+    except RuntimeError as wrapped_error:
+        assert ErrorClassifier.classify(wrapped_error) == ErrorClass.RATE_LIMIT
+
+
+def test_retry_after_header_is_read() -> None:
+    error = make_openai_error(429, headers={"Retry-After": "7"})
+    assert ErrorClassifier.get_retry_after_seconds(error) == 7
+    error = make_openai_error(429, headers={"retry-after-ms": "1500"})
+    assert ErrorClassifier.get_retry_after_seconds(error) == 1.5
+    assert ErrorClassifier.get_retry_after_seconds(ValueError()) is None
+
+
+def test_retry_after_takes_priority_over_backoff() -> None:
+    policy = RetryPolicy(max_retry_after_seconds=10)
+    error = make_openai_error(429, headers={"retry-after": "3"})
+    assert policy.get_wait_seconds(error, ErrorClass.RATE_LIMIT, 1) == 3
+    error = make_openai_error(429, headers={"retry-after": "1000"})
+    assert policy.get_wait_seconds(error, ErrorClass.RATE_LIMIT, 1) == 10
+
+
+def test_backoff_stays_within_bounds() -> None:
+    backoff = Backoff(min_wait=1, max_wait=5, multiplier=2)
+    waits = [backoff.get_wait_seconds(attempt) for attempt in range(1, 10)]
+    assert all(1 <= wait <= 5 for wait in waits)
+
+
+def test_retry_budget_denies_retries_when_drained() -> None:
+    budget = RetryBudget(retry_ratio=0.5, initial_retries=1)
+    assert budget.try_spend_retry()
+    assert not budget.try_spend_retry()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend_retry()
+    assert budget.retries_spent == 2
+    assert budget.retries_denied == 1
+
+
+async def test_server_errors_are_retried() -> None:
+    policy = make_policy_without_waits()
+    calls = 0
+
+    async def fail_twice() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise make_openai_error(503)
+        return "success"
+
+    assert await policy.run("provider", 3, fail_twice) == "success"
+    assert calls == 3
+
+
+@pytest.mark.parametrize(
+    "error", [make_openai_error(400), ValueError("Bad output")]
+)
+async def test_client_and_parse_errors_are_not_retried(
+    error: Exception,
+) -> None:
+    policy = make_policy_without_waits()
+    calls = 0
+
+    async def fail() -> str:
+        nonlocal calls
+        calls += 1
+        raise error
+
+    with pytest.raises(type(error)):
+        await policy.run("provider", 3, fail)
+    assert calls == 1
+
+
+async def test_retries_stop_when_budget_is_empty() -> None:
+    policy = make_policy_without_waits(
+        retry_budget=RetryBudget(retry_ratio=0, initial_retries=1)
+    )
+    calls = 0
+
+    async def always_fail() -> str:
+        nonlocal calls
+        calls += 1
+        raise make_openai_error(500)
+
+    with pytest.raises(openai.APIStatusError):
+        await policy.run("provider", 5, always_fail)
+    assert calls == 2
+    with pytest.raises(openai.APIStatusError):
+        await policy.run("provider", 5, always_fail)
+    assert calls == 3
+
+
+def test_circuit_opens_when_failure_rate_spikes() -> None:
+    breaker = CircuitBreaker(
+        "provider", min_requests_in_window=4, cooldown_seconds=60
+    )
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.raise_error_if_request_not_allowed()
+
+
+def test_circuit_lets_one_trial_through_after_cooldown() -> None:
+    breaker = CircuitBreaker(
+        "provider", min_requests_in_window=1, cooldown_seconds=0.05
+    )
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    time.sleep(0.06)
+    breaker.raise_error_if_request_not_allowed()
+    assert breaker.state == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.raise_error_if_request_not_allowed()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.raise_error_if_request_not_allowed()
+
+
+def test_failed_trial_reopens_circuit() -> None:
+    breaker = CircuitBreaker(
+        "provider", min_requests_in_window=1, cooldown_seconds=0.05
+    )
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.raise_error_if_request_not_allowed()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_open_circuit_fails_fast_for_the_provider_only() -> None:
+    policy = make_policy_without_waits(
+        create_circuit_breaker=lambda name: CircuitBreaker(
+            name, min_requests_in_window=2, cooldown_seconds=60
+        )
+    )
+    calls = 0
+
+    async def always_fail() -> str:
+        nonlocal calls
+        calls += 1
+        raise make_openai_error(503)
+
+    async def succeed() -> str:
+        return "success"
+
+    with pytest.raises(openai.APIStatusError):
+        await policy.run("failing_provider", 5, always_fail)
+    assert calls == 2
+    with pytest.raises(CircuitOpenError):
+        await policy.run("failing_provider", 5, always_fail)
+    assert calls == 2
+    assert await policy.run("healthy_provider", 5, succeed) == "success"
+
+
+def mock_direct_call_with_errors_then_success(
+    mocker: Mock, errors: list[Exception], response_text: str
+) -> Mock:
+    remaining_errors = list(errors)
+
+    async def direct_call(prompt: str) -> TextTokenCostResponse:
+        if remaining_errors:
+            raise remaining_errors.pop(0)
+        return TextTokenCostResponse(
+            data=response_text,
+            prompt_tokens_used=10,
+            completion_tokens_used=10,
+            total_tokens_used=20,
+            model=Gpt4o.MODEL_NAME,
+            cost=0.001,
+        )
+
+    mocker.patch.object(
+        RetryableModel, "_retry_policy", make_policy_without_waits()
+    )
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    return mocker.patch(
+        GPT4O_DIRECT_CALL_PATH,
+        side_effect=direct_call,
+    )
+
+
+async def test_model_retries_server_errors_but_not_bad_requests(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_direct_call_with_errors_then_success(
+        mocker, [make_openai_error(500), make_openai_error(502)], "Hello"
+    )
+    assert await Gpt4o(allowed_tries=3).invoke("Hi") == "Hello"
+    assert mocked_call.call_count == 3
+
+    mocked_call = mock_direct_call_with_errors_then_success(
+        mocker, [make_openai_error(400)], "Hello"
+    )
+    with pytest.raises(RuntimeError, match="APIStatusError"):
+        await Gpt4o(allowed_tries=3).invoke("Hi")
+    assert mocked_call.call_count == 1
+
+
+async def test_transport_retries_do_not_compound_with_output_retries(
+    mocker: Mock,
+) -> None:
+    mocked_call = mock_direct_call_with_errors_then_success(
+        mocker, [make_openai_error(500)] * 9, "[1, 2]"
+    )
+    with pytest.raises(RuntimeError, match="APIStatusError"):
+        await Gpt4o(allowed_tries=3).invoke_and_return_verified_type(
+            "Hi", list[int], allowed_invoke_tries_for_failed_output=3
+        )
+    assert mocked_call.call_count == 3
+
+
+async def test_bad_output_is_retried_by_outputs_text(mocker: Mock) -> None:
+    mocked_call = mock_direct_call_with_errors_then_success(
+        mocker, [], "Not a list"
+    )
+    with pytest.raises(ValueError):
+        await Gpt4o(allowed_tries=3).invoke_and_return_verified_type(
+            "Hi", list[int], allowed_invoke_tries_for_failed_output=2
+        )
+    assert mocked_call.call_count == 2
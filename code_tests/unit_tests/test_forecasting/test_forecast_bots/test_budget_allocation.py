@@ -0,0 +1,53 @@
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+)
+
+
+async def test_contested_questions_get_more_research() -> None:
+    bot = StubForecastBot(
+        {"contested": [0.1, 0.9], "settled": [0.5]},
+        research_reports_per_question=3,
+        predictions_per_research_report=2,
+        total_time_limit_in_minutes=10,
+    )
+    reports = await bot.forecast_questions(
+        [make_binary_question("contested"), make_binary_question("settled")]
+    )
+
+    assert bot.research_runs_per_question == {"contested": 3, "settled": 1}
+    assert len(reports) == 2
+    assert bot.ensemble_stats.research_reports_run == 4
+    assert bot.ensemble_stats.research_reports_in_fixed_ensemble == 6
+
+
+async def test_budget_goes_to_most_uncertain_question() -> None:
+    bot = StubForecastBot(
+        {
+            "very contested": [0.1, 0.9],
+            "slightly contested": [0.4, 0.6],
+            "somewhat contested": [0.3, 0.7],
+        },
+        cost_per_research_report=0.1,
+        research_reports_per_question=3,
+        predictions_per_research_report=2,
+        total_budget_in_dollars=0.45,
+    )
+    reports = await bot.forecast_questions(
+        [
+            make_binary_question("slightly contested"),
+            make_binary_question("very contested"),
+            make_binary_question("somewhat contested"),
+        ]
+    )
+
+    assert bot.research_runs_per_question == {
+        "very contested": 2,
+        "slightly contested": 1,
+        "somewhat contested": 1,
+    }
+    assert [report.price_estimate for report in reports] == [
+        0.1,
+        0.2,
+        0.1,
+    ]
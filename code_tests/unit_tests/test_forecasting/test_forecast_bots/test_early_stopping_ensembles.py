@@ -0,0 +1,72 @@
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+)
+from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
+    MultipleChoiceReport,
+    PredictedOption,
+    PredictedOptionList,
+)
+
+
+async def test_agreeing_predictions_stop_early() -> None:
+    bot = StubForecastBot(
+        [0.3],
+        research_reports_per_question=5,
+        predictions_per_research_report=6,
+        early_stopping_tolerance=0.01,
+        ensemble_wave_size=2,
+    )
+    report = await bot.forecast_question(make_binary_question())
+
+    assert report.prediction == 0.3
+    assert bot.forecast_calls == 16
+    stats = bot.ensemble_stats
+    assert stats.research_reports_run == 4
+    assert stats.research_reports_in_fixed_ensemble == 5
+    assert stats.predictions_run == 16
+    assert stats.predictions_in_fixed_ensemble == 30
+    assert stats.calls_saved == 15
+    assert round(stats.fraction_of_predictions_saved, 2) == 0.47
+
+
+async def test_disagreeing_predictions_run_full_ensemble() -> None:
+    bot = StubForecastBot(
+        [0.1, 0.1, 0.9, 0.9, 0.9, 0.9],
+        research_reports_per_question=1,
+        predictions_per_research_report=6,
+        early_stopping_tolerance=0.01,
+        ensemble_wave_size=2,
+    )
+    await bot.forecast_question(make_binary_question())
+    assert bot.forecast_calls == 6
+
+
+async def test_fixed_ensemble_is_default() -> None:
+    bot = StubForecastBot(
+        [0.3],
+        research_reports_per_question=2,
+        predictions_per_research_report=3,
+    )
+    await bot.forecast_question(make_binary_question())
+    assert bot.forecast_calls == 6
+    assert bot.ensemble_stats.calls_saved == 0
+
+
+def test_multiple_choice_difference_is_largest_option_change() -> None:
+    prediction_1 = PredictedOptionList(
+        predicted_options=[
+            PredictedOption(option_name="A", probability=0.5),
+            PredictedOption(option_name="B", probability=0.5),
+        ]
+    )
+    prediction_2 = PredictedOptionList(
+        predicted_options=[
+            PredictedOption(option_name="B", probability=0.2),
+            PredictedOption(option_name="A", probability=0.8),
+        ]
+    )
+    difference = MultipleChoiceReport.calculate_prediction_difference(
+        prediction_1, prediction_2
+    )
+    assert round(difference, 6) == 0.3
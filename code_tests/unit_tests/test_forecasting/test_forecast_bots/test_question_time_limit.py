@@ -0,0 +1,22 @@
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+)
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+
+
+async def test_partial_forecast_is_returned_at_deadline() -> None:
+    bot = StubForecastBot(
+        predictions=[0.2, 0.2, 0.9],
+        prediction_delays=[0, 0, 30],
+        predictions_per_research_report=3,
+        question_time_limit_in_minutes=0.2 / 60,
+    )
+
+    report = await bot.forecast_question(make_binary_question())
+
+    assert isinstance(report, BinaryReport)
+    assert report.prediction == 0.2
+    assert report.minutes_taken < 0.1
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from forecasting_tools.forecasting.helpers.benchmark_snapshot_store import (
+    BenchmarkSnapshotStore,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    QuestionState,
+)
+
+
+def make_questions(count: int) -> list[BinaryQuestion]:
+    return [
+        BinaryQuestion(
+            question_text=f"Question {i}",
+            id_of_post=i,
+            state=QuestionState.OPEN,
+            num_forecasters=10 * i,
+            scheduled_resolution_time=datetime(2030, 1, 1) + timedelta(days=i),
+            community_prediction_at_access_time=i / count,
+            api_json={"large": "x" * 1000},
+        )
+        for i in range(count)
+    ]
+
+
+def test_sampling_is_reproducible_and_frozen(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "snapshots.db")
+    store = BenchmarkSnapshotStore(database_path)
+    store.create_snapshot(make_questions(50), version="v1")
+    first_sample = store.sample_questions(10, random_seed=42)
+
+    store.create_snapshot(make_questions(80), version="v2")
+    reopened_store = BenchmarkSnapshotStore(database_path)
+
+    assert reopened_store.get_versions() == ["v1", "v2"]
+    assert (
+        reopened_store.sample_questions(10, random_seed=42, version="v1")
+        == first_sample
+    )
+    assert all(isinstance(q, BinaryQuestion) for q in first_sample)
+    assert all(q.api_json == {} for q in first_sample)
+    assert all(
+        q.community_prediction_at_access_time is not None for q in first_sample
+    )
+    assert len(set(q.id_of_post for q in first_sample)) == 10
+
+
+def test_sampling_uses_filters(tmp_path: Path) -> None:
+    store = BenchmarkSnapshotStore(str(tmp_path / "snapshots.db"))
+    store.create_snapshot(make_questions(50))
+
+    questions = store.sample_questions(
+        5,
+        random_seed=1,
+        min_forecasters=250,
+        resolves_before=datetime(2030, 1, 1) + timedelta(days=30),
+    )
+
+    assert sorted(q.id_of_post for q in questions) == list(range(25, 30))
+    with pytest.raises(ValueError):
+        store.sample_questions(6, random_seed=1, min_forecasters=450)
@@ -0,0 +1,71 @@
+from unittest.mock import Mock
+
+import requests
+
+from forecasting_tools.forecasting.helpers.bulk_forecast_publisher import (
+    BulkForecastPublisher,
+)
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    QuestionState,
+)
+
+BAD_QUESTION_ID = 1003
+
+
+def make_report(question_id: int | None, prediction: float) -> BinaryReport:
+    return BinaryReport(
+        question=BinaryQuestion(
+            question_text="Will it happen?",
+            id_of_post=question_id or 0,
+            id_of_question=question_id,
+            state=QuestionState.OPEN,
+        ),
+        prediction=prediction,
+        explanation="# Test Report\nThis is a test report",
+    )
+
+
+def reject_bad_question(payloads_by_question_id: dict[int, dict]) -> None:
+    if BAD_QUESTION_ID in payloads_by_question_id:
+        raise requests.exceptions.HTTPError("Question is closed")
+
+
+async def test_predictions_are_grouped_and_failures_isolated(
+    mocker: Mock,
+) -> None:
+    post_predictions = mocker.patch.object(
+        MetaculusApi,
+        "post_question_predictions",
+        side_effect=reject_bad_question,
+    )
+    post_comment = mocker.patch.object(MetaculusApi, "post_question_comment")
+    reports = [make_report(1000 + i, 0.5) for i in range(7)]
+    reports.append(make_report(2000, 1.0))
+    reports.append(make_report(None, 0.5))
+
+    results = await BulkForecastPublisher(
+        forecasts_per_request=3
+    ).publish_reports(reports)
+
+    succeeded = [
+        result.id_of_question for result in results if result.succeeded
+    ]
+    assert succeeded == [1000, 1001, 1002, 1004, 1005, 1006]
+    failed = {
+        result.id_of_question: result.error
+        for result in results
+        if not result.succeeded
+    }
+    assert "Question is closed" in failed[BAD_QUESTION_ID]
+    assert "between" in failed[2000]
+    assert "Question ID is None" in failed[None]
+    request_sizes = sorted(
+        len(call.args[0]) for call in post_predictions.call_args_list
+    )
+    assert request_sizes == [1, 1, 1, 1, 3, 3]
+    assert post_comment.call_count == 6
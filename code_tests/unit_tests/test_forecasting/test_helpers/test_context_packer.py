@@ -0,0 +1,116 @@
+from forecasting_tools.ai_models.exa_searcher import (
+    ExaHighlightQuote,
+    ExaSource,
+)
+from forecasting_tools.forecasting.helpers.context_packer import ContextPacker
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def make_quote(text: str, score: float, url: str) -> ExaHighlightQuote:
+    return ExaHighlightQuote(
+        highlight_text=text,
+        score=score,
+        source=ExaSource(
+            original_query="query",
+            auto_prompt_string=None,
+            title="title",
+            url=url,
+            text=None,
+            author=None,
+            published_date=None,
+            score=score,
+            highlights=[text],
+            highlight_scores=[score],
+        ),
+    )
+
+
+def test_contained_highlight_is_collapsed_into_larger_one() -> None:
+    quotes = [
+        make_quote("Sentence one. Sentence two.", 0.5, "a.com"),
+        make_quote("Sentence two.", 0.9, "a.com"),
+    ]
+    collapsed = ContextPacker.collapse_overlapping_quotes(quotes)
+    assert len(collapsed) == 1
+    assert collapsed[0].highlight_text == "Sentence one. Sentence two."
+    assert collapsed[0].score == 0.9
+
+
+def test_overlapping_highlights_are_joined() -> None:
+    quotes = [
+        make_quote("Sentence one. Sentence two.", 0.5, "a.com"),
+        make_quote("Sentence two. Sentence three.", 0.4, "a.com"),
+    ]
+    collapsed = ContextPacker.collapse_overlapping_quotes(quotes)
+    assert len(collapsed) == 1
+    assert (
+        collapsed[0].highlight_text
+        == "Sentence one. Sentence two. Sentence three."
+    )
+
+
+def test_overlapping_highlights_from_different_sources_are_kept() -> None:
+    quotes = [
+        make_quote("Sentence one. Sentence two.", 0.5, "a.com"),
+        make_quote("Sentence two.", 0.4, "b.com"),
+    ]
+    assert len(ContextPacker.collapse_overlapping_quotes(quotes)) == 2
+
+
+def test_packing_respects_token_budget() -> None:
+    quotes = [
+        make_quote(
+            f"Fact number {i} about topic {i}.", 1 - i / 100, f"{i}.com"
+        )
+        for i in range(50)
+    ]
+    packer = ContextPacker(token_budget=50, count_tokens=count_words)
+    packed = packer.pack(quotes)
+    used_tokens = sum(packer.count_quote_tokens(quote) for quote in packed)
+    assert 0 < len(packed) < len(quotes)
+    assert used_tokens <= 50
+
+
+def test_packing_respects_max_quotes() -> None:
+    quotes = [
+        make_quote(f"Fact {i}.", 1 - i / 100, f"{i}.com") for i in range(20)
+    ]
+    packer = ContextPacker(
+        token_budget=10_000, count_tokens=count_words, max_quotes=15
+    )
+    assert len(packer.pack(quotes)) == 15
+
+
+def test_packing_prefers_diverse_sources() -> None:
+    quotes = [
+        make_quote("The launch was delayed by weather.", 1.0, "a.com"),
+        make_quote("Engineers reported a valve issue.", 0.95, "a.com"),
+        make_quote("Regulators approved the new license.", 0.9, "b.com"),
+    ]
+    packer = ContextPacker(
+        token_budget=10_000, count_tokens=count_words, max_quotes=2
+    )
+    packed = packer.pack(quotes)
+    assert [quote.source.url for quote in packed] == ["a.com", "b.com"]
+
+
+def test_packing_skips_near_identical_text() -> None:
+    quotes = [
+        make_quote("SpaceX launched Starship on April 20.", 1.0, "a.com"),
+        make_quote("SpaceX launched Starship on April 20!", 0.99, "b.com"),
+        make_quote("NASA selected a lunar lander.", 0.5, "c.com"),
+    ]
+    packer = ContextPacker(
+        token_budget=10_000, count_tokens=count_words, max_quotes=2
+    )
+    packed = packer.pack(quotes)
+    assert [quote.source.url for quote in packed] == ["a.com", "c.com"]
+
+
+def test_at_least_one_quote_is_returned_when_over_budget() -> None:
+    quotes = [make_quote("A very long quote " * 20, 1.0, "a.com")]
+    packer = ContextPacker(token_budget=5, count_tokens=count_words)
+    assert len(packer.pack(quotes)) == 1
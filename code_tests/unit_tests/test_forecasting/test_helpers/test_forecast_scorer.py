@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from forecasting_tools.forecasting.helpers.forecast_scorer import (
+    ForecastScorer,
+)
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
+    MultipleChoiceReport,
+    PredictedOption,
+    PredictedOptionList,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    MultipleChoiceQuestion,
+    QuestionState,
+)
+
+
+def make_binary_report(
+    prediction: float, community_prediction: float
+) -> BinaryReport:
+    return BinaryReport(
+        question=BinaryQuestion(
+            question_text="Will it happen?",
+            id_of_post=1,
+            state=QuestionState.OPEN,
+            community_prediction_at_access_time=community_prediction,
+        ),
+        prediction=prediction,
+        explanation="# Test Report\nThis is a test report",
+    )
+
+
+def test_binary_scores_match_the_report_properties() -> None:
+    random_generator = np.random.default_rng(0)
+    predictions = random_generator.uniform(0.01, 0.99, 50)
+    community_predictions = random_generator.uniform(0.01, 0.99, 50)
+    reports = [
+        make_binary_report(float(p), float(c))
+        for p, c in zip(predictions, community_predictions)
+    ]
+
+    expected_log_scores = ForecastScorer.binary_expected_log_scores(
+        *BinaryReport.get_prediction_arrays(reports)
+    )
+
+    assert expected_log_scores == pytest.approx(
+        [report.inversed_expected_log_score for report in reports]
+    )
+    assert BinaryReport.calculate_average_deviation_points(
+        reports
+    ) == pytest.approx(
+        np.mean([report.deviation_points for report in reports])
+    )
+    assert ForecastScorer.binary_brier_scores(
+        [0.8, 0.3], [True, False]
+    ) == pytest.approx([0.04, 0.09])
+
+
+def test_multiple_choice_and_numeric_scores() -> None:
+    question = MultipleChoiceQuestion(
+        question_text="Which?",
+        id_of_post=1,
+        options=["A", "B", "C"],
+        state=QuestionState.OPEN,
+    )
+    report = MultipleChoiceReport(
+        question=question,
+        prediction=PredictedOptionList(
+            predicted_options=[
+                PredictedOption(option_name="C", probability=0.2),
+                PredictedOption(option_name="A", probability=0.5),
+                PredictedOption(option_name="B", probability=0.3),
+            ]
+        ),
+        explanation="# Test Report\nThis is a test report",
+    )
+    probabilities = MultipleChoiceReport.get_probability_array([report])
+    community_probabilities = np.array([[0.5, 0.3, 0.2]])
+
+    assert probabilities.tolist() == [[0.5, 0.3, 0.2]]
+    assert ForecastScorer.multiple_choice_deviation_points(
+        probabilities, community_probabilities
+    ) == pytest.approx([0])
+    assert ForecastScorer.multiple_choice_brier_scores(
+        probabilities, [0]
+    ) == pytest.approx([0.25 + 0.09 + 0.04])
+
+    x_axis = np.linspace(0, 10, 11).reshape(1, -1)
+    certain_cdf = (x_axis >= 4).astype(float)
+    assert ForecastScorer.numeric_ranked_probability_scores(
+        x_axis, certain_cdf, [4]
+    ) == pytest.approx([0])
+    assert ForecastScorer.numeric_ranked_probability_scores(
+        x_axis, certain_cdf, [7]
+    ) == pytest.approx([3 / 11])
+
+
+def test_calibration_bins_and_bootstrap_interval() -> None:
+    bins = ForecastScorer.calibration_bins(
+        [0.05, 0.15, 0.95, 1.0], [0, 1, 1, 1], num_bins=10
+    )
+
+    assert [calibration_bin.count for calibration_bin in bins] == [
+        1,
+        1,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        2,
+    ]
+    assert bins[2].average_prediction is None
+    assert bins[9].average_prediction == pytest.approx(0.975)
+    assert bins[1].observed_frequency == 1
+
+    scores = np.random.default_rng(1).normal(1, 0.5, 5000)
+    summary = ForecastScorer.bootstrap_mean(
+        scores, num_resamples=1000, random_seed=2
+    )
+    assert summary.lower_bound < summary.mean < summary.upper_bound
+    assert summary.upper_bound - summary.lower_bound < 0.05
+    with pytest.raises(ValueError):
+        ForecastScorer.bootstrap_mean([])
@@ -0,0 +1,66 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+)
+from forecasting_tools.forecasting.helpers.benchmarker import Benchmarker
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+)
+
+
+def make_questions(count: int) -> list[BinaryQuestion]:
+    return [
+        make_binary_question(
+            f"Question {i}",
+            id_of_post=i,
+            id_of_question=i,
+            community_prediction_at_access_time=0.8,
+        )
+        for i in range(count)
+    ]
+
+
+async def test_bots_share_research_and_are_scored_in_pairs(
+    mocker: Mock, tmp_path: Path
+) -> None:
+    mocker.patch.object(
+        MetaculusApi, "get_benchmark_questions", return_value=make_questions(6)
+    )
+    baseline_bot = StubForecastBot([0.5], research_reports_per_question=2)
+    better_bot = StubForecastBot([0.8])
+    worse_bot = StubForecastBot([0.2])
+
+    result = await Benchmarker.benchmark_head_to_head(
+        [baseline_bot, better_bot, worse_bot],
+        6,
+        bot_names=["baseline", "better", "worse"],
+        file_path_to_save_reports=str(tmp_path),
+    )
+
+    assert baseline_bot.research_runs == 12
+    assert better_bot.research_runs == 0
+    assert worse_bot.research_runs == 0
+    assert result.research_reports_run == 12
+    assert set(better_bot.research_seen) <= set(baseline_bot.research_seen)
+    assert baseline_bot.research_store is None
+
+    assert result.questions_compared == 6
+    scores = {
+        comparison.bot_name: comparison for comparison in result.comparisons
+    }
+    assert scores["baseline"].score_difference_to_baseline is None
+    better_difference = scores["better"].score_difference_to_baseline
+    assert better_difference is not None
+    assert better_difference.mean < 0
+    assert better_difference.upper_bound < 0
+    assert scores["better"].fraction_of_questions_beating_baseline == 1
+    assert scores["worse"].fraction_of_questions_beating_baseline == 0
+    assert scores["worse"].average_expected_log_score == pytest.approx(
+        -(0.8 * -2.321928 + 0.2 * -0.321928), abs=1e-4
+    )
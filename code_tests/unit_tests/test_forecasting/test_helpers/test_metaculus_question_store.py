@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.helpers.metaculus_question_store import (
+    MetaculusQuestionStore,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+)
+
+TOURNAMENT_ID = 1
+
+
+def edit_time(minutes: int) -> str:
+    return (datetime(2024, 1, 1) + timedelta(minutes=minutes)).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def make_post(post_id: int, edited_at: str, status: str = "open") -> dict:
+    return {
+        "id": post_id,
+        "status": status,
+        "edited_at": edited_at,
+        "scheduled_resolve_time": "2100-01-01T00:00:00Z",
+        "scheduled_close_time": "2100-01-01T00:00:00Z",
+        "nr_forecasters": 10,
+        "forecasts_count": 20,
+        "question": {
+            "id": post_id + 1000,
+            "type": "binary",
+            "title": f"Question {post_id}",
+            "actual_resolve_time": None,
+        },
+    }
+
+
+class FakePostsEndpoint:
+    def __init__(self, posts: list[dict]) -> None:
+        self.posts = {post["id"]: post for post in posts}
+        self.requested_params: list[dict[str, Any]] = []
+
+    def get_posts_page_json(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.requested_params.append(params)
+        edited_after = params.get(MetaculusQuestionStore.EDITED_AFTER_PARAM)
+        matching_posts = sorted(
+            [
+                post
+                for post in self.posts.values()
+                if edited_after is None or post["edited_at"] > edited_after
+            ],
+            key=lambda post: post["edited_at"],
+        )
+        offset = params["offset"]
+        return {
+            "count": len(matching_posts),
+            "results": matching_posts[offset : offset + params["limit"]],
+        }
+
+
+async def test_sync_is_paginated_and_incremental(
+    tmp_path: Path, mocker: Mock
+) -> None:
+    endpoint = FakePostsEndpoint(
+        [make_post(i, edit_time(i)) for i in range(250)]
+    )
+    mocker.patch.object(
+        MetaculusApi,
+        "get_posts_page_json",
+        side_effect=endpoint.get_posts_page_json,
+    )
+    store = MetaculusQuestionStore(str(tmp_path / "questions.db"))
+
+    first_sync = await store.sync_tournament(TOURNAMENT_ID)
+    assert first_sync.pages_fetched == 3
+    assert first_sync.posts_saved == 250
+
+    endpoint.posts[5] = make_post(5, edit_time(1000), status="closed")
+    endpoint.posts[300] = make_post(300, edit_time(1001))
+    second_sync = await store.sync_tournament(TOURNAMENT_ID)
+    assert second_sync.pages_fetched == 1
+    assert second_sync.posts_saved == 2
+    assert endpoint.requested_params[-1][
+        MetaculusQuestionStore.EDITED_AFTER_PARAM
+    ] == edit_time(249)
+
+    open_questions = store.get_all_open_questions_from_tournament(
+        TOURNAMENT_ID
+    )
+    assert len(open_questions) == 250
+    assert 5 not in [question.id_of_post for question in open_questions]
+    assert all(question.api_json == {} for question in open_questions)
+
+
+async def test_questions_are_served_from_disk(
+    tmp_path: Path, mocker: Mock
+) -> None:
+    endpoint = FakePostsEndpoint([make_post(7, edit_time(0))])
+    mocker.patch.object(
+        MetaculusApi,
+        "get_posts_page_json",
+        side_effect=endpoint.get_posts_page_json,
+    )
+    database_path = str(tmp_path / "questions.db")
+    await MetaculusQuestionStore(database_path).sync_tournament(TOURNAMENT_ID)
+
+    reopened_store = MetaculusQuestionStore(database_path)
+    question = reopened_store.get_question_by_post_id(7)
+
+    assert isinstance(question, BinaryQuestion)
+    assert question.question_text == "Question 7"
+    assert question.api_json == {}
+    assert reopened_store.get_api_json(7) == endpoint.posts[7]
+    assert reopened_store.get_question_by_post_id(8) is None
+    assert len(endpoint.requested_params) == 1
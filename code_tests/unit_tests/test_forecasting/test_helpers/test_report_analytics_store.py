@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from forecasting_tools.forecasting.helpers.report_analytics_store import (
+    ReportAnalyticsStore,
+)
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    QuestionState,
+)
+
+
+def make_report(post_id: int, prediction: float) -> BinaryReport:
+    return BinaryReport(
+        question=BinaryQuestion(
+            question_text=f"Question {post_id}",
+            id_of_post=post_id,
+            id_of_question=post_id,
+            state=QuestionState.OPEN,
+            community_prediction_at_access_time=0.5,
+        ),
+        prediction=prediction,
+        explanation=f"# Report {post_id}\n" + "Long explanation " * 100,
+        price_estimate=0.1,
+    )
+
+
+def test_reports_are_queried_by_indexed_columns(tmp_path: Path) -> None:
+    database_path = str(tmp_path / "reports.db")
+    store = ReportAnalyticsStore(database_path)
+    store.add_reports([make_report(i, 0.5) for i in range(5)], bot_name="BotA")
+    store.add_reports(
+        [make_report(i, 0.9) for i in range(5)],
+        bot_name="BotB",
+        run_name="benchmark",
+    )
+
+    reopened_store = ReportAnalyticsStore(database_path)
+    bot_b_rows = reopened_store.query_reports(bot_name="BotB")
+    assert len(bot_b_rows) == 5
+    assert {row.run_name for row in bot_b_rows} == {"benchmark"}
+
+    well_scored_rows = reopened_store.query_reports(
+        max_score=make_report(0, 0.5).inversed_expected_log_score
+    )
+    assert {row.bot_name for row in well_scored_rows} == {"BotA"}
+
+    question_rows = reopened_store.query_reports(
+        id_of_post=3, question_type="binary"
+    )
+    assert [row.bot_name for row in question_rows] == ["BotB", "BotA"]
+    assert (
+        reopened_store.query_reports(
+            end_time=datetime.now() - timedelta(days=1)
+        )
+        == []
+    )
+    assert len(reopened_store.query_reports(limit=2)) == 2
+
+
+def test_full_reports_are_loaded_on_demand(tmp_path: Path) -> None:
+    store = ReportAnalyticsStore(str(tmp_path / "reports.db"))
+    report = make_report(7, 0.3)
+    store.add_reports([report], bot_name="BotA")
+
+    row = store.query_reports()[0]
+    full_report = store.get_full_report(row.report_id)
+
+    assert "explanation" not in row.model_dump()
+    assert row.readable_prediction == BinaryReport.make_readable_prediction(
+        0.3
+    )
+    assert isinstance(full_report, BinaryReport)
+    assert full_report.explanation == report.explanation
+    assert full_report.prediction == 0.3
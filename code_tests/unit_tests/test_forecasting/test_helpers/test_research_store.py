@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from code_tests.utilities_for_tests.stub_forecast_bot import (
+    StubForecastBot,
+    make_binary_question,
+    make_search_quote,
+)
+from forecasting_tools.forecasting.helpers.research_store import (
+    ResearchStore,
+    StoredResearch,
+    StoredSearchQuote,
+)
+
+
+async def test_fresh_research_is_shared_between_bots(tmp_path: Path) -> None:
+    store = ResearchStore(str(tmp_path / "research.db"))
+    first_bot = StubForecastBot(
+        research_reports_per_question=2,
+        research_store=store,
+        top_up_research="Recent news",
+    )
+    second_bot = StubForecastBot(
+        research_reports_per_question=2,
+        research_store=store,
+        top_up_research="Recent news",
+    )
+
+    await first_bot.forecast_question(make_binary_question())
+    report = await second_bot.forecast_question(make_binary_question())
+
+    assert first_bot.research_runs == 2
+    assert second_bot.research_runs == 0
+    assert "Research 1" in report.explanation
+    assert "Research 2" in report.explanation
+    assert store.stats.lookups == 4
+    assert store.stats.reuse_rate == 0.5
+    stored_quotes = {
+        quote.quote_text
+        for research in store.get_fresh_research(make_binary_question())
+        for quote in research.search_quotes
+    }
+    assert stored_quotes == {"Quote 1", "Quote 2"}
+
+
+async def test_stale_research_is_topped_up_or_rerun(tmp_path: Path) -> None:
+    store = ResearchStore(
+        str(tmp_path / "research.db"),
+        freshness_window=timedelta(days=1),
+        top_up_window=timedelta(days=7),
+    )
+    for days_old in [3, 30]:
+        store.save_research(
+            StoredResearch(
+                question_key=store.get_question_key(make_binary_question()),
+                research_report=f"Research from {days_old} days ago",
+                summary_report="Summary",
+                search_quotes=[
+                    StoredSearchQuote.from_highlight_quote(
+                        make_search_quote("Old quote")
+                    )
+                ],
+                researched_by="OtherBot",
+                created_at=datetime.now() - timedelta(days=days_old),
+            )
+        )
+    bot = StubForecastBot(
+        research_reports_per_question=2,
+        research_store=store,
+        top_up_research="Recent news",
+    )
+
+    await bot.forecast_question(make_binary_question())
+
+    assert bot.top_up_runs == 1
+    assert bot.research_runs == 1
+    fresh_research = {
+        research.research_report: research
+        for research in store.get_fresh_research(make_binary_question())
+    }
+    assert len(fresh_research) == 2
+    topped_up = next(
+        research
+        for report, research in fresh_research.items()
+        if report.startswith("Research from 3 days ago")
+    )
+    assert topped_up.research_report.endswith("Recent news")
+    assert [quote.quote_text for quote in topped_up.search_quotes] == [
+        "Old quote",
+        "Recent quote",
+    ]
+    assert store.stats.topped_up == 1
+    assert store.stats.researched_from_scratch == 1
@@ -0,0 +1,228 @@
+import logging
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from forecasting_tools.forecasting.sub_question_researchers.deduplicator import (
+    Deduplicator,
+)
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSION = 384
+
+
+def fake_embedding_for_topic(topic: int, noise_seed: int) -> list[float]:
+    topic_vector = np.random.default_rng(topic).normal(
+        size=EMBEDDING_DIMENSION
+    )
+    noise = np.random.default_rng(noise_seed + 10_000).normal(
+        size=EMBEDDING_DIMENSION
+    )
+    return list(topic_vector + 0.1 * noise)
+
+
+def make_items(num_topics: int, copies_per_topic: int) -> list[str]:
+    return [
+        f"topic {topic} phrasing {copy}"
+        for copy in range(copies_per_topic)
+        for topic in range(num_topics)
+    ]
+
+
+def fake_embeddings(texts: list[str]) -> list[list[float]]:
+    embeddings = []
+    for text in texts:
+        _, topic, _, copy = text.split(" ")
+        embeddings.append(
+            fake_embedding_for_topic(int(topic), int(topic) * 100 + int(copy))
+        )
+    return embeddings
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache() -> None:
+    Deduplicator._embedding_cache.clear()
+
+
+def mock_embedding_fetch(mocker: Mock) -> Mock:
+    return mocker.patch.object(
+        Deduplicator,
+        "_Deduplicator__get_embeddings_using_huggingface",
+        side_effect=fake_embeddings,
+    )
+
+
+async def test_semantic_dedup_keeps_first_item_of_each_cluster(
+    mocker: Mock,
+) -> None:
+    mock_embedding_fetch(mocker)
+    items = make_items(num_topics=5, copies_per_topic=3)
+
+    deduplicated = await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items, 0.85
+    )
+
+    assert deduplicated == items[:5]
+
+
+async def test_semantic_dedup_embeds_all_items_in_one_request(
+    mocker: Mock,
+) -> None:
+    mocked_fetch = mock_embedding_fetch(mocker)
+    items = make_items(num_topics=10, copies_per_topic=4)
+
+    await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items, 0.85
+    )
+
+    assert mocked_fetch.call_count == 1
+    assert len(mocked_fetch.call_args.args[0]) == len(items)
+
+
+async def test_embeddings_are_cached_across_calls(mocker: Mock) -> None:
+    mocked_fetch = mock_embedding_fetch(mocker)
+    items = make_items(num_topics=4, copies_per_topic=2)
+
+    await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items, 0.85
+    )
+    new_item = "topic 99 phrasing 0"
+    await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items + [new_item], 0.85
+    )
+
+    assert mocked_fetch.call_count == 2
+    assert mocked_fetch.call_args.args[0] == [new_item]
+
+
+async def test_least_recently_used_embeddings_are_evicted(
+    mocker: Mock,
+) -> None:
+    mocked_fetch = mock_embedding_fetch(mocker)
+    mocker.patch.object(Deduplicator, "MAX_CACHED_EMBEDDINGS", 4)
+    items = [f"topic {topic} phrasing 0" for topic in range(5)]
+
+    for pair in [[0, 1], [0, 2], [3, 4], [0, 1]]:
+        await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+            [items[i] for i in pair], 0.85
+        )
+
+    assert mocked_fetch.call_count == 4
+    assert mocked_fetch.call_args.args[0] == [items[1]]
+    assert len(Deduplicator._embedding_cache) == 4
+
+
+async def test_semantic_dedup_falls_back_to_openai(mocker: Mock) -> None:
+    mocker.patch.object(
+        Deduplicator,
+        "_Deduplicator__get_embeddings_using_huggingface",
+        side_effect=RuntimeError("Huggingface is down"),
+    )
+    mocked_openai_fetch = mocker.patch.object(
+        Deduplicator,
+        "_Deduplicator__get_embeddings_using_openai",
+        side_effect=fake_embeddings,
+    )
+    items = make_items(num_topics=3, copies_per_topic=2)
+
+    deduplicated = await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items, 0.85
+    )
+
+    assert deduplicated == items[:3]
+    assert mocked_openai_fetch.call_count == 1
+
+
+async def test_semantic_dedup_of_500_items_is_fast(mocker: Mock) -> None:
+    mocked_fetch = mock_embedding_fetch(mocker)
+    num_topics = 100
+    items = make_items(num_topics=num_topics, copies_per_topic=5)
+    assert len(items) == 500
+
+    start_time = time.perf_counter()
+    deduplicated = await Deduplicator._Deduplicator__deduplicate_list_using_semantic_similarity(  # type: ignore
+        items, 0.85
+    )
+    duration = time.perf_counter() - start_time
+    logger.info(f"Deduplicated 500 items in {duration:.3f} seconds")
+
+    assert len(deduplicated) == num_topics
+    assert mocked_fetch.call_count == 1
+    assert duration < 2
+
+
+def mock_llm_batch_dedup(mocker: Mock) -> Mock:
+    async def keep_first_item_per_topic(
+        items: list[str], prompt_context: str
+    ) -> list[str]:
+        kept_items: dict[str, str] = {}
+        for item in items:
+            topic = item.split(" ")[1]
+            kept_items.setdefault(topic, item)
+        return list(kept_items.values())
+
+    return mocker.patch.object(
+        Deduplicator,
+        "_Deduplicator__deduplicate_list_in_batch",
+        side_effect=keep_first_item_per_topic,
+    )
+
+
+async def run_dedup_with_only_llm_passes(
+    items: list[str], batch_size: int
+) -> list[str]:
+    return await Deduplicator.deduplicate_list_in_batches(
+        items,
+        prompt_context="test",
+        initial_semantic_threshold=1.1,
+        near_duplicate_threshold=1.0,
+        batch_size=batch_size,
+    )
+
+
+@pytest.mark.parametrize(
+    "num_topics, copies_per_topic, batch_size",
+    [(10, 3, 8), (5, 20, 8), (40, 5, 4), (3, 50, 2)],
+)
+async def test_tree_reduction_bounds_batch_size_and_removes_duplicates(
+    mocker: Mock, num_topics: int, copies_per_topic: int, batch_size: int
+) -> None:
+    mock_embedding_fetch(mocker)
+    mocked_llm = mock_llm_batch_dedup(mocker)
+    items = make_items(num_topics, copies_per_topic)
+
+    deduplicated = await run_dedup_with_only_llm_passes(items, batch_size)
+
+    assert deduplicated == items[:num_topics]
+    batch_sizes = [len(call.args[0]) for call in mocked_llm.call_args_list]
+    assert max(batch_sizes) <= batch_size
+
+
+async def test_tree_reduction_does_not_send_unique_items_to_llm(
+    mocker: Mock,
+) -> None:
+    mock_embedding_fetch(mocker)
+    mocked_llm = mock_llm_batch_dedup(mocker)
+    items = make_items(num_topics=30, copies_per_topic=1)
+
+    deduplicated = await run_dedup_with_only_llm_passes(items, batch_size=8)
+
+    assert deduplicated == items
+    assert mocked_llm.call_count == 0
+
+
+async def test_tree_reduction_only_compares_similar_items(
+    mocker: Mock,
+) -> None:
+    mock_embedding_fetch(mocker)
+    mocked_llm = mock_llm_batch_dedup(mocker)
+    items = make_items(num_topics=6, copies_per_topic=2)
+
+    await run_dedup_with_only_llm_passes(items, batch_size=8)
+
+    for call in mocked_llm.call_args_list:
+        topics_in_batch = {item.split(" ")[1] for item in call.args[0]}
+        assert len(topics_in_batch) == 1
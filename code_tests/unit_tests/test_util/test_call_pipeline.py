@@ -0,0 +1,60 @@
+from typing import Any
+
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.ai_models.model_archetypes.traditional_online_llm import (
+    TraditionalOnlineLlm,
+)
+from forecasting_tools.util.call_pipeline import CallHandler, CallPipeline
+
+
+class Owner:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+
+def make_middleware(name: str):
+    async def middleware(
+        owner: Owner, args: tuple, kwargs: dict, call_next: CallHandler
+    ) -> Any:
+        owner.events.append(f"enter {name}")
+        result = await call_next(owner, args, kwargs)
+        owner.events.append(f"exit {name}")
+        return f"{name}({result})"
+
+    return middleware
+
+
+async def final_call(owner: Owner, args: tuple, kwargs: dict) -> str:
+    owner.events.append(f"call {args} {kwargs}")
+    return "result"
+
+
+async def test_middleware_runs_outermost_first() -> None:
+    pipeline = CallPipeline(
+        [make_middleware("outer"), make_middleware("inner")], final_call
+    )
+    owner = Owner()
+
+    result = await pipeline.run(owner, (1,), {"key": "value"})
+
+    assert result == "outer(inner(result))"
+    assert owner.events == [
+        "enter outer",
+        "enter inner",
+        "call (1,) {'key': 'value'}",
+        "exit inner",
+        "exit outer",
+    ]
+    assert await CallPipeline([], final_call).run(Owner(), (), {}) == "result"
+
+
+def test_models_build_their_pipeline_once_per_class() -> None:
+    first_model = Gpt4o()
+    second_model = Gpt4o(allowed_tries=1)
+
+    assert first_model._call_pipeline is second_model._call_pipeline
+    assert (
+        Gpt4o._call_pipeline.middleware[0]
+        == TraditionalOnlineLlm._share_identical_in_flight_requests
+    )
+    assert len(Gpt4o._call_pipeline.middleware) == 7
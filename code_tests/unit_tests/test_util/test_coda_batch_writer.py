@@ -0,0 +1,71 @@
+import time
+from unittest.mock import Mock
+
+from forecasting_tools.util.coda_batch_writer import CodaBatchWriter
+from forecasting_tools.util.coda_utils import (
+    CodaCell,
+    CodaColumn,
+    CodaRow,
+    CodaTable,
+)
+
+TEXT_COLUMN = CodaColumn("Text", "c-text")
+TABLE = CodaTable("doc", "table", [TEXT_COLUMN], [])
+
+
+def make_row(size_in_kb: float) -> CodaRow:
+    return CodaRow([CodaCell(TEXT_COLUMN, "x" * int(size_in_kb * 1000))])
+
+
+def test_rows_are_packed_under_the_request_limit(mocker: Mock) -> None:
+    add_rows = mocker.patch.object(CodaTable, "add_rows_to_table")
+    writer = CodaBatchWriter(TABLE, flush_interval_seconds=60)
+
+    start_time = time.time()
+    for _ in range(10):
+        writer.add_row(make_row(20))
+    time_to_add_rows = time.time() - start_time
+    writer.flush(timeout_seconds=5)
+
+    assert time_to_add_rows < 0.5
+    rows_per_request = [len(call.args[0]) for call in add_rows.call_args_list]
+    assert rows_per_request == [4, 4, 2]
+    assert writer.stats.rows_written == 10
+    for call in add_rows.call_args_list:
+        assert (
+            TABLE.get_payload_size_in_kb(call.args[0])
+            <= TABLE.MAX_SIZE_OF_PAYLOAD_UPLOAD_IN_KB
+        )
+
+
+def test_rows_are_sent_after_the_flush_interval(mocker: Mock) -> None:
+    add_rows = mocker.patch.object(CodaTable, "add_rows_to_table")
+    writer = CodaBatchWriter(TABLE, flush_interval_seconds=0.05)
+
+    writer.add_row(make_row(1))
+    writer.add_row(make_row(1))
+    time.sleep(0.5)
+
+    assert [len(call.args[0]) for call in add_rows.call_args_list] == [2]
+
+
+def test_failed_requests_are_retried_then_dropped(mocker: Mock) -> None:
+    add_rows = mocker.patch.object(
+        CodaTable,
+        "add_rows_to_table",
+        side_effect=[RuntimeError("Rate limited"), None, RuntimeError("Down")]
+        + [RuntimeError("Down")] * 2,
+    )
+    writer = CodaBatchWriter(
+        TABLE, allowed_tries=3, min_retry_wait_seconds=0.01
+    )
+
+    writer.add_row(make_row(1))
+    writer.flush(timeout_seconds=5)
+    writer.add_row(make_row(1))
+    writer.flush(timeout_seconds=5)
+
+    assert add_rows.call_count == 5
+    assert writer.stats.rows_written == 1
+    assert writer.stats.rows_failed == 1
+    assert writer.stats.retries == 3
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from code_tests.unit_tests.test_ai_models.ai_mock_manager import (
+    AiModelMockManager,
+)
+from forecasting_tools.ai_models.gpt4o import Gpt4o
+from forecasting_tools.util import async_batching
+from forecasting_tools.util.deadline import Deadline, DeadlineExceededError
+
+
+def test_nested_deadlines_can_only_shorten() -> None:
+    assert Deadline.get_remaining_seconds() is None
+    with Deadline(10):
+        with Deadline(100):
+            remaining = Deadline.get_remaining_seconds()
+            assert remaining is not None and remaining <= 10
+        with Deadline(1):
+            remaining = Deadline.get_remaining_seconds()
+            assert remaining is not None and remaining <= 1
+        with Deadline(None):
+            assert Deadline.get_remaining_seconds() is not None
+    assert Deadline.get_remaining_seconds() is None
+
+
+def test_timeouts_are_limited_to_remaining_time() -> None:
+    assert Deadline.limit_timeout(30) == 30
+    with Deadline(5):
+        assert Deadline.limit_timeout(30) <= 5
+        assert Deadline.limit_timeout(1) == 1
+        assert Deadline.has_time_for(1)
+        assert not Deadline.has_time_for(60)
+    with Deadline(0):
+        assert Deadline.has_passed()
+        with pytest.raises(DeadlineExceededError):
+            Deadline.limit_timeout(30)
+
+
+async def wait_and_return(seconds: float) -> float:
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+async def test_slow_tasks_are_cancelled_at_deadline() -> None:
+    start_time = time.monotonic()
+    with Deadline(0.1):
+        results, _ = (
+            async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                [wait_and_return(0), wait_and_return(0.01), wait_and_return(5)]
+            )
+        )
+    assert results == [0, 0.01]
+    assert time.monotonic() - start_time < 3
+
+
+async def test_nested_batches_return_partial_results() -> None:
+    async def run_inner_batch() -> list[float]:
+        results, _ = (
+            async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                [wait_and_return(0), wait_and_return(5)]
+            )
+        )
+        return results
+
+    with Deadline(0.1):
+        results, _ = (
+            async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                [run_inner_batch(), run_inner_batch()]
+            )
+        )
+    assert results == [[0], [0]]
+
+
+async def test_model_call_is_cut_short_and_not_retried(mocker: Mock) -> None:
+    async def slow_response(*args, **kwargs) -> None:
+        await asyncio.sleep(5)
+
+    mocker.patch.object(Gpt4o, "input_to_tokens", return_value=10)
+    mocked_call = mocker.patch(
+        AiModelMockManager.get_direct_call_function_path_as_string(Gpt4o),
+        side_effect=slow_response,
+    )
+    start_time = time.monotonic()
+    with Deadline(0.1):
+        with pytest.raises(DeadlineExceededError):
+            await Gpt4o(allowed_tries=3).invoke("Hi")
+    assert time.monotonic() - start_time < 3
+    assert mocked_call.call_count == 1
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+from forecasting_tools.util.lazy_class_attribute import LazyClassAttribute
+
+HEAVY_MODULES = [
+    "openai",
+    "anthropic",
+    "langchain_anthropic",
+    "langchain_core",
+    "tiktoken",
+    "PIL",
+    "typeguard",
+    "langsmith",
+]
+
+
+class Parent:
+    FACTORY_CALLS: list[type] = []
+    VALUE = LazyClassAttribute(
+        lambda cls: cls.FACTORY_CALLS.append(cls) or object()
+    )
+
+
+class Child(Parent):
+    pass
+
+
+def test_value_is_built_once_on_first_access() -> None:
+    assert Parent.FACTORY_CALLS == []
+
+    value = Child().VALUE
+
+    assert value is Parent.VALUE
+    assert value is Child.VALUE
+    assert Parent.FACTORY_CALLS == [Parent]
+    assert not isinstance(Parent.__dict__["VALUE"], LazyClassAttribute)
+
+
+def test_package_import_does_not_load_heavy_dependencies() -> None:
+    code = (
+        "import sys, forecasting_tools;"
+        f"print([name for name in {HEAVY_MODULES} if name in sys.modules]);"
+        "print(forecasting_tools.BinaryReport.__name__)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    assert output == ["[]", "BinaryReport"]
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+from forecasting_tools.util.near_duplicate_index import NearDuplicateIndex
+
+BASE_TEXT = "**2010 Moldovan Constitutional Referendum**: A referendum held to decide on whether to amend the constitution to change the method of electing the president."
+NEAR_DUPLICATE_TEXT = "**2010 Moldovan constitutional referendum**: A referendum held to decide whether to amend the constitution to change the method of electing the president."
+DIFFERENT_TEXT = "**1994 Moldovan referendum**: A referendum on remaining an independent nation was held on 6 March 1994 and approved by 97.9% of voters."
+
+
+def test_near_duplicate_is_found() -> None:
+    index = NearDuplicateIndex()
+    index.add(BASE_TEXT)
+    index.add(DIFFERENT_TEXT)
+    assert index.query(NEAR_DUPLICATE_TEXT) == [0]
+
+
+def test_different_text_is_not_found() -> None:
+    index = NearDuplicateIndex()
+    index.add(BASE_TEXT)
+    assert index.query(DIFFERENT_TEXT) == []
+
+
+def test_exact_duplicate_has_similarity_of_one() -> None:
+    index = NearDuplicateIndex()
+    assert index.estimate_similarity(BASE_TEXT, BASE_TEXT) == pytest.approx(1)
+    assert index.estimate_similarity(BASE_TEXT, DIFFERENT_TEXT) < 0.5
+
+
+def test_add_if_not_near_duplicate_builds_incrementally() -> None:
+    index = NearDuplicateIndex()
+    assert index.add_if_not_near_duplicate(BASE_TEXT)
+    assert not index.add_if_not_near_duplicate(NEAR_DUPLICATE_TEXT)
+    assert index.add_if_not_near_duplicate(DIFFERENT_TEXT)
+    assert not index.add_if_not_near_duplicate(BASE_TEXT)
+    assert len(index) == 2
+    assert index.texts == [BASE_TEXT, DIFFERENT_TEXT]
+
+
+def test_deduplicate_keeps_first_occurrence() -> None:
+    texts = [BASE_TEXT, DIFFERENT_TEXT, NEAR_DUPLICATE_TEXT, DIFFERENT_TEXT]
+    assert NearDuplicateIndex.deduplicate(texts) == [BASE_TEXT, DIFFERENT_TEXT]
+
+
+def test_invalid_configuration_raises_error() -> None:
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(num_permutations=100, num_bands=32)
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(similarity_threshold=0)
+
+
+def test_deduplicating_1000_items_is_fast() -> None:
+    unique_texts = [
+        f"Event number {i} happened in the year {1900 + i} in city {i * 7}"
+        for i in range(500)
+    ]
+    texts = unique_texts + [text.upper() for text in unique_texts]
+
+    start_time = time.perf_counter()
+    deduplicated = NearDuplicateIndex.deduplicate(texts)
+    duration = time.perf_counter() - start_time
+
+    assert deduplicated == unique_texts
+    assert duration < 5
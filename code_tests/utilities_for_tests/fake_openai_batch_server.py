@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openai import AsyncOpenAI
+
+
+def echo_last_message(body: dict) -> tuple[int, dict]:
+    content = body["messages"][-1]["content"]
+    return 200, {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body["model"],
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {
+                    "role": "assistant",
+                    "content": f"Echo: {content}",
+                },
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 1000,
+            "completion_tokens": 100,
+            "total_tokens": 1100,
+        },
+    }
+
+
+class FakeOpenAiBatchServer:
+    """
+    Local stand-in for the OpenAI files and batches endpoints. Batches
+    finish after polls_until_complete polls and each request in them is
+    answered with respond(request_body) -> (status_code, response_body).
+    Like OpenAI, it rejects input files that mix models.
+
+    async with FakeOpenAiBatchServer() as server:
+        OpenAiBatcher(client=server.client)
+    """
+
+    def __init__(
+        self,
+        respond: Callable[[dict], tuple[int, dict]] = echo_last_message,
+        polls_until_complete: int = 1,
+    ) -> None:
+        self.respond = respond
+        self.polls_until_complete = polls_until_complete
+        self.files: dict[str, str] = {}
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.requests_per_batch: list[int] = []
+        app = web.Application()
+        app.router.add_post("/v1/files", self.__upload_file)
+        app.router.add_get("/v1/files/{file_id}/content", self.__get_content)
+        app.router.add_post("/v1/batches", self.__create_batch)
+        app.router.add_get("/v1/batches/{batch_id}", self.__retrieve_batch)
+        self.__server = TestServer(app)
+
+    async def __aenter__(self) -> FakeOpenAiBatchServer:
+        await self.__server.start_server()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.__server.close()
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        return AsyncOpenAI(
+            base_url=str(self.__server.make_url("/v1")),
+            api_key="fake_key",
+            max_retries=0,
+        )
+
+    async def __upload_file(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        uploaded_file: Any = form["file"]
+        file_id = f"file-{len(self.files)}"
+        self.files[file_id] = uploaded_file.file.read().decode()
+        return web.json_response(self.__file_object(file_id, "batch"))
+
+    async def __get_content(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.files[request.match_info["file_id"]])
+
+    async def __create_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        input_lines = self.files[body["input_file_id"]].splitlines()
+        models = {json.loads(line)["body"]["model"] for line in input_lines}
+        if len(models) > 1:
+            return web.json_response(
+                {
+                    "error": {
+                        "message": f"Batch input file mixes models: {sorted(models)}",
+                        "type": "invalid_request_error",
+                    }
+                },
+                status=400,
+            )
+        batch_id = f"batch-{len(self.batches)}"
+        self.batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": body["endpoint"],
+            "input_file_id": body["input_file_id"],
+            "completion_window": body["completion_window"],
+            "created_at": int(time.time()),
+            "status": "in_progress",
+            "polls": 0,
+        }
+        self.requests_per_batch.append(len(input_lines))
+        return web.json_response(self.__batch_object(batch_id))
+
+    async def __retrieve_batch(self, request: web.Request) -> web.Response:
+        batch_id = request.match_info["batch_id"]
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        if (
+            batch["status"] == "in_progress"
+            and batch["polls"] >= self.polls_until_complete
+        ):
+            self.__complete_batch(batch)
+        return web.json_response(self.__batch_object(batch_id))
+
+    def __complete_batch(self, batch: dict[str, Any]) -> None:
+        output_lines = []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            batch_request = json.loads(line)
+            status_code, response_body = self.respond(batch_request["body"])
+            output_lines.append(
+                json.dumps(
+                    {
+                        "id": f"response-{batch_request['custom_id']}",
+                        "custom_id": batch_request["custom_id"],
+                        "response": {
+                            "status_code": status_code,
+                            "body": response_body,
+                        },
+                        "error": None,
+                    }
+                )
+            )
+        output_file_id = f"file-{len(self.files)}"
+        self.files[output_file_id] = "\n".join(output_lines)
+        batch["output_file_id"] = output_file_id
+        batch["status"] = "completed"
+
+    def __batch_object(self, batch_id: str) -> dict[str, Any]:
+        batch = dict(self.batches[batch_id])
+        batch.pop("polls")
+        return batch
+
+    def __file_object(self, file_id: str, purpose: str) -> dict[str, Any]:
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(self.files[file_id]),
+            "created_at": int(time.time()),
+            "filename": "batch.jsonl",
+            "purpose": purpose,
+            "status": "processed",
+        }
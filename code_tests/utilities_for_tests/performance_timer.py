@@ -0,0 +1,89 @@
+import json
+import os
+import time
+from typing import Any, Callable, Coroutine
+
+import pytest
+
+BASELINE_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "performance_benchmarks",
+    "performance_baselines.json",
+)
+UPDATE_BASELINES_ENV_VARIABLE = "UPDATE_PERFORMANCE_BASELINES"
+REGRESSION_THRESHOLD_ENV_VARIABLE = "PERFORMANCE_REGRESSION_THRESHOLD"
+DEFAULT_REGRESSION_THRESHOLD = 3.0
+
+
+class PerformanceTimer:
+    """
+    Times small operations and compares them to the baselines stored in
+    performance_baselines.json. A benchmark fails if it is more than the
+    regression threshold (3x by default, as machines differ) slower than
+    its baseline. Set UPDATE_PERFORMANCE_BASELINES=TRUE to rewrite the
+    baselines from the current run instead. Benchmarks without a baseline
+    are skipped.
+    """
+
+    @classmethod
+    def measure_seconds_per_call(
+        cls, function: Callable[[], Any], calls: int, repeats: int = 5
+    ) -> float:
+        """Best of several repeats, to reduce noise from the machine"""
+        function()
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            for _ in range(calls):
+                function()
+            timings.append((time.perf_counter() - start_time) / calls)
+        return min(timings)
+
+    @classmethod
+    async def measure_async_seconds_per_call(
+        cls,
+        coroutine_function: Callable[[], Coroutine[Any, Any, Any]],
+        calls: int,
+        repeats: int = 5,
+    ) -> float:
+        await coroutine_function()
+        timings = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            for _ in range(calls):
+                await coroutine_function()
+            timings.append((time.perf_counter() - start_time) / calls)
+        return min(timings)
+
+    @classmethod
+    def assert_within_baseline(
+        cls, benchmark_name: str, seconds_per_call: float
+    ) -> None:
+        baselines = cls.__load_baselines()
+        if os.environ.get(UPDATE_BASELINES_ENV_VARIABLE, "").upper() == "TRUE":
+            baselines[benchmark_name] = seconds_per_call
+            with open(BASELINE_FILE_PATH, "w") as file:
+                json.dump(dict(sorted(baselines.items())), file, indent=4)
+                file.write("\n")
+            return
+        if benchmark_name not in baselines:
+            pytest.skip(
+                f"No baseline for {benchmark_name}. Run with {UPDATE_BASELINES_ENV_VARIABLE}=TRUE to record one"
+            )
+        threshold = float(
+            os.environ.get(
+                REGRESSION_THRESHOLD_ENV_VARIABLE, DEFAULT_REGRESSION_THRESHOLD
+            )
+        )
+        baseline = baselines[benchmark_name]
+        assert seconds_per_call <= baseline * threshold, (
+            f"{benchmark_name} took {seconds_per_call * 1e6:.1f}us per call, "
+            f"more than {threshold}x its baseline of {baseline * 1e6:.1f}us"
+        )
+
+    @classmethod
+    def __load_baselines(cls) -> dict[str, float]:
+        if not os.path.exists(BASELINE_FILE_PATH):
+            return {}
+        with open(BASELINE_FILE_PATH) as file:
+            return json.load(file)
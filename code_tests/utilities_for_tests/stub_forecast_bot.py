@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime
+
+from forecasting_tools.ai_models.exa_searcher import (
+    ExaHighlightQuote,
+    ExaSource,
+    SearchQuoteRecorder,
+)
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.forecasting.forecast_bots.forecast_bot import (
+    ForecastBot,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ReasonedPrediction,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    MetaculusQuestion,
+    QuestionState,
+)
+
+
+class StubForecastBot(ForecastBot):
+    """
+    ForecastBot that makes no LLM calls, for testing the forecasting
+    pipeline around research and predictions.
+
+    Research run n returns "Research n" and records the quote "Quote n".
+    The nth prediction on a question is predictions[n % len(predictions)]
+    (or the list for that question's text if predictions is a dict), made
+    after waiting prediction_delays[n % len(prediction_delays)] seconds.
+    Each prediction's reasoning is the research it was given.
+    """
+
+    def __init__(
+        self,
+        predictions: list[float] | dict[str, list[float]] | None = None,
+        prediction_delays: list[float] | None = None,
+        cost_per_research_report: float = 0,
+        top_up_research: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.predictions = predictions if predictions is not None else [0.5]
+        self.prediction_delays = prediction_delays or [0]
+        self.cost_per_research_report = cost_per_research_report
+        self.top_up_research = top_up_research
+        self.research_runs = 0
+        self.research_runs_per_question: dict[str, int] = {}
+        self.top_up_runs = 0
+        self.forecast_calls = 0
+        self.research_seen: list[str] = []
+        self.__forecast_calls_per_question: dict[str, int] = {}
+
+    async def run_research(self, question: MetaculusQuestion) -> str:
+        text = question.question_text
+        self.research_runs += 1
+        self.research_runs_per_question[text] = (
+            self.research_runs_per_question.get(text, 0) + 1
+        )
+        MonetaryCostManager.increase_current_usage_in_parent_managers(
+            self.cost_per_research_report
+        )
+        SearchQuoteRecorder.record_quotes_in_active_recorders(
+            [make_search_quote(f"Quote {self.research_runs}")]
+        )
+        return f"Research {self.research_runs}"
+
+    async def run_research_top_up(
+        self, question: MetaculusQuestion, since: datetime
+    ) -> str | None:
+        if self.top_up_research is None:
+            return None
+        self.top_up_runs += 1
+        SearchQuoteRecorder.record_quotes_in_active_recorders(
+            [make_search_quote("Recent quote")]
+        )
+        return self.top_up_research
+
+    async def _run_forecast_on_binary(
+        self, question: BinaryQuestion, research: str
+    ) -> ReasonedPrediction[float]:
+        text = question.question_text
+        calls = self.__forecast_calls_per_question.get(text, 0)
+        self.__forecast_calls_per_question[text] = calls + 1
+        self.forecast_calls += 1
+        self.research_seen.append(research)
+        predictions = (
+            self.predictions[text]
+            if isinstance(self.predictions, dict)
+            else self.predictions
+        )
+        delay = self.prediction_delays[calls % len(self.prediction_delays)]
+        await asyncio.sleep(delay)
+        return ReasonedPrediction(
+            prediction_value=predictions[calls % len(predictions)],
+            reasoning=research,
+        )
+
+    async def _run_forecast_on_multiple_choice(self, question, research):
+        raise NotImplementedError()
+
+    async def _run_forecast_on_numeric(self, question, research):
+        raise NotImplementedError()
+
+
+def make_binary_question(
+    question_text: str = "Will it happen?", id_of_post: int = 1, **kwargs
+) -> BinaryQuestion:
+    return BinaryQuestion(
+        question_text=question_text,
+        id_of_post=id_of_post,
+        state=QuestionState.OPEN,
+        **kwargs,
+    )
+
+
+def make_search_quote(text: str) -> ExaHighlightQuote:
+    source = ExaSource(
+        original_query="query",
+        auto_prompt_string=None,
+        title="Title",
+        url="https://example.com",
+        text=None,
+        author=None,
+        published_date=None,
+        score=None,
+        highlights=[text],
+        highlight_scores=[1],
+    )
+    return ExaHighlightQuote(highlight_text=text, score=1, source=source)
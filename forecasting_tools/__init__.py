@@ -1,88 +1,150 @@
-from forecasting_tools.ai_models.ai_utils.ai_misc import (
-    clean_indents as clean_indents,
-)
-from forecasting_tools.ai_models.claude35sonnet import (
-    Claude35Sonnet as Claude35Sonnet,
-)
-from forecasting_tools.ai_models.exa_searcher import ExaSearcher as ExaSearcher
-from forecasting_tools.ai_models.gpt4o import Gpt4o as Gpt4o
-from forecasting_tools.ai_models.gpt4ovision import Gpt4oVision as Gpt4oVision
-from forecasting_tools.ai_models.metaculus4o import (
-    Gpt4oMetaculusProxy as Gpt4oMetaculusProxy,
-)
-from forecasting_tools.ai_models.perplexity import Perplexity as Perplexity
-from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
-    MonetaryCostManager as MonetaryCostManager,
-)
-from forecasting_tools.forecasting.forecast_bots.main_bot import (
-    MainBot as MainBot,
-)
-from forecasting_tools.forecasting.forecast_bots.template_bot import (
-    TemplateBot as TemplateBot,
-)
-from forecasting_tools.forecasting.helpers.benchmarker import (
-    Benchmarker as Benchmarker,
-)
-from forecasting_tools.forecasting.helpers.metaculus_api import (
-    MetaculusApi as MetaculusApi,
-)
-from forecasting_tools.forecasting.helpers.smart_searcher import (
-    SmartSearcher as SmartSearcher,
-)
-from forecasting_tools.forecasting.questions_and_reports.binary_report import (
-    BinaryReport as BinaryReport,
-)
-from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
-    ForecastReport as ForecastReport,
-)
-from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
-    ReasonedPrediction as ReasonedPrediction,
-)
-from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
-    MultipleChoiceReport as MultipleChoiceReport,
-)
-from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
-    PredictedOption as PredictedOption,
-)
-from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
-    PredictedOptionList as PredictedOptionList,
-)
-from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
-    NumericDistribution as NumericDistribution,
-)
-from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
-    NumericReport as NumericReport,
-)
-from forecasting_tools.forecasting.questions_and_reports.questions import (
-    BinaryQuestion as BinaryQuestion,
-)
-from forecasting_tools.forecasting.questions_and_reports.questions import (
-    MetaculusQuestion as MetaculusQuestion,
-)
-from forecasting_tools.forecasting.questions_and_reports.questions import (
-    MultipleChoiceQuestion as MultipleChoiceQuestion,
-)
-from forecasting_tools.forecasting.questions_and_reports.questions import (
-    NumericQuestion as NumericQuestion,
-)
-from forecasting_tools.forecasting.questions_and_reports.questions import (
-    QuestionState as QuestionState,
-)
-from forecasting_tools.forecasting.sub_question_researchers.base_rate_researcher import (
-    BaseRateResearcher as BaseRateResearcher,
-)
-from forecasting_tools.forecasting.sub_question_researchers.estimator import (
-    Estimator as Estimator,
-)
-from forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher import (
-    KeyFactorsResearcher as KeyFactorsResearcher,
-)
-from forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher import (
-    ScoredKeyFactor as ScoredKeyFactor,
-)
-from forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher import (
-    FactCheckedItem as FactCheckedItem,
-)
-from forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher import (
-    NicheListResearcher as NicheListResearcher,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from forecasting_tools.ai_models.ai_utils.ai_misc import (
+        clean_indents as clean_indents,
+    )
+    from forecasting_tools.ai_models.claude35sonnet import (
+        Claude35Sonnet as Claude35Sonnet,
+    )
+    from forecasting_tools.ai_models.exa_searcher import (
+        ExaSearcher as ExaSearcher,
+    )
+    from forecasting_tools.ai_models.gpt4o import Gpt4o as Gpt4o
+    from forecasting_tools.ai_models.gpt4ovision import (
+        Gpt4oVision as Gpt4oVision,
+    )
+    from forecasting_tools.ai_models.metaculus4o import (
+        Gpt4oMetaculusProxy as Gpt4oMetaculusProxy,
+    )
+    from forecasting_tools.ai_models.perplexity import Perplexity as Perplexity
+    from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+        MonetaryCostManager as MonetaryCostManager,
+    )
+    from forecasting_tools.forecasting.forecast_bots.main_bot import (
+        MainBot as MainBot,
+    )
+    from forecasting_tools.forecasting.forecast_bots.template_bot import (
+        TemplateBot as TemplateBot,
+    )
+    from forecasting_tools.forecasting.helpers.benchmarker import (
+        Benchmarker as Benchmarker,
+    )
+    from forecasting_tools.forecasting.helpers.metaculus_api import (
+        MetaculusApi as MetaculusApi,
+    )
+    from forecasting_tools.forecasting.helpers.smart_searcher import (
+        SmartSearcher as SmartSearcher,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+        BinaryReport as BinaryReport,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+        ForecastReport as ForecastReport,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+        ReasonedPrediction as ReasonedPrediction,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
+        MultipleChoiceReport as MultipleChoiceReport,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
+        PredictedOption as PredictedOption,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.multiple_choice_report import (
+        PredictedOptionList as PredictedOptionList,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
+        NumericDistribution as NumericDistribution,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.numeric_report import (
+        NumericReport as NumericReport,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.questions import (
+        BinaryQuestion as BinaryQuestion,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.questions import (
+        MetaculusQuestion as MetaculusQuestion,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.questions import (
+        MultipleChoiceQuestion as MultipleChoiceQuestion,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.questions import (
+        NumericQuestion as NumericQuestion,
+    )
+    from forecasting_tools.forecasting.questions_and_reports.questions import (
+        QuestionState as QuestionState,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.base_rate_researcher import (
+        BaseRateResearcher as BaseRateResearcher,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.estimator import (
+        Estimator as Estimator,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher import (
+        KeyFactorsResearcher as KeyFactorsResearcher,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher import (
+        ScoredKeyFactor as ScoredKeyFactor,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher import (
+        FactCheckedItem as FactCheckedItem,
+    )
+    from forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher import (
+        NicheListResearcher as NicheListResearcher,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "clean_indents": "forecasting_tools.ai_models.ai_utils.ai_misc",
+    "Claude35Sonnet": "forecasting_tools.ai_models.claude35sonnet",
+    "ExaSearcher": "forecasting_tools.ai_models.exa_searcher",
+    "Gpt4o": "forecasting_tools.ai_models.gpt4o",
+    "Gpt4oVision": "forecasting_tools.ai_models.gpt4ovision",
+    "Gpt4oMetaculusProxy": "forecasting_tools.ai_models.metaculus4o",
+    "Perplexity": "forecasting_tools.ai_models.perplexity",
+    "MonetaryCostManager": "forecasting_tools.ai_models.resource_managers.monetary_cost_manager",
+    "MainBot": "forecasting_tools.forecasting.forecast_bots.main_bot",
+    "TemplateBot": "forecasting_tools.forecasting.forecast_bots.template_bot",
+    "Benchmarker": "forecasting_tools.forecasting.helpers.benchmarker",
+    "MetaculusApi": "forecasting_tools.forecasting.helpers.metaculus_api",
+    "SmartSearcher": "forecasting_tools.forecasting.helpers.smart_searcher",
+    "BinaryReport": "forecasting_tools.forecasting.questions_and_reports.binary_report",
+    "ForecastReport": "forecasting_tools.forecasting.questions_and_reports.forecast_report",
+    "ReasonedPrediction": "forecasting_tools.forecasting.questions_and_reports.forecast_report",
+    "MultipleChoiceReport": "forecasting_tools.forecasting.questions_and_reports.multiple_choice_report",
+    "PredictedOption": "forecasting_tools.forecasting.questions_and_reports.multiple_choice_report",
+    "PredictedOptionList": "forecasting_tools.forecasting.questions_and_reports.multiple_choice_report",
+    "NumericDistribution": "forecasting_tools.forecasting.questions_and_reports.numeric_report",
+    "NumericReport": "forecasting_tools.forecasting.questions_and_reports.numeric_report",
+    "BinaryQuestion": "forecasting_tools.forecasting.questions_and_reports.questions",
+    "MetaculusQuestion": "forecasting_tools.forecasting.questions_and_reports.questions",
+    "MultipleChoiceQuestion": "forecasting_tools.forecasting.questions_and_reports.questions",
+    "NumericQuestion": "forecasting_tools.forecasting.questions_and_reports.questions",
+    "QuestionState": "forecasting_tools.forecasting.questions_and_reports.questions",
+    "BaseRateResearcher": "forecasting_tools.forecasting.sub_question_researchers.base_rate_researcher",
+    "Estimator": "forecasting_tools.forecasting.sub_question_researchers.estimator",
+    "KeyFactorsResearcher": "forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher",
+    "ScoredKeyFactor": "forecasting_tools.forecasting.sub_question_researchers.key_factors_researcher",
+    "FactCheckedItem": "forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher",
+    "NicheListResearcher": "forecasting_tools.forecasting.sub_question_researchers.niche_list_researcher",
+}
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Public names are imported on first use, so importing the package does
+    not load LLM SDKs and other heavy dependencies until they are needed
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -17,7 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 async def try_function_till_tries_run_out(
-    tries: int, function: Callable, *args, **kwargs
+    tries: int,
+    function: Callable,
+    *args,
+    should_retry: Callable[[Exception], bool] | None = None,
+    **kwargs,
 ) -> Any:
     tries_left = tries
     while tries_left > 0:
@@ -26,7 +30,9 @@ async def try_function_till_tries_run_out(
             return response
         except Exception as e:
             tries_left -= 1
-            if tries_left == 0:
+            if tries_left == 0 or (
+                should_retry is not None and not should_retry(e)
+            ):
                 raise e
             logger.warning(
                 f"Retrying function {function.__name__} due to error: {e}"
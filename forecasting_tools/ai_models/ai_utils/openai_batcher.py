@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from contextvars import ContextVar, Token
+from typing import Any
+
+from openai import AsyncOpenAI
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequestError(Exception):
+    """Raised for a request that failed or got no result in a batch job"""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class BatchStats(BaseModel):
+    batches_submitted: int = 0
+    requests_submitted: int = 0
+    requests_succeeded: int = 0
+    requests_failed: int = 0
+    discounted_cost: float = 0
+    full_price_cost: float = 0
+
+    @property
+    def cost_saved(self) -> float:
+        return self.full_price_cost - self.discounted_cost
+
+
+class OpenAiBatcher:
+    """
+    While active, OpenAI chat completions that support it are collected into
+    batch jobs (JSONL upload, submit, poll, download) instead of being sent
+    one by one. Batch jobs are billed at a discount but can take hours, so
+    this is meant for non-urgent runs like benchmarks and backfills.
+
+    Requests are batched per model, since a batch job takes one model.
+    A model's requests are submitted once max_batch_size are waiting or
+    seconds_to_collect_requests have passed since the first one came in.
+
+    with OpenAiBatcher():
+        await Gpt4o().invoke(prompt)
+    """
+
+    BATCH_DISCOUNT_MULTIPLIER = 0.5
+    FINISHED_STATUSES = ("completed", "failed", "expired", "cancelled")
+    _active_batcher: ContextVar[OpenAiBatcher | None] = ContextVar(
+        "_active_batcher", default=None
+    )
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        max_batch_size: int = 1000,
+        seconds_to_collect_requests: float = 5,
+        poll_interval_seconds: float = 30,
+        completion_window: str = "24h",
+        timeout_seconds: float = 24 * 60 * 60,
+    ) -> None:
+        assert max_batch_size > 0, "Batches must hold at least one request"
+        self.client = client or AsyncOpenAI(
+            api_key=(
+                os.getenv("OPENAI_API_KEY")
+                if os.getenv("OPENAI_API_KEY") is not None
+                else "fake_key_so_it_doesn't_error_on_initialization"
+            ),
+            max_retries=0,
+        )
+        self.max_batch_size = max_batch_size
+        self.seconds_to_collect_requests = seconds_to_collect_requests
+        self.poll_interval_seconds = poll_interval_seconds
+        self.completion_window = completion_window
+        self.timeout_seconds = timeout_seconds
+        self.stats = BatchStats()
+        self.__token: Token[OpenAiBatcher | None] | None = None
+        self.__waiting_requests_per_model: dict[
+            str,
+            dict[str, tuple[dict[str, Any], asyncio.Future[ChatCompletion]]],
+        ] = {}
+        self.__submit_timers_per_model: dict[str, asyncio.Task[None]] = {}
+        self.__running_batches: set[asyncio.Task[None]] = set()
+
+    def __enter__(self) -> OpenAiBatcher:
+        self.__token = self._active_batcher.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        assert self.__token is not None
+        self._active_batcher.reset(self.__token)
+        self.__token = None
+
+    @classmethod
+    def get_active_batcher(cls) -> OpenAiBatcher | None:
+        return cls._active_batcher.get()
+
+    async def create_chat_completion(
+        self, **request_body: Any
+    ) -> ChatCompletion:
+        future: asyncio.Future[ChatCompletion] = (
+            asyncio.get_running_loop().create_future()
+        )
+        custom_id = f"request-{uuid.uuid4().hex}"
+        model = request_body["model"]
+        waiting_requests = self.__waiting_requests_per_model.setdefault(
+            model, {}
+        )
+        waiting_requests[custom_id] = (request_body, future)
+        if len(waiting_requests) >= self.max_batch_size:
+            self.__submit_waiting_requests(model)
+        elif model not in self.__submit_timers_per_model:
+            self.__submit_timers_per_model[model] = asyncio.create_task(
+                self.__submit_after_collecting_requests(model)
+            )
+        return await future
+
+    def apply_discount(self, full_price_cost: float) -> float:
+        discounted_cost = full_price_cost * self.BATCH_DISCOUNT_MULTIPLIER
+        self.stats.full_price_cost += full_price_cost
+        self.stats.discounted_cost += discounted_cost
+        return discounted_cost
+
+    async def __submit_after_collecting_requests(self, model: str) -> None:
+        await asyncio.sleep(self.seconds_to_collect_requests)
+        self.__submit_timers_per_model.pop(model, None)
+        self.__submit_waiting_requests(model)
+
+    def __submit_waiting_requests(self, model: str) -> None:
+        submit_timer = self.__submit_timers_per_model.pop(model, None)
+        if submit_timer is not None:
+            submit_timer.cancel()
+        requests = self.__waiting_requests_per_model.pop(model, {})
+        if len(requests) == 0:
+            return
+        task = asyncio.create_task(self.__run_batch(requests))
+        self.__running_batches.add(task)
+        task.add_done_callback(self.__running_batches.discard)
+
+    async def __run_batch(
+        self,
+        requests: dict[
+            str, tuple[dict[str, Any], asyncio.Future[ChatCompletion]]
+        ],
+    ) -> None:
+        futures = {
+            custom_id: future for custom_id, (_, future) in requests.items()
+        }
+        try:
+            batch_id = await self.__upload_and_create_batch(requests)
+            batch = await self.__wait_for_batch_to_finish(batch_id)
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id is not None:
+                    await self.__resolve_futures_from_file(file_id, futures)
+            self.__fail_unresolved_futures(
+                futures,
+                BatchRequestError(
+                    f"Batch {batch_id} finished with status {batch.status} without a result for the request"
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Batch of {len(requests)} requests failed: {e}")
+            self.__fail_unresolved_futures(futures, e)
+
+    async def __upload_and_create_batch(
+        self,
+        requests: dict[
+            str, tuple[dict[str, Any], asyncio.Future[ChatCompletion]]
+        ],
+    ) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            )
+            for custom_id, (body, _) in requests.items()
+        ]
+        batch_file = await self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,  # type: ignore
+        )
+        self.stats.batches_submitted += 1
+        self.stats.requests_submitted += len(requests)
+        logger.info(
+            f"Submitted batch {batch.id} with {len(requests)} requests"
+        )
+        return batch.id
+
+    async def __wait_for_batch_to_finish(self, batch_id: str) -> Batch:
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in self.FINISHED_STATUSES:
+                logger.info(f"Batch {batch_id} finished as {batch.status}")
+                return batch
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    async def __resolve_futures_from_file(
+        self,
+        file_id: str,
+        futures: dict[str, asyncio.Future[ChatCompletion]],
+    ) -> None:
+        content = await self.client.files.content(file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            future = futures.get(result.get("custom_id"))
+            if future is None or future.done():
+                continue
+            response = result.get("response") or {}
+            status_code = response.get("status_code")
+            if status_code == 200 and result.get("error") is None:
+                future.set_result(
+                    ChatCompletion.model_validate(response["body"])
+                )
+                self.stats.requests_succeeded += 1
+            else:
+                error = result.get("error") or response.get("body", {}).get(
+                    "error"
+                )
+                future.set_exception(
+                    BatchRequestError(
+                        f"Batch request failed: {error}", status_code
+                    )
+                )
+                self.stats.requests_failed += 1
+
+    def __fail_unresolved_futures(
+        self,
+        futures: dict[str, asyncio.Future[ChatCompletion]],
+        error: Exception,
+    ) -> None:
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(error)
+                self.stats.requests_failed += 1
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Coroutine, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from forecasting_tools.ai_models.basic_model_interfaces.request_limited_model import (
+    RequestLimitedModel,
+)
+from forecasting_tools.ai_models.basic_model_interfaces.retryable_model import (
+    RetryableModel,
+)
+from forecasting_tools.ai_models.resource_managers.circuit_breaker import (
+    CircuitState,
+)
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+from forecasting_tools.util.deadline import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BackendHealth(BaseModel):
+    name: str
+    is_configured: bool
+    requests: int
+    failures: int
+    error_rate: float
+    average_latency: float | None
+    circuit_is_open: bool
+    has_quota: bool
+
+    @property
+    def expected_seconds_to_success(self) -> float:
+        if self.average_latency is None:
+            return float("inf") if self.error_rate > 0 else 0
+        return self.average_latency / max(1 - self.error_rate, 0.05)
+
+
+class RoutedBackend(Generic[T]):
+    """
+    A backend in a BackendRouter pool. is_configured is checked on every
+    call (e.g. whether an API key is set). Circuit breaker state and
+    request quota are read from the backend if it is a RetryableModel or
+    RequestLimitedModel. The error rate only counts outcomes from the last
+    error_window_seconds so a backend that failed gets tried again later.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        backend: T,
+        is_configured: Callable[[], bool] = lambda: True,
+        error_window_seconds: float = 300,
+        latency_smoothing: float = 0.3,
+    ) -> None:
+        assert 0 < latency_smoothing <= 1, "Smoothing must be in (0, 1]"
+        self.name = name
+        self.backend = backend
+        self.is_configured = is_configured
+        self.error_window_seconds = error_window_seconds
+        self.latency_smoothing = latency_smoothing
+        self.__requests = 0
+        self.__failures = 0
+        self.__average_latency: float | None = None
+        self.__recent_outcomes: deque[tuple[float, bool]] = deque()
+
+    @property
+    def health(self) -> BackendHealth:
+        window_start = time.monotonic() - self.error_window_seconds
+        while (
+            self.__recent_outcomes
+            and self.__recent_outcomes[0][0] < window_start
+        ):
+            self.__recent_outcomes.popleft()
+        recent_failures = sum(
+            1 for _, succeeded in self.__recent_outcomes if not succeeded
+        )
+        return BackendHealth(
+            name=self.name,
+            is_configured=self.is_configured(),
+            requests=self.__requests,
+            failures=self.__failures,
+            error_rate=(
+                recent_failures / len(self.__recent_outcomes)
+                if self.__recent_outcomes
+                else 0
+            ),
+            average_latency=self.__average_latency,
+            circuit_is_open=self.__circuit_is_open(),
+            has_quota=self.__has_quota(),
+        )
+
+    def record_success(self, latency: float) -> None:
+        self.__requests += 1
+        self.__recent_outcomes.append((time.monotonic(), True))
+        if self.__average_latency is None:
+            self.__average_latency = latency
+        else:
+            self.__average_latency = (
+                self.latency_smoothing * latency
+                + (1 - self.latency_smoothing) * self.__average_latency
+            )
+
+    def record_failure(self) -> None:
+        self.__requests += 1
+        self.__failures += 1
+        self.__recent_outcomes.append((time.monotonic(), False))
+
+    def __circuit_is_open(self) -> bool:
+        if not isinstance(self.backend, RetryableModel):
+            return False
+        return self.backend.circuit_breaker.state == CircuitState.OPEN
+
+    def __has_quota(self) -> bool:
+        if not isinstance(self.backend, RequestLimitedModel):
+            return True
+        limiter = self.backend._request_limiter
+        return limiter.estimate_available_resources() >= 1
+
+
+class BackendRouter(Generic[T]):
+    """
+    Routes each call to the healthiest of a pool of interchangeable
+    backends and fails over to the next one if the call fails. Backends
+    with an open circuit or no request quota go last, the rest are ordered
+    by expected time to a successful response (smoothed latency divided by
+    the recent success rate). Backends with no recent outcomes are tried
+    first (in the order given) so every backend gets a latency measurement,
+    and backends that recently failed without ever succeeding go last.
+    """
+
+    def __init__(self, backends: list[RoutedBackend[T]]) -> None:
+        assert len(backends) > 0, "Router needs at least one backend"
+        names = [backend.name for backend in backends]
+        assert len(names) == len(set(names)), "Backend names must be unique"
+        self.backends = backends
+
+    @property
+    def health_report(self) -> list[BackendHealth]:
+        return [backend.health for backend in self.backends]
+
+    @property
+    def has_configured_backend(self) -> bool:
+        return any(backend.is_configured() for backend in self.backends)
+
+    def rank_backends(self) -> list[RoutedBackend[T]]:
+        configured_backends = [
+            (backend, backend.health)
+            for backend in self.backends
+            if backend.is_configured()
+        ]
+        ranked = sorted(
+            configured_backends,
+            key=lambda backend_and_health: (
+                backend_and_health[1].circuit_is_open,
+                not backend_and_health[1].has_quota,
+                backend_and_health[1].expected_seconds_to_success,
+            ),
+        )
+        return [backend for backend, _ in ranked]
+
+    async def run(
+        self, call_backend: Callable[[T], Coroutine[Any, Any, R]]
+    ) -> R:
+        ranked_backends = self.rank_backends()
+        if not ranked_backends:
+            raise RuntimeError(
+                f"None of the backends {[backend.name for backend in self.backends]} are configured"
+            )
+        last_error: Exception | None = None
+        for routed_backend in ranked_backends:
+            start_time = time.monotonic()
+            try:
+                result = await call_backend(routed_backend.backend)
+            except (HardLimitExceededError, DeadlineExceededError):
+                raise
+            except Exception as e:
+                routed_backend.record_failure()
+                last_error = e
+                logger.warning(
+                    f"Backend {routed_backend.name} failed so failing over to the next backend. Error: {e.__class__.__name__}: {e}"
+                )
+                continue
+            routed_backend.record_success(time.monotonic() - start_time)
+            return result
+        assert last_error is not None
+        raise last_error
+
+    async def invoke(self, *args, **kwargs) -> Any:
+        return await self.run(
+            lambda backend: backend.invoke(*args, **kwargs)  # type: ignore
+        )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC
+from collections import deque
+from typing import Any, Callable, Coroutine, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
+    MonetaryCostManager,
+)
+from forecasting_tools.util.call_pipeline import CallHandler
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgingStats(BaseModel):
+    requests: int = 0
+    hedges_issued: int = 0
+    hedge_wins: int = 0
+    hedges_skipped_for_budget: int = 0
+    p99_latency: float | None = None
+    p99_latency_without_hedging: float | None = None
+
+    @property
+    def hedge_rate(self) -> float:
+        if self.requests == 0:
+            return 0
+        return self.hedges_issued / self.requests
+
+    @property
+    def p99_improvement(self) -> float | None:
+        if (
+            self.p99_latency is None
+            or self.p99_latency_without_hedging is None
+        ):
+            return None
+        return self.p99_latency_without_hedging - self.p99_latency
+
+
+class HedgingPolicy:
+    """
+    Learns the latency distribution of a model from recent calls. Once a
+    request has run longer than the chosen percentile, a duplicate request
+    is issued, the first to succeed is used, and the other is cancelled.
+
+    The latency without hedging is estimated from primary requests that
+    finished. Slow primaries that lost to a hedge are not in it, so the
+    reported p99 improvement is a conservative estimate.
+
+    Hedge spend is tracked in its own MonetaryCostManager so it can be
+    capped separately. Like elsewhere, only the cost of requests that
+    finish is tracked, so a cancelled request does not add to the spend.
+    Policies can be shared between model instances so they learn together.
+    """
+
+    def __init__(
+        self,
+        latency_percentile: float = 95,
+        min_latency_samples: int = 20,
+        max_hedge_spend: float = 1,
+        min_hedge_delay: float = 1,
+        history_size: int = 200,
+    ) -> None:
+        assert 0 < latency_percentile < 100, "Percentile must be in (0, 100)"
+        assert min_latency_samples >= 1, "Need at least one latency sample"
+        assert min_hedge_delay >= 0, "Min hedge delay cannot be negative"
+        self.latency_percentile = latency_percentile
+        self.min_latency_samples = min_latency_samples
+        self.min_hedge_delay = min_hedge_delay
+        self.hedge_cost_manager = MonetaryCostManager(max_hedge_spend)
+        self.__requests = 0
+        self.__hedges_issued = 0
+        self.__hedge_wins = 0
+        self.__hedges_skipped_for_budget = 0
+        self.__primary_latencies: deque[float] = deque(maxlen=history_size)
+        self.__observed_latencies: deque[float] = deque(maxlen=history_size)
+        self.__attempt_costs: deque[float] = deque(maxlen=history_size)
+
+    @property
+    def stats(self) -> HedgingStats:
+        return HedgingStats(
+            requests=self.__requests,
+            hedges_issued=self.__hedges_issued,
+            hedge_wins=self.__hedge_wins,
+            hedges_skipped_for_budget=self.__hedges_skipped_for_budget,
+            p99_latency=self.__percentile(self.__observed_latencies, 99),
+            p99_latency_without_hedging=self.__percentile(
+                self.__primary_latencies, 99
+            ),
+        )
+
+    def get_hedge_delay(self) -> float | None:
+        if len(self.__primary_latencies) < self.min_latency_samples:
+            return None
+        delay = self.__percentile(
+            self.__primary_latencies, self.latency_percentile
+        )
+        assert delay is not None
+        return max(delay, self.min_hedge_delay)
+
+    def record_primary_latency(self, latency: float) -> None:
+        self.__primary_latencies.append(latency)
+
+    async def run_hedged(
+        self, create_coroutine: Callable[[], Coroutine[Any, Any, T]]
+    ) -> T:
+        self.__requests += 1
+        start_time = time.monotonic()
+        hedge_delay = self.get_hedge_delay()
+        primary = asyncio.create_task(
+            self.__run_and_track_cost(create_coroutine, is_hedge=False)
+        )
+        tasks = [primary]
+        try:
+            if hedge_delay is not None:
+                await asyncio.wait([primary], timeout=hedge_delay)
+            hedge_is_needed = hedge_delay is not None and not primary.done()
+            if hedge_is_needed and self.__hedge_is_affordable():
+                logger.info(
+                    f"Request still running after {hedge_delay:.1f}s so issuing a hedged request"
+                )
+                self.__hedges_issued += 1
+                tasks.append(
+                    asyncio.create_task(
+                        self.__run_and_track_cost(
+                            create_coroutine, is_hedge=True
+                        )
+                    )
+                )
+            winner = await self.__wait_for_first_success(tasks)
+        finally:
+            unfinished_tasks = [task for task in tasks if not task.done()]
+            for task in unfinished_tasks:
+                task.cancel()
+            await asyncio.gather(*unfinished_tasks, return_exceptions=True)
+
+        latency = time.monotonic() - start_time
+        self.__observed_latencies.append(latency)
+        if winner.exception() is not None:
+            return winner.result()
+        if winner is primary:
+            self.record_primary_latency(latency)
+        else:
+            self.__hedge_wins += 1
+        return winner.result()
+
+    async def __wait_for_first_success(
+        self, tasks: list[asyncio.Task[T]]
+    ) -> asyncio.Task[T]:
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    return task
+            if not pending:
+                return tasks[0]
+
+    async def __run_and_track_cost(
+        self,
+        create_coroutine: Callable[[], Coroutine[Any, Any, T]],
+        is_hedge: bool,
+    ) -> T:
+        if is_hedge:
+            with self.hedge_cost_manager, MonetaryCostManager() as attempt:
+                result = await create_coroutine()
+        else:
+            with MonetaryCostManager() as attempt:
+                result = await create_coroutine()
+        self.__attempt_costs.append(attempt.current_usage)
+        return result
+
+    def __hedge_is_affordable(self) -> bool:
+        estimated_cost = (
+            float(np.mean(self.__attempt_costs)) if self.__attempt_costs else 0
+        )
+        try:
+            MonetaryCostManager.raise_error_if_limit_would_be_reached(
+                estimated_cost
+            )
+        except HardLimitExceededError:
+            self.__hedges_skipped_for_budget += 1
+            return False
+        if self.hedge_cost_manager.amount_left < estimated_cost:
+            self.__hedges_skipped_for_budget += 1
+            return False
+        return True
+
+    @staticmethod
+    def __percentile(values: deque[float], percentile: float) -> float | None:
+        if len(values) == 0:
+            return None
+        return float(np.percentile(np.array(values), percentile))
+
+
+class HedgedModel(AiModel, ABC):
+    hedging_policy: HedgingPolicy | None = None
+
+    @staticmethod
+    async def _hedge_slow_requests_according_to_policy(
+        model: HedgedModel,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        if model.hedging_policy is None:
+            return await call_next(model, args, kwargs)
+        return await model.hedging_policy.run_hedged(
+            lambda: call_next(model, args, kwargs)
+        )
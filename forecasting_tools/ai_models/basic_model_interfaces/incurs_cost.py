@@ -1,12 +1,12 @@
-import functools
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any
 
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
-
-T = TypeVar("T")
+from forecasting_tools.util.call_pipeline import CallHandler
 
 
 class IncursCost(ABC):
@@ -21,18 +21,15 @@ class IncursCost(ABC):
         pass
 
     @staticmethod
-    def _wrap_in_cost_limiting_and_tracking(
-        func: Callable[..., Coroutine[Any, Any, T]]
-    ) -> Callable[..., Coroutine[Any, Any, T]]:
-        @functools.wraps(func)
-        async def wrapper(self: IncursCost, *args, **kwargs) -> T:
-            MonetaryCostManager.raise_error_if_limit_would_be_reached()
-
-            direct_call_response = await func(self, *args, **kwargs)
-
-            await self._track_cost_in_manager_using_model_response(
-                direct_call_response
-            )
-            return direct_call_response
-
-        return wrapper
+    async def _limit_and_track_cost(
+        model: IncursCost,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        MonetaryCostManager.raise_error_if_limit_would_be_reached()
+        direct_call_response = await call_next(model, args, kwargs)
+        await model._track_cost_in_manager_using_model_response(
+            direct_call_response
+        )
+        return direct_call_response
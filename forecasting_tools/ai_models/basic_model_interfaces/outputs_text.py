@@ -13,6 +13,9 @@ from forecasting_tools.ai_models.ai_utils.ai_misc import (
     validate_complex_type,
 )
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
+from forecasting_tools.ai_models.resource_managers.retry_policy import (
+    ErrorClassifier,
+)
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
@@ -28,7 +31,7 @@ class OutputsText(AiModel, ABC):
     ) -> T:
         """
         Input should ask for the type of resulting object you want with no other words around it
-        Retries if an invalid format is given
+        Retries if an invalid format is given. Errors calling the model are retried by the model itself, not here
 
         ## Handles
         - normal types (e.g. str, int, list, dict, bool, union)
@@ -56,6 +59,7 @@ class OutputsText(AiModel, ABC):
             self.__invoke_and_transform_to_type,
             input,
             normal_complex_or_pydantic_type,
+            should_retry=ErrorClassifier.is_parse_error,
         )
 
     async def invoke_and_unsafely_run_and_return_generated_code(
@@ -74,6 +78,7 @@ class OutputsText(AiModel, ABC):
             self.__invoke_and_unsafely_run_generated_code,
             input,
             expected_output_type,
+            should_retry=ErrorClassifier.is_parse_error,
         )
 
     async def invoke_and_check_for_boolean_keyword(
@@ -89,6 +94,7 @@ class OutputsText(AiModel, ABC):
             input,
             true_keyword,
             false_keyword,
+            should_retry=ErrorClassifier.is_parse_error,
         )
 
     async def __invoke_and_transform_to_type(
@@ -177,7 +183,7 @@ class OutputsText(AiModel, ABC):
         try:
             exec(code, global_vars, local_vars)
         except Exception as e:
-            raise RuntimeError(f"Error executing code: {e}. Code was {code}")
+            raise ValueError(f"Error executing code: {e}. Code was {code}")
 
         evaluated_answer = local_vars.get("final_result")
         if evaluated_answer is None:
@@ -1,21 +1,18 @@
 from __future__ import annotations
 
-import functools
 import logging
 from abc import ABC
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any
 
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
 from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
     RefreshingBucketRateLimiter,
 )
+from forecasting_tools.util.call_pipeline import CallHandler
 
 logger = logging.getLogger(__name__)
 
 
-T = TypeVar("T")
-
-
 class RequestLimitedModel(AiModel, ABC):
     # For more thoughts on abstract class properties see https://stackoverflow.com/questions/45248243/most-pythonic-way-to-declare-an-abstract-class-property
     REQUESTS_PER_PERIOD_LIMIT: int = NotImplemented
@@ -45,16 +42,11 @@ class RequestLimitedModel(AiModel, ABC):
         )
 
     @staticmethod
-    def _wait_till_request_capacity_available(
-        func: Callable[..., Coroutine[Any, Any, T]]
-    ) -> Callable[..., Coroutine[Any, Any, T]]:
-        @functools.wraps(func)
-        async def wrapper(self: RequestLimitedModel, *args, **kwargs) -> T:
-            number_of_requests_being_made = 1
-            await self._request_limiter.wait_till_able_to_acquire_resources(
-                number_of_requests_being_made
-            )
-            result = await func(self, *args, **kwargs)
-            return result
-
-        return wrapper
+    async def _wait_for_request_capacity(
+        model: RequestLimitedModel,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        await model._request_limiter.wait_till_able_to_acquire_resources(1)
+        return await call_next(model, args, kwargs)
@@ -2,20 +2,24 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any
 
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
+from forecasting_tools.ai_models.resource_managers.circuit_breaker import (
+    CircuitBreaker,
+)
+from forecasting_tools.ai_models.resource_managers.retry_policy import (
+    RetryPolicy,
+)
+from forecasting_tools.util.call_pipeline import CallHandler
 
 logger = logging.getLogger(__name__)
-import functools
-
-from tenacity import retry, stop_after_attempt, wait_random_exponential
-
-T = TypeVar("T")
 
 
 class RetryableModel(AiModel, ABC):
     _DEFAULT_ALLOWED_TRIES: int = 3
+    PROVIDER_NAME: str | None = None
+    _retry_policy: RetryPolicy = RetryPolicy()
 
     def __init__(
         self, allowed_tries: int = _DEFAULT_ALLOWED_TRIES, **kwargs
@@ -40,27 +44,23 @@ class RetryableModel(AiModel, ABC):
             )
         self.__allowed_tries = value
 
-    @staticmethod
-    def _retry_according_to_model_allowed_tries(
-        func: Callable[..., Coroutine[Any, Any, T]]
-    ) -> Callable[..., Coroutine[Any, Any, T]]:
-        @functools.wraps(func)
-        async def wrapper_with_access_to_self_variable(
-            self: RetryableModel, *args, **kwargs
-        ) -> T:
-            @retry(
-                wait=wait_random_exponential(
-                    exp_base=2, multiplier=10, min=5, max=60
-                ),  # Waits random number between 0 and exp_base^current_attempt * multiplier (with min and max override as needed)
-                reraise=True,
-                stop=stop_after_attempt(self.allowed_tries),
-            )
-            async def wrapper_with_action(
-                self: RetryableModel, *args, **kwargs
-            ) -> T:
-                result = await func(self, *args, **kwargs)
-                return result
+    @property
+    def provider_name(self) -> str:
+        return self.PROVIDER_NAME or type(self).__name__
 
-            return await wrapper_with_action(self, *args, **kwargs)
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._retry_policy.get_circuit_breaker(self.provider_name)
 
-        return wrapper_with_access_to_self_variable
+    @staticmethod
+    async def _retry_according_to_model_allowed_tries(
+        model: RetryableModel,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        return await model._retry_policy.run(
+            model.provider_name,
+            model.allowed_tries,
+            lambda: call_next(model, args, kwargs),
+        )
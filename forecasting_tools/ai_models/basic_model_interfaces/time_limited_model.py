@@ -5,12 +5,12 @@ from abc import ABC
 
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
 from forecasting_tools.util import async_batching
+from forecasting_tools.util.call_pipeline import CallHandler
+from forecasting_tools.util.deadline import Deadline, DeadlineExceededError
 
 logger = logging.getLogger(__name__)
-import functools
-from typing import Any, Callable, Coroutine, TypeVar
-
-T = TypeVar("T")
+import asyncio
+from typing import Any
 
 
 class TimeLimitedModel(AiModel, ABC):
@@ -21,20 +21,24 @@ class TimeLimitedModel(AiModel, ABC):
         if ABC not in cls.__bases__ and cls.TIMEOUT_TIME is NotImplemented:
             raise NotImplementedError("You forgot to define TIMEOUT_TIME")
 
+    def _get_timeout_time(self) -> float:
+        return self.TIMEOUT_TIME
+
     @staticmethod
-    def _wrap_in_model_defined_timeout(
-        func: Callable[..., Coroutine[Any, Any, T]]
-    ) -> Callable[..., Coroutine[Any, Any, T]]:
-        @functools.wraps(func)
-        async def wrapper(self: TimeLimitedModel, *args, **kwargs) -> T:
-            async def wrapper2(self: TimeLimitedModel, *args, **kwargs) -> T:
-                result = await func(self, *args, **kwargs)
-                return result
-
-            coroutine = wrapper2(self, *args, **kwargs)
-            timed_coroutine = async_batching.wrap_coroutines_with_timeout(
-                [coroutine], self.TIMEOUT_TIME
-            )[0]
-            return await timed_coroutine
-
-        return wrapper
+    async def _enforce_model_defined_timeout(
+        model: TimeLimitedModel,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        timeout_time = Deadline.limit_timeout(model._get_timeout_time())
+        try:
+            return await async_batching.run_coroutine_with_timeout(
+                call_next(model, args, kwargs), timeout_time
+            )
+        except asyncio.TimeoutError as e:
+            if Deadline.has_passed():
+                raise DeadlineExceededError(
+                    f"Request to {type(model).__name__} was cut short by the deadline"
+                ) from e
+            raise
@@ -6,8 +6,7 @@ from abc import ABC
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
 
 logger = logging.getLogger(__name__)
-import functools
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any
 
 from forecasting_tools.ai_models.basic_model_interfaces.tokens_are_calculatable import (
     TokensAreCalculatable,
@@ -15,8 +14,7 @@ from forecasting_tools.ai_models.basic_model_interfaces.tokens_are_calculatable
 from forecasting_tools.ai_models.resource_managers.refreshing_bucket_rate_limiter import (
     RefreshingBucketRateLimiter,
 )
-
-T = TypeVar("T")
+from forecasting_tools.util.call_pipeline import CallHandler
 
 
 class TokenLimitedModel(AiModel, TokensAreCalculatable, ABC):
@@ -47,19 +45,16 @@ class TokenLimitedModel(AiModel, TokensAreCalculatable, ABC):
         )
 
     @staticmethod
-    def _wait_till_token_capacity_available(
-        func: Callable[..., Coroutine[Any, Any, T]]
-    ) -> Callable[..., Coroutine[Any, Any, T]]:
-        @functools.wraps(func)
-        async def wrapper(self: TokenLimitedModel, *args, **kwargs) -> T:
-            tokens_of_prompt = self.input_to_tokens(*args, **kwargs)
-            await self._token_limiter.wait_till_able_to_acquire_resources(
-                tokens_of_prompt
-            )
-            result = await func(self, *args, **kwargs)
-            return result
-
-        return wrapper
+    async def _wait_for_token_capacity(
+        model: TokenLimitedModel,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        await model._token_limiter.wait_till_able_to_acquire_resources(
+            model.input_to_tokens(*args, **kwargs)
+        )
+        return await call_next(model, args, kwargs)
 
     @classmethod
     def _make_token_limiter_have_large_rate(cls) -> None:
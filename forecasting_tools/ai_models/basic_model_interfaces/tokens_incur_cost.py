@@ -13,6 +13,9 @@ from forecasting_tools.ai_models.basic_model_interfaces.tokens_are_calculatable
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
+from forecasting_tools.ai_models.resource_managers.prompt_cache_tracker import (
+    PromptCacheTracker,
+)
 
 
 class TokensIncurCost(TokensAreCalculatable, IncursCost, ABC):
@@ -37,6 +40,10 @@ class TokensIncurCost(TokensAreCalculatable, IncursCost, ABC):
                 f"This method has not been implemented for response type {type(response_from_direct_call)}"
             )
         MonetaryCostManager.increase_current_usage_in_parent_managers(cost)
+        PromptCacheTracker.record_usage_in_active_trackers(
+            response_from_direct_call.prompt_tokens_used,
+            response_from_direct_call.cached_prompt_tokens_used,
+        )
 
     @property
     def cost_per_token_completion(self) -> float:
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime
+import re
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 
 import aiohttp
 from pydantic import BaseModel, Field
@@ -22,6 +24,11 @@ from forecasting_tools.ai_models.basic_model_interfaces.time_limited_model impor
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
+from forecasting_tools.ai_models.resource_managers.request_cache import (
+    RequestCache,
+    RequestCacheStats,
+)
+from forecasting_tools.util.call_pipeline import CallPipeline
 from forecasting_tools.util.jsonable import Jsonable
 
 logger = logging.getLogger(__name__)
@@ -54,6 +61,42 @@ class ExaHighlightQuote(BaseModel, Jsonable):
     source: ExaSource
 
 
+class SearchQuoteRecorder:
+    """
+    Collects the highlight quotes found by searches made inside the with
+    block, so they can be saved along with the research they went into.
+
+    with SearchQuoteRecorder() as recorder:
+        ...
+    print(recorder.quotes)
+    """
+
+    _active_recorders: ContextVar[list[SearchQuoteRecorder]] = ContextVar(
+        "_active_recorders", default=[]
+    )
+
+    def __init__(self) -> None:
+        self.quotes: list[ExaHighlightQuote] = []
+
+    def __enter__(self) -> SearchQuoteRecorder:
+        recorders = self._active_recorders.get().copy()
+        recorders.append(self)
+        self._active_recorders.set(recorders)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        recorders = self._active_recorders.get().copy()
+        recorders.remove(self)
+        self._active_recorders.set(recorders)
+
+    @classmethod
+    def record_quotes_in_active_recorders(
+        cls, quotes: list[ExaHighlightQuote]
+    ) -> None:
+        for recorder in cls._active_recorders.get():
+            recorder.quotes.extend(quotes)
+
+
 class SearchInput(BaseModel, Jsonable):
     web_search_query: str = Field(
         ..., description="The query to search in the search engine"
@@ -81,6 +124,7 @@ class SearchInput(BaseModel, Jsonable):
 class ExaSearcher(
     RequestLimitedModel, RetryableModel, TimeLimitedModel, IncursCost
 ):
+    PROVIDER_NAME = "exa"
     REQUESTS_PER_PERIOD_LIMIT = (
         5  # For rate limits see https://docs.exa.ai/reference/rate-limits
     )
@@ -89,6 +133,10 @@ class ExaSearcher(
     COST_PER_REQUEST = 0.005
     COST_PER_HIGHLIGHT = 0.001
     COST_PER_TEXT = 0.001
+    HISTORICAL_SEARCH_CACHE_TTL = timedelta(days=30)
+    OPEN_ENDED_SEARCH_CACHE_TTL = timedelta(hours=1)
+    RECENT_SEARCH_CACHE_TTL = timedelta(minutes=15)
+    _search_cache: RequestCache[list[ExaSource]] = RequestCache()
 
     def __init__(
         self,
@@ -96,6 +144,7 @@ class ExaSearcher(
         include_text: bool = False,
         include_highlights: bool = True,
         num_results: int = 5,
+        use_search_cache: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -104,6 +153,15 @@ class ExaSearcher(
         self.num_highlights_per_url = 10
         self.num_sentences_per_highlight = 4
         self.num_results = num_results
+        self.use_search_cache = use_search_cache
+
+    @classmethod
+    def get_search_cache_stats(cls) -> RequestCacheStats:
+        return cls._search_cache.stats
+
+    @classmethod
+    def clear_search_cache(cls) -> None:
+        cls._search_cache.clear()
 
     async def invoke_for_highlights_in_relevance_order(
         self, search_query_or_strategy: str | SearchInput
@@ -125,6 +183,9 @@ class ExaSearcher(
         sorted_highlights = sorted(
             all_highlights, key=lambda x: x.score, reverse=True
         )
+        SearchQuoteRecorder.record_quotes_in_active_recorders(
+            sorted_highlights
+        )
         return sorted_highlights
 
     async def invoke(
@@ -136,21 +197,89 @@ class ExaSearcher(
             )
         else:
             search_strategy = search_query_or_strategy
-        return await self.__retryable_timed_cost_request_limited_invoke(
-            search_strategy
+        if not self.use_search_cache:
+            return await self.__retryable_timed_cost_request_limited_invoke(
+                search_strategy
+            )
+        return await self._search_cache.get_or_fetch(
+            self.__make_cache_key(search_strategy),
+            self.__get_cache_ttl(search_strategy).total_seconds(),
+            lambda: self.__retryable_timed_cost_request_limited_invoke(
+                search_strategy
+            ),
+            self._calculate_cost_for_request,
+        )
+
+    def __make_cache_key(self, search: SearchInput) -> tuple:
+        def normalize_text(text: str) -> str:
+            return re.sub(r"\s+", " ", text).strip().lower()
+
+        def normalize_domains(domains: list[str]) -> tuple[str, ...]:
+            return tuple(sorted({normalize_text(d) for d in domains}))
+
+        def normalize_date(date: datetime | None) -> str | None:
+            return date.date().isoformat() if date else None
+
+        highlight_query = search.highlight_query or search.web_search_query
+        return (
+            normalize_text(search.web_search_query),
+            normalize_text(highlight_query),
+            normalize_domains(search.include_domains),
+            normalize_domains(search.exclude_domains),
+            (
+                normalize_text(search.include_text)
+                if search.include_text
+                else None
+            ),
+            normalize_date(search.start_published_date),
+            normalize_date(search.end_published_date),
+            self.num_results,
+            self.include_text,
+            self.include_highlights,
+            self.num_highlights_per_url,
+            self.num_sentences_per_highlight,
         )
 
-    @RetryableModel._retry_according_to_model_allowed_tries
-    @RequestLimitedModel._wait_till_request_capacity_available
-    @IncursCost._wrap_in_cost_limiting_and_tracking
-    @TimeLimitedModel._wrap_in_model_defined_timeout
+    def __get_cache_ttl(self, search: SearchInput) -> timedelta:
+        """
+        Searches over a window that closed a while ago will not get new
+        results, while searches over recent news go stale quickly
+        """
+        now = datetime.now()
+        end_date = search.end_published_date
+        start_date = search.start_published_date
+        if end_date is not None and end_date.replace(
+            tzinfo=None
+        ) < now - timedelta(days=2):
+            return self.HISTORICAL_SEARCH_CACHE_TTL
+        if start_date is not None and start_date.replace(
+            tzinfo=None
+        ) > now - timedelta(days=7):
+            return self.RECENT_SEARCH_CACHE_TTL
+        return self.OPEN_ENDED_SEARCH_CACHE_TTL
+
+    @staticmethod
+    async def _call_exa_directly(
+        searcher: ExaSearcher, args: tuple, kwargs: dict
+    ) -> list[ExaSource]:
+        return await searcher._mockable_direct_call_to_model(*args, **kwargs)
+
+    __call_pipeline = CallPipeline(
+        [
+            RetryableModel._retry_according_to_model_allowed_tries,
+            RequestLimitedModel._wait_for_request_capacity,
+            IncursCost._limit_and_track_cost,
+            TimeLimitedModel._enforce_model_defined_timeout,
+        ],
+        _call_exa_directly,
+    )
+
     async def __retryable_timed_cost_request_limited_invoke(
         self, search_query_or_strategy: SearchInput
     ) -> list[ExaSource]:
-        response = await self._mockable_direct_call_to_model(
-            search_query_or_strategy
+        return await self.__call_pipeline.run(
+            self, (search_query_or_strategy,), {}
         )
-        return response
 
     async def _mockable_direct_call_to_model(
         self, search_query: SearchInput
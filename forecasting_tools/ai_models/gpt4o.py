@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 
 class Gpt4o(OpenAiTextToTextModel):
+    SUPPORTS_BATCH_API = True
     # See OpenAI Limit on the account dashboard for most up-to-date limit
     MODEL_NAME: Final[str] = "gpt-4o"
     REQUESTS_PER_PERIOD_LIMIT: Final[int] = 8_000
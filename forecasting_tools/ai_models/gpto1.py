@@ -9,6 +9,7 @@ from forecasting_tools.ai_models.model_archetypes.openai_text_model import (
 
 
 class GptO1(OpenAiTextToTextModel):
+    SUPPORTS_BATCH_API = True
     # See OpenAI Limit on the account dashboard for most up-to-date limit
     MODEL_NAME: Final[str] = "o1-preview"
     REQUESTS_PER_PERIOD_LIMIT: Final[int] = 8_000
@@ -6,6 +6,7 @@ from openai import AsyncOpenAI
 from forecasting_tools.ai_models.model_archetypes.openai_text_model import (
     OpenAiTextToTextModel,
 )
+from forecasting_tools.util.lazy_class_attribute import LazyClassAttribute
 
 
 class Gpt4oMetaculusProxy(OpenAiTextToTextModel):
@@ -13,15 +14,18 @@ class Gpt4oMetaculusProxy(OpenAiTextToTextModel):
     This model sends gpt4o requests to the Metaculus proxy server.
     """
 
+    PROVIDER_NAME = "metaculus_proxy"
     METACULUS_TOKEN = os.getenv("METACULUS_TOKEN")
-    _OPENAI_ASYNC_CLIENT = AsyncOpenAI(
-        base_url="https://www.metaculus.com/proxy/openai/v1",
-        default_headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Token {METACULUS_TOKEN}",
-        },
-        api_key="Fake API Key since openai requires this not to be NONE. This isn't used",
-        max_retries=0,  # Retry is implemented locally
+    _OPENAI_ASYNC_CLIENT = LazyClassAttribute(
+        lambda cls: AsyncOpenAI(
+            base_url="https://www.metaculus.com/proxy/openai/v1",
+            default_headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Token {cls.METACULUS_TOKEN}",
+            },
+            api_key="Fake API Key since openai requires this not to be NONE. This isn't used",
+            max_retries=0,  # Retry is implemented locally
+        )
     )
 
     # See OpenAI Limit on the account dashboard for most up-to-date limit
@@ -19,26 +19,41 @@ logger = logging.getLogger(__name__)
 
 
 class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
-
-    async def invoke(self, prompt: str) -> str:
+    PROVIDER_NAME = "anthropic"
+    CACHE_READ_PRICE_MULTIPLIER: float = 0.1
+    CACHE_WRITE_PRICE_MULTIPLIER: float = 1.25
+
+    async def invoke(
+        self, prompt: str, cacheable_prefix: str | None = None
+    ) -> str:
+        """
+        The cacheable prefix is put at the start of the user message and
+        marked with a cache_control breakpoint so calls sharing it (and the
+        system prompt) can read it from Anthropic's prompt cache.
+        """
+        prefix_kwargs = (
+            {}
+            if cacheable_prefix is None
+            else {"cacheable_prefix": cacheable_prefix}
+        )
         response: TextTokenCostResponse = (
             await self._invoke_with_request_cost_time_and_token_limits_and_retry(
-                prompt
+                prompt, **prefix_kwargs
             )
         )
         return response.data
 
     async def _mockable_direct_call_to_model(
-        self, prompt: str
+        self, prompt: str, cacheable_prefix: str | None = None
     ) -> TextTokenCostResponse:
         self._everything_special_to_call_before_direct_call()
         response: TextTokenCostResponse = (
-            await self._call_online_model_using_api(prompt)
+            await self._call_online_model_using_api(prompt, cacheable_prefix)
         )
         return response
 
     async def _call_online_model_using_api(
-        self, prompt: str
+        self, prompt: str, cacheable_prefix: str | None = None
     ) -> TextTokenCostResponse:
         anthropic_llm = ChatAnthropic(
             model_name=self.MODEL_NAME,
@@ -47,16 +62,25 @@ class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
             stop=None,
             base_url=None,
         )
-        messages = self._turn_model_input_into_messages(prompt)
+        messages = self._turn_model_input_into_messages(
+            prompt, cacheable_prefix
+        )
         answer_message = await anthropic_llm.ainvoke(messages)
         answer = answer_message.content
 
-        response_metadata = answer_message.response_metadata
-        prompt_tokens = response_metadata["usage"]["input_tokens"]  # type: ignore
-        completion_tokens = response_metadata["usage"]["output_tokens"]  # type: ignore
+        usage = answer_message.response_metadata["usage"]  # type: ignore
+        cache_read_tokens = usage.get("cache_read_input_tokens") or 0
+        cache_write_tokens = usage.get("cache_creation_input_tokens") or 0
+        prompt_tokens = (
+            usage["input_tokens"] + cache_read_tokens + cache_write_tokens
+        )
+        completion_tokens = usage["output_tokens"]
         total_tokens = prompt_tokens + completion_tokens
         cost = self.calculate_cost_from_tokens(
-            prompt_tkns=prompt_tokens, completion_tkns=completion_tokens
+            prompt_tkns=prompt_tokens,
+            completion_tkns=completion_tokens,
+            cached_prompt_tkns=cache_read_tokens,
+            cache_write_prompt_tkns=cache_write_tokens,
         )
 
         assert isinstance(answer, str), "Answer is not a string"
@@ -71,15 +95,29 @@ class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
             total_tokens_used=total_tokens,
             model=self.MODEL_NAME,
             cost=cost,
+            cached_prompt_tokens_used=cache_read_tokens,
         )
 
     def _turn_model_input_into_messages(
-        self, prompt: str
+        self, prompt: str, cacheable_prefix: str | None = None
     ) -> list[BaseMessage]:
+        if cacheable_prefix is None:
+            human_message = HumanMessage(prompt)
+        else:
+            human_message = HumanMessage(
+                content=[
+                    {
+                        "type": "text",
+                        "text": cacheable_prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": prompt},
+                ]
+            )
         if self.system_prompt is None:
-            return [HumanMessage(prompt)]
+            return [human_message]
         else:
-            return [SystemMessage(self.system_prompt), HumanMessage(prompt)]
+            return [SystemMessage(self.system_prompt), human_message]
 
     ################################## Methods For Mocking/Testing ##################################
 
@@ -120,14 +158,18 @@ class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
 
     ############################# Cost and Token Tracking Methods #############################
 
-    def input_to_tokens(self, prompt: str) -> int:
+    def input_to_tokens(
+        self, prompt: str, cacheable_prefix: str | None = None
+    ) -> int:
         llm = ChatAnthropic(
             model_name=self.MODEL_NAME,
             timeout=None,
             stop=None,
             base_url=None,
         )
-        messages = self._turn_model_input_into_messages(prompt)
+        messages = self._turn_model_input_into_messages(
+            prompt, cacheable_prefix
+        )
         tokens = llm.get_num_tokens_from_messages(messages)
         adjustment = 0
         for message in messages:
@@ -139,8 +181,17 @@ class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
         return tokens
 
     def calculate_cost_from_tokens(
-        self, prompt_tkns: int, completion_tkns: int
+        self,
+        prompt_tkns: int,
+        completion_tkns: int,
+        cached_prompt_tkns: int = 0,
+        cache_write_prompt_tkns: int = 0,
     ) -> float:
+        """
+        prompt_tkns includes the tokens read from (cached_prompt_tkns) and
+        written to (cache_write_prompt_tkns) the prompt cache, which are
+        priced differently from regular prompt tokens
+        """
         possible_detailed_model_names = MODEL_COST_PER_1K_INPUT_TOKENS.keys()
         detailed_model_name = [
             name
@@ -150,4 +201,17 @@ class AnthropicTextToTextModel(TraditionalOnlineLlm, ABC):
         cost = _get_anthropic_claude_token_cost(
             prompt_tkns, completion_tkns, detailed_model_name
         )
+        price_per_prompt_token = _get_anthropic_claude_token_cost(
+            1, 0, detailed_model_name
+        )
+        cost += (
+            cached_prompt_tkns
+            * price_per_prompt_token
+            * (self.CACHE_READ_PRICE_MULTIPLIER - 1)
+        )
+        cost += (
+            cache_write_prompt_tkns
+            * price_per_prompt_token
+            * (self.CACHE_WRITE_PRICE_MULTIPLIER - 1)
+        )
         return cost
@@ -9,6 +9,7 @@ from openai import AsyncOpenAI
 from openai._types import NOT_GIVEN, NotGiven
 from openai.types.chat import ChatCompletionMessageParam
 
+from forecasting_tools.ai_models.ai_utils.openai_batcher import OpenAiBatcher
 from forecasting_tools.ai_models.ai_utils.openai_utils import OpenAiUtils
 from forecasting_tools.ai_models.ai_utils.response_types import (
     TextTokenCostResponse,
@@ -16,41 +17,63 @@ from forecasting_tools.ai_models.ai_utils.response_types import (
 from forecasting_tools.ai_models.model_archetypes.traditional_online_llm import (
     TraditionalOnlineLlm,
 )
+from forecasting_tools.util.lazy_class_attribute import LazyClassAttribute
 
 logger = logging.getLogger(__name__)
 
 
 class OpenAiTextToTextModel(TraditionalOnlineLlm, ABC):
-    _OPENAI_ASYNC_CLIENT = AsyncOpenAI(
-        api_key=(
-            os.getenv("OPENAI_API_KEY")
-            if os.getenv("OPENAI_API_KEY") is not None
-            else "fake_key_so_it_doesn't_error_on_initialization"
-        ),
-        max_retries=0,  # Retry is implemented locally
+    PROVIDER_NAME = "openai"
+    SUPPORTS_BATCH_API: bool = False
+    CACHED_PROMPT_TOKEN_PRICE_MULTIPLIER: float = 0.5
+    _OPENAI_ASYNC_CLIENT = LazyClassAttribute(
+        lambda cls: AsyncOpenAI(
+            api_key=(
+                os.getenv("OPENAI_API_KEY")
+                if os.getenv("OPENAI_API_KEY") is not None
+                else "fake_key_so_it_doesn't_error_on_initialization"
+            ),
+            max_retries=0,  # Retry is implemented locally
+        )
     )
 
-    async def invoke(self, prompt: str) -> str:
+    async def invoke(
+        self, prompt: str, cacheable_prefix: str | None = None
+    ) -> str:
+        """
+        The cacheable prefix is put at the start of the user message. OpenAI
+        caches long prompt prefixes automatically, so instructions shared
+        by many calls should go in it rather than in the prompt.
+        """
+        prefix_kwargs = (
+            {}
+            if cacheable_prefix is None
+            else {"cacheable_prefix": cacheable_prefix}
+        )
         response: TextTokenCostResponse = (
             await self._invoke_with_request_cost_time_and_token_limits_and_retry(
-                prompt
+                prompt, **prefix_kwargs
             )
         )
         return response.data
 
     async def _mockable_direct_call_to_model(
-        self, prompt: str
+        self, prompt: str, cacheable_prefix: str | None = None
     ) -> TextTokenCostResponse:
         self._everything_special_to_call_before_direct_call()
-        messages = self._turn_model_input_into_messages(prompt)
+        messages = self._turn_model_input_into_messages(
+            prompt, cacheable_prefix
+        )
         response: TextTokenCostResponse = (
             await self._call_online_model_using_api(messages, self.temperature)
         )
         return response
 
     def _turn_model_input_into_messages(
-        self, prompt: str
+        self, prompt: str, cacheable_prefix: str | None = None
     ) -> list[ChatCompletionMessageParam]:
+        if cacheable_prefix is not None:
+            prompt = f"{cacheable_prefix}\n\n{prompt}"
         if self.system_prompt is None:
             return OpenAiUtils.put_single_user_message_in_list_using_prompt(
                 prompt
@@ -67,13 +90,24 @@ class OpenAiTextToTextModel(TraditionalOnlineLlm, ABC):
         max_tokens: int | NotGiven = NOT_GIVEN,
     ) -> TextTokenCostResponse:
         client = self._OPENAI_ASYNC_CLIENT
-
-        response = await client.chat.completions.create(
-            model=self.MODEL_NAME,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        batcher = self.__get_batcher_to_use()
+
+        if batcher is None:
+            response = await client.chat.completions.create(
+                model=self.MODEL_NAME,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        else:
+            request_body: dict = {
+                "model": self.MODEL_NAME,
+                "messages": messages,
+                "temperature": temperature,
+            }
+            if not isinstance(max_tokens, NotGiven):
+                request_body["max_tokens"] = max_tokens
+            response = await batcher.create_chat_completion(**request_body)
         if response.choices[0].message.content is None:
             raise RuntimeError(
                 "The model failed to give an answer. response.choices[0].message.content is None"
@@ -86,10 +120,19 @@ class OpenAiTextToTextModel(TraditionalOnlineLlm, ABC):
         prompt_tokens = usage_stats.prompt_tokens
         completion_tokens = usage_stats.completion_tokens
         total_tokens = usage_stats.total_tokens
+        cached_prompt_tokens = (
+            usage_stats.prompt_tokens_details.cached_tokens or 0
+            if usage_stats.prompt_tokens_details is not None
+            else 0
+        )
 
         cost = self.calculate_cost_from_tokens(
-            prompt_tkns=prompt_tokens, completion_tkns=completion_tokens
+            prompt_tkns=prompt_tokens,
+            completion_tkns=completion_tokens,
+            cached_prompt_tkns=cached_prompt_tokens,
         )
+        if batcher is not None:
+            cost = batcher.apply_discount(cost)
 
         return TextTokenCostResponse(
             data=answer,
@@ -98,8 +141,20 @@ class OpenAiTextToTextModel(TraditionalOnlineLlm, ABC):
             total_tokens_used=total_tokens,
             model=self.MODEL_NAME,
             cost=cost,
+            cached_prompt_tokens_used=cached_prompt_tokens,
         )
 
+    def _get_timeout_time(self) -> float:
+        batcher = self.__get_batcher_to_use()
+        if batcher is None:
+            return super()._get_timeout_time()
+        return batcher.timeout_seconds
+
+    def __get_batcher_to_use(self) -> OpenAiBatcher | None:
+        if not self.SUPPORTS_BATCH_API:
+            return None
+        return OpenAiBatcher.get_active_batcher()
+
     ################################## Methods For Mocking/Testing ##################################
 
     @classmethod
@@ -134,19 +189,33 @@ class OpenAiTextToTextModel(TraditionalOnlineLlm, ABC):
 
     ############################# Cost and Token Tracking Methods #############################
 
-    def input_to_tokens(self, prompt: str) -> int:
-        messages = self._turn_model_input_into_messages(prompt)
+    def input_to_tokens(
+        self, prompt: str, cacheable_prefix: str | None = None
+    ) -> int:
+        messages = self._turn_model_input_into_messages(
+            prompt, cacheable_prefix
+        )
         tokens = OpenAiUtils.messages_to_tokens(messages, self.MODEL_NAME)
         return tokens
 
     def calculate_cost_from_tokens(
-        self, prompt_tkns: int, completion_tkns: int
+        self,
+        prompt_tkns: int,
+        completion_tkns: int,
+        cached_prompt_tkns: int = 0,
     ) -> float:
+        """
+        cached_prompt_tkns is the part of prompt_tkns read from the prompt
+        cache, which is billed at a discount
+        """
         prompt_cost = get_openai_token_cost_for_model(
             self.MODEL_NAME, prompt_tkns, is_completion=False
         )
+        cached_prompt_discount = get_openai_token_cost_for_model(
+            self.MODEL_NAME, cached_prompt_tkns, is_completion=False
+        ) * (1 - self.CACHED_PROMPT_TOKEN_PRICE_MULTIPLIER)
         completion_cost = get_openai_token_cost_for_model(
             self.MODEL_NAME, completion_tkns, is_completion=True
         )
-        cost = prompt_cost + completion_cost
+        cost = prompt_cost - cached_prompt_discount + completion_cost
         return cost
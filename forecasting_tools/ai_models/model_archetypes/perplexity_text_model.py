@@ -18,21 +18,25 @@ from forecasting_tools.ai_models.basic_model_interfaces.priced_per_request impor
 from forecasting_tools.ai_models.model_archetypes.openai_text_model import (
     OpenAiTextToTextModel,
 )
+from forecasting_tools.util.lazy_class_attribute import LazyClassAttribute
 
 logger = logging.getLogger(__name__)
 
 
 class PerplexityTextModel(OpenAiTextToTextModel, PricedPerRequest, ABC):
+    PROVIDER_NAME = "perplexity"
     PRICE_PER_TOKEN: float
     PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
-    _OPENAI_ASYNC_CLIENT = AsyncOpenAI(
-        api_key=(
-            PERPLEXITY_API_KEY
-            if PERPLEXITY_API_KEY is not None
-            else "fake_key_so_it_doesn't_error_on_initialization"
-        ),
-        base_url="https://api.perplexity.ai",
-        max_retries=0,  # Retry is implemented locally
+    _OPENAI_ASYNC_CLIENT = LazyClassAttribute(
+        lambda cls: AsyncOpenAI(
+            api_key=(
+                cls.PERPLEXITY_API_KEY
+                if cls.PERPLEXITY_API_KEY is not None
+                else "fake_key_so_it_doesn't_error_on_initialization"
+            ),
+            base_url="https://api.perplexity.ai",
+            max_retries=0,  # Retry is implemented locally
+        )
     )
 
     def __init_subclass__(cls: type[PerplexityTextModel], **kwargs) -> None:
@@ -47,9 +51,11 @@ class PerplexityTextModel(OpenAiTextToTextModel, PricedPerRequest, ABC):
                     "You forgot to define PRICE_PER_REQUEST"
                 )
 
-    def input_to_tokens(self, prompt: str) -> int:
+    def input_to_tokens(
+        self, prompt: str, cacheable_prefix: str | None = None
+    ) -> int:
         messages: list[ChatCompletionMessageParam] = (
-            self._turn_model_input_into_messages(prompt)
+            self._turn_model_input_into_messages(prompt, cacheable_prefix)
         )
         chat = ChatPerplexity(
             client=self._OPENAI_ASYNC_CLIENT,
@@ -69,10 +75,13 @@ class PerplexityTextModel(OpenAiTextToTextModel, PricedPerRequest, ABC):
         return adjusted_tokens
 
     def calculate_cost_from_tokens(
-        self, prompt_tkns: int, completion_tkns: int
+        self,
+        prompt_tkns: int,
+        completion_tkns: int,
+        cached_prompt_tkns: int = 0,
     ) -> float:
         """
-        NOTE: Perplexity cost is not dependent on completion versus prompt differences
+        NOTE: Perplexity cost is not dependent on completion versus prompt differences or prompt caching
         NOTE: There is a Per-Request cost added to this function
         """
         total_tokens = prompt_tkns + completion_tkns
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import logging
 from abc import ABC
 from typing import Any
 
+from forecasting_tools.ai_models.basic_model_interfaces.hedged_model import (
+    HedgedModel,
+    HedgingPolicy,
+)
 from forecasting_tools.ai_models.basic_model_interfaces.named_model import (
     NamedModel,
 )
@@ -23,6 +29,13 @@ from forecasting_tools.ai_models.basic_model_interfaces.token_limited_model impo
 from forecasting_tools.ai_models.basic_model_interfaces.tokens_incur_cost import (
     TokensIncurCost,
 )
+from forecasting_tools.util.call_pipeline import (
+    CallHandler,
+    CallMiddleware,
+    CallPipeline,
+)
+from forecasting_tools.util.deadline import Deadline
+from forecasting_tools.util.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +46,21 @@ class TraditionalOnlineLlm(
     TimeLimitedModel,
     TokensIncurCost,
     RetryableModel,
+    HedgedModel,
     OutputsText,
     NamedModel,
     ABC,
 ):
+    _in_flight_requests: SingleFlight[Any] = SingleFlight()
+    _call_pipeline: CallPipeline
 
     def __init__(
         self,
         temperature: float = 0,
         allowed_tries: int = RetryableModel._DEFAULT_ALLOWED_TRIES,
         system_prompt: str | None = None,
+        coalesce_identical_requests: bool = False,
+        hedging_policy: HedgingPolicy | None = None,
     ) -> None:
         super().__init__(allowed_tries=allowed_tries)
         assert (
@@ -51,6 +69,14 @@ class TraditionalOnlineLlm(
         assert temperature <= 1, "Temperature must be less than or equal to 1"
         self.temperature: float = temperature
         self.system_prompt: str | None = system_prompt
+        self.coalesce_identical_requests: bool = coalesce_identical_requests
+        self.hedging_policy: HedgingPolicy | None = hedging_policy
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._call_pipeline = CallPipeline(
+            cls._get_call_middleware(), cls._call_model_directly
+        )
 
     async def invoke(self, *args, **kwargs) -> Any:
         result = await self._invoke_with_request_cost_time_and_token_limits_and_retry(
@@ -58,24 +84,84 @@ class TraditionalOnlineLlm(
         )
         return result
 
-    @RequestLimitedModel._wait_till_request_capacity_available
-    @TokenLimitedModel._wait_till_token_capacity_available
-    @RetryableModel._retry_according_to_model_allowed_tries
-    @TokensIncurCost._wrap_in_cost_limiting_and_tracking
-    @TimeLimitedModel._wrap_in_model_defined_timeout
+    @classmethod
+    def _get_call_middleware(cls) -> list[CallMiddleware]:
+        """
+        Middleware wrapped around every call to the model, outermost first.
+        It is chained once per class, and settings like allowed_tries,
+        hedging_policy and coalesce_identical_requests are read from the
+        instance on each call.
+        """
+        return [
+            cls._share_identical_in_flight_requests,
+            RequestLimitedModel._wait_for_request_capacity,
+            TokenLimitedModel._wait_for_token_capacity,
+            RetryableModel._retry_according_to_model_allowed_tries,
+            HedgedModel._hedge_slow_requests_according_to_policy,
+            TokensIncurCost._limit_and_track_cost,
+            TimeLimitedModel._enforce_model_defined_timeout,
+        ]
+
+    @staticmethod
+    async def _share_identical_in_flight_requests(
+        model: TraditionalOnlineLlm,
+        args: tuple,
+        kwargs: dict,
+        call_next: CallHandler,
+    ) -> Any:
+        """
+        When coalescing is on and the model is deterministic, only the first
+        of several concurrent identical requests is sent, so its cost is
+        tracked once in the cost managers of the first caller. The shared
+        request ignores the first caller's deadline, and each caller stops
+        waiting for it when its own deadline passes.
+        """
+        if not (model.coalesce_identical_requests and model.temperature == 0):
+            return await call_next(model, args, kwargs)
+        request_key = (
+            type(model).__qualname__,
+            model.temperature,
+            model.system_prompt,
+            repr(args),
+            repr(sorted(kwargs.items())),
+        )
+        result, was_shared = await Deadline.run_within_deadline(
+            model._in_flight_requests.run(
+                request_key,
+                lambda: Deadline.run_without_deadline(
+                    call_next(model, args, kwargs)
+                ),
+            )
+        )
+        if was_shared:
+            logger.debug(
+                "Shared the response of an identical in-flight request"
+            )
+        return result
+
     async def _invoke_with_request_cost_time_and_token_limits_and_retry(
         self, *args, **kwargs
     ) -> Any:
-        logger.debug(f"Invoking model with args: {args} and kwargs: {kwargs}")
-        direct_call_response = await self._mockable_direct_call_to_model(
+        return await self._call_pipeline.run(self, args, kwargs)
+
+    @staticmethod
+    async def _call_model_directly(
+        model: TraditionalOnlineLlm, args: tuple, kwargs: dict
+    ) -> Any:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Invoking model with args: {args} and kwargs: {kwargs}"
+            )
+        direct_call_response = await model._mockable_direct_call_to_model(
             *args, **kwargs
         )
-        response_to_log = (
-            direct_call_response[:1000]
-            if isinstance(direct_call_response, str)
-            else direct_call_response
-        )
-        logger.debug(f"Model responded with: {response_to_log}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            response_to_log = (
+                direct_call_response[:1000]
+                if isinstance(direct_call_response, str)
+                else direct_call_response
+            )
+            logger.debug(f"Model responded with: {response_to_log}...")
         return direct_call_response
 
     @classmethod
@@ -0,0 +1,121 @@
+import logging
+import time
+from collections import deque
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because a provider's circuit is open"""
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Tracks request outcomes for one provider over a sliding time window.
+    When the failure rate passes the threshold the circuit opens and
+    requests fail fast. After the cooldown one trial request is let
+    through (half open). Its success closes the circuit, its failure
+    opens it again. If the trial never reports back, another trial is let
+    through after the next cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_rate_threshold: float = 0.5,
+        min_requests_in_window: int = 10,
+        window_seconds: float = 60,
+        cooldown_seconds: float = 30,
+    ) -> None:
+        assert (
+            0 < failure_rate_threshold <= 1
+        ), "Failure rate threshold must be in (0, 1]"
+        assert min_requests_in_window >= 1, "Need at least one request"
+        assert window_seconds > 0, "Window must be positive"
+        assert cooldown_seconds >= 0, "Cooldown cannot be negative"
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_requests_in_window = min_requests_in_window
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.__state = CircuitState.CLOSED
+        self.__opened_at: float = 0
+        self.__trial_started_at: float | None = None
+        self.__outcomes: deque[tuple[float, bool]] = deque()
+
+    @property
+    def state(self) -> CircuitState:
+        return self.__state
+
+    @property
+    def failure_rate(self) -> float:
+        self.__drop_outcomes_outside_window()
+        if len(self.__outcomes) == 0:
+            return 0
+        failures = sum(1 for _, succeeded in self.__outcomes if not succeeded)
+        return failures / len(self.__outcomes)
+
+    def raise_error_if_request_not_allowed(self) -> None:
+        now = time.monotonic()
+        if self.__state == CircuitState.CLOSED:
+            return
+        if self.__state == CircuitState.OPEN:
+            if now - self.__opened_at < self.cooldown_seconds:
+                raise CircuitOpenError(
+                    f"Circuit for {self.name} is open after a failure rate of {self.failure_rate:.0%}. Retry in {self.cooldown_seconds - (now - self.__opened_at):.1f}s"
+                )
+            logger.info(f"Circuit for {self.name} is half open")
+            self.__state = CircuitState.HALF_OPEN
+            self.__trial_started_at = now
+            return
+        trial_is_stale = (
+            self.__trial_started_at is None
+            or now - self.__trial_started_at >= self.cooldown_seconds
+        )
+        if not trial_is_stale:
+            raise CircuitOpenError(
+                f"Circuit for {self.name} is half open and waiting on a trial request"
+            )
+        self.__trial_started_at = now
+
+    def record_success(self) -> None:
+        if self.__state != CircuitState.CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+            self.__state = CircuitState.CLOSED
+            self.__trial_started_at = None
+            self.__outcomes.clear()
+        self.__outcomes.append((time.monotonic(), True))
+
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        if self.__state == CircuitState.HALF_OPEN:
+            self.__open(now)
+            return
+        self.__outcomes.append((now, False))
+        failure_rate = self.failure_rate
+        if (
+            self.__state == CircuitState.CLOSED
+            and len(self.__outcomes) >= self.min_requests_in_window
+            and failure_rate >= self.failure_rate_threshold
+        ):
+            self.__open(now)
+
+    def __open(self, now: float) -> None:
+        logger.warning(
+            f"Opening circuit for {self.name} for {self.cooldown_seconds}s after a failure rate of {self.failure_rate:.0%}"
+        )
+        self.__state = CircuitState.OPEN
+        self.__opened_at = now
+        self.__trial_started_at = None
+
+    def __drop_outcomes_outside_window(self) -> None:
+        window_start = time.monotonic() - self.window_seconds
+        while self.__outcomes and self.__outcomes[0][0] < window_start:
+            self.__outcomes.popleft()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+
+
+class PromptCacheStats(BaseModel):
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+
+    @property
+    def cached_token_ratio(self) -> float:
+        if self.prompt_tokens == 0:
+            return 0
+        return self.cached_prompt_tokens / self.prompt_tokens
+
+
+class PromptCacheTracker:
+    """
+    Counts how many prompt tokens of the model calls made inside the with
+    block were read from the provider's prompt cache. Trackers can be
+    nested and every active tracker records each call.
+
+    with PromptCacheTracker() as tracker:
+        ...
+    print(tracker.stats.cached_token_ratio)
+    """
+
+    _active_trackers: ContextVar[list[PromptCacheTracker]] = ContextVar(
+        "_active_trackers", default=[]
+    )
+
+    def __init__(self) -> None:
+        self.stats = PromptCacheStats()
+
+    def __enter__(self) -> PromptCacheTracker:
+        trackers = self._active_trackers.get().copy()
+        trackers.append(self)
+        self._active_trackers.set(trackers)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        trackers = self._active_trackers.get().copy()
+        trackers.remove(self)
+        self._active_trackers.set(trackers)
+
+    @classmethod
+    def record_usage_in_active_trackers(
+        cls, prompt_tokens: int, cached_prompt_tokens: int
+    ) -> None:
+        for tracker in cls._active_trackers.get():
+            tracker.stats.requests += 1
+            tracker.stats.prompt_tokens += prompt_tokens
+            tracker.stats.cached_prompt_tokens += cached_prompt_tokens
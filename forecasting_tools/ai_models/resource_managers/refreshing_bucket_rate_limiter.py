@@ -69,6 +69,20 @@ class RefreshingBucketRateLimiter:
         asyncio.run(self._refresh_resource_count())
         return self._available_resources
 
+    def estimate_available_resources(self) -> float:
+        """
+        Same as refresh_and_then_get_available_resources but does not change
+        the bucket, so it can be called from inside a running event loop
+        """
+        seconds_since_last_replenish = (
+            datetime.now() - self.__last_replenish_time
+        ).total_seconds()
+        return min(
+            self._available_resources
+            + seconds_since_last_replenish * self.refresh_rate,
+            self.capacity,
+        )
+
     def zero_out_resources(self) -> None:
         self._available_resources = 0
         asyncio.run(self.__update_fill_the_bucket_mode(resources_ran_out=True))
@@ -0,0 +1,112 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Generic, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+from forecasting_tools.util.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    coalesced_requests: int = 0
+    saved_cost: float = 0
+
+    @property
+    def requests_avoided(self) -> int:
+        return self.hits + self.coalesced_requests
+
+    @property
+    def hit_rate(self) -> float:
+        total_lookups = self.hits + self.misses + self.coalesced_requests
+        if total_lookups == 0:
+            return 0
+        return self.requests_avoided / total_lookups
+
+
+class _CacheEntry(Generic[T]):
+    def __init__(self, value: T, cost: float, expires_at: float) -> None:
+        self.value = value
+        self.cost = cost
+        self.expires_at = expires_at
+
+
+class RequestCache(Generic[T]):
+    """
+    In-memory cache for paid requests. Entries expire after a per-entry
+    time to live, the least recently used entry is evicted past
+    max_entries, and concurrent misses for the same key share one request.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        assert max_entries > 0, "Max entries must be positive"
+        self.max_entries = max_entries
+        self.stats = RequestCacheStats()
+        self.__entries: OrderedDict[Hashable, _CacheEntry[T]] = OrderedDict()
+        self.__single_flight: SingleFlight[T] = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        ttl_seconds: float,
+        fetch: Callable[[], Coroutine[Any, Any, T]],
+        calculate_cost: Callable[[T], float],
+    ) -> T:
+        cached_entry = self.__get_unexpired_entry(key)
+        if cached_entry is not None:
+            self.stats.hits += 1
+            self.stats.saved_cost += cached_entry.cost
+            logger.debug(f"Request cache hit for key {key}")
+            return cached_entry.value
+
+        async def fetch_and_store() -> T:
+            result = await fetch()
+            if ttl_seconds > 0:
+                self.__store(
+                    key,
+                    _CacheEntry(
+                        result,
+                        calculate_cost(result),
+                        time.time() + ttl_seconds,
+                    ),
+                )
+            return result
+
+        result, was_shared = await self.__single_flight.run(
+            key, fetch_and_store
+        )
+        if was_shared:
+            self.stats.coalesced_requests += 1
+            self.stats.saved_cost += calculate_cost(result)
+        else:
+            self.stats.misses += 1
+        return result
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.stats = RequestCacheStats()
+
+    def __get_unexpired_entry(self, key: Hashable) -> _CacheEntry[T] | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return entry
+
+    def __store(self, key: Hashable, entry: _CacheEntry[T]) -> None:
+        self.__entries[key] = entry
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, Callable, Coroutine, Iterator, TypeVar
+
+import aiohttp
+import openai
+from pydantic import BaseModel
+
+from forecasting_tools.ai_models.resource_managers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from forecasting_tools.ai_models.resource_managers.hard_limit_manager import (
+    HardLimitExceededError,
+)
+from forecasting_tools.util.deadline import Deadline, DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ErrorClass(Enum):
+    RATE_LIMIT = "rate_limit"
+    SERVER = "server"
+    TIMEOUT = "timeout"
+    CLIENT = "client"
+    PARSE = "parse"
+
+    @property
+    def is_retryable(self) -> bool:
+        return self in (
+            ErrorClass.RATE_LIMIT,
+            ErrorClass.SERVER,
+            ErrorClass.TIMEOUT,
+        )
+
+
+class ErrorClassifier:
+    """
+    Classifies errors by walking the exception chain (outermost first) so
+    errors re-raised by wrappers like the timeout wrapper are classified by
+    their cause. Errors that cannot be classified are treated as server
+    errors so they are retried like before.
+    """
+
+    @classmethod
+    def classify(cls, error: BaseException) -> ErrorClass:
+        for error_in_chain in cls.__walk_error_chain(error):
+            error_class = cls.__classify_single_error(error_in_chain)
+            if error_class is not None:
+                return error_class
+        return ErrorClass.SERVER
+
+    @classmethod
+    def is_parse_error(cls, error: BaseException) -> bool:
+        return cls.classify(error) == ErrorClass.PARSE
+
+    @classmethod
+    def get_retry_after_seconds(cls, error: BaseException) -> float | None:
+        for error_in_chain in cls.__walk_error_chain(error):
+            headers = getattr(error_in_chain, "headers", None)
+            if headers is None:
+                response = getattr(error_in_chain, "response", None)
+                headers = getattr(response, "headers", None)
+            if not headers:
+                continue
+            lower_case_headers = {
+                str(key).lower(): value for key, value in headers.items()
+            }
+            retry_after_ms = lower_case_headers.get("retry-after-ms")
+            retry_after = lower_case_headers.get("retry-after")
+            if retry_after_ms is not None:
+                seconds = cls.__parse_seconds(retry_after_ms)
+                if seconds is not None:
+                    return seconds / 1000
+            if retry_after is not None:
+                return cls.__parse_seconds(retry_after)
+        return None
+
+    @classmethod
+    def __classify_single_error(
+        cls, error: BaseException
+    ) -> ErrorClass | None:
+        if isinstance(
+            error,
+            (HardLimitExceededError, CircuitOpenError, DeadlineExceededError),
+        ):
+            return ErrorClass.CLIENT
+        status_code = cls.__get_status_code(error)
+        if status_code == 429:
+            return ErrorClass.RATE_LIMIT
+        if status_code == 408:
+            return ErrorClass.TIMEOUT
+        if status_code is not None and status_code >= 500:
+            return ErrorClass.SERVER
+        if status_code is not None and status_code >= 400:
+            return ErrorClass.CLIENT
+        if isinstance(error, (TimeoutError, openai.APITimeoutError)):
+            return ErrorClass.TIMEOUT
+        if isinstance(
+            error, (openai.APIConnectionError, aiohttp.ClientConnectionError)
+        ):
+            return ErrorClass.SERVER
+        if isinstance(
+            error,
+            (json.JSONDecodeError, ValueError, TypeError, AssertionError),
+        ):
+            return ErrorClass.PARSE
+        return None
+
+    @staticmethod
+    def __get_status_code(error: BaseException) -> int | None:
+        for attribute in ["status_code", "status"]:
+            status_code = getattr(error, attribute, None)
+            if isinstance(status_code, int):
+                return status_code
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code
+        return None
+
+    @staticmethod
+    def __walk_error_chain(error: BaseException) -> Iterator[BaseException]:
+        seen_ids: set[int] = set()
+        current_error: BaseException | None = error
+        while current_error is not None and id(current_error) not in seen_ids:
+            seen_ids.add(id(current_error))
+            yield current_error
+            current_error = (
+                current_error.__cause__ or current_error.__context__
+            )
+
+    @staticmethod
+    def __parse_seconds(value: Any) -> float | None:
+        try:
+            return max(float(value), 0)
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_date = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+        return max(
+            (retry_date - datetime.now(timezone.utc)).total_seconds(), 0
+        )
+
+
+class Backoff(BaseModel):
+    """
+    Full jitter exponential backoff. Waits a random time between 0 and
+    multiplier * exp_base^attempt, clamped to [min_wait, max_wait].
+    """
+
+    min_wait: float
+    max_wait: float
+    multiplier: float
+    exp_base: float = 2
+
+    def get_wait_seconds(self, attempt: int) -> float:
+        upper_bound = min(
+            self.max_wait, self.multiplier * self.exp_base**attempt
+        )
+        return min(
+            max(random.uniform(0, upper_bound), self.min_wait), self.max_wait
+        )
+
+
+class RetryBudget:
+    """
+    Caps retries across the whole run. Every request deposits retry_ratio
+    retries into the budget (up to max_banked_retries) and every retry
+    withdraws one. During an outage retries drain the budget and further
+    failures are raised immediately instead of multiplying load.
+    """
+
+    def __init__(
+        self,
+        retry_ratio: float = 0.2,
+        initial_retries: float = 20,
+        max_banked_retries: float = 100,
+    ) -> None:
+        assert retry_ratio >= 0, "Retry ratio cannot be negative"
+        assert initial_retries >= 0, "Initial retries cannot be negative"
+        self.retry_ratio = retry_ratio
+        self.max_banked_retries = max_banked_retries
+        self.retries_spent = 0
+        self.retries_denied = 0
+        self.__banked_retries = min(initial_retries, max_banked_retries)
+
+    @property
+    def retries_left(self) -> float:
+        return self.__banked_retries
+
+    def record_request(self) -> None:
+        self.__banked_retries = min(
+            self.__banked_retries + self.retry_ratio, self.max_banked_retries
+        )
+
+    def try_spend_retry(self) -> bool:
+        if self.__banked_retries < 1:
+            self.retries_denied += 1
+            return False
+        self.__banked_retries -= 1
+        self.retries_spent += 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Retries retryable errors with a backoff chosen by error class, honouring
+    retry-after headers. Client and parse errors are raised immediately
+    (parse errors are retried by OutputsText which can ask for a new
+    output). Retries are drawn from a shared RetryBudget, and each
+    provider gets a CircuitBreaker that fails requests fast while the
+    provider is failing. No retry is started that would wait past the
+    active Deadline.
+    """
+
+    DEFAULT_BACKOFFS: dict[ErrorClass, Backoff] = {
+        ErrorClass.RATE_LIMIT: Backoff(min_wait=5, max_wait=60, multiplier=10),
+        ErrorClass.SERVER: Backoff(min_wait=2, max_wait=30, multiplier=2),
+        ErrorClass.TIMEOUT: Backoff(min_wait=1, max_wait=10, multiplier=1),
+    }
+
+    def __init__(
+        self,
+        backoffs: dict[ErrorClass, Backoff] | None = None,
+        retry_budget: RetryBudget | None = None,
+        create_circuit_breaker: Callable[
+            [str], CircuitBreaker
+        ] = CircuitBreaker,
+        max_retry_after_seconds: float = 120,
+    ) -> None:
+        self.backoffs = {**self.DEFAULT_BACKOFFS, **(backoffs or {})}
+        self.retry_budget = retry_budget or RetryBudget()
+        self.create_circuit_breaker = create_circuit_breaker
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self.__circuit_breakers: dict[str, CircuitBreaker] = {}
+
+    def get_circuit_breaker(self, provider: str) -> CircuitBreaker:
+        if provider not in self.__circuit_breakers:
+            self.__circuit_breakers[provider] = self.create_circuit_breaker(
+                provider
+            )
+        return self.__circuit_breakers[provider]
+
+    def get_wait_seconds(
+        self, error: BaseException, error_class: ErrorClass, attempt: int
+    ) -> float:
+        backoff_wait = self.backoffs[error_class].get_wait_seconds(attempt)
+        retry_after = ErrorClassifier.get_retry_after_seconds(error)
+        if retry_after is None:
+            return backoff_wait
+        return min(retry_after, self.max_retry_after_seconds)
+
+    async def run(
+        self,
+        provider: str,
+        allowed_tries: int,
+        create_coroutine: Callable[[], Coroutine[Any, Any, T]],
+    ) -> T:
+        circuit_breaker = self.get_circuit_breaker(provider)
+        self.retry_budget.record_request()
+        attempt = 1
+        while True:
+            circuit_breaker.raise_error_if_request_not_allowed()
+            try:
+                result = await create_coroutine()
+            except Exception as error:
+                error_class = ErrorClassifier.classify(error)
+                if error_class.is_retryable:
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+                if (
+                    not error_class.is_retryable
+                    or attempt >= allowed_tries
+                    or circuit_breaker.state == CircuitState.OPEN
+                    or not self.retry_budget.try_spend_retry()
+                ):
+                    raise
+                wait_seconds = self.get_wait_seconds(
+                    error, error_class, attempt
+                )
+                if not Deadline.has_time_for(wait_seconds):
+                    raise
+                logger.warning(
+                    f"Retrying {provider} request in {wait_seconds:.1f}s after {error_class.value} error on attempt {attempt}/{allowed_tries}: {error.__class__.__name__}: {error}"
+                )
+                await asyncio.sleep(wait_seconds)
+                attempt += 1
+            else:
+                circuit_breaker.record_success()
+                return result
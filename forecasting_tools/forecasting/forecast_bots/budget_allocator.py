@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+
+from pydantic import BaseModel, Field
+
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ResearchWithPredictions,
+)
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    MetaculusQuestion,
+)
+from forecasting_tools.forecasting.questions_and_reports.report_organizer import (
+    ReportOrganizer,
+)
+
+
+class QuestionAllocation(BaseModel):
+    question: MetaculusQuestion
+    research_with_predictions_units: list[ResearchWithPredictions] = Field(
+        default_factory=list
+    )
+    research_reports_run: int = 0
+    cost: float = 0
+    seconds_spent: float = 0
+    uncertainty: float = 0
+
+    @property
+    def priority(self) -> float:
+        """
+        Uncertainty shrinks roughly with the square root of the ensemble
+        size, so questions that already got a lot of budget are discounted
+        """
+        return self.uncertainty / math.sqrt(max(self.research_reports_run, 1))
+
+
+class BudgetAllocator:
+    """
+    Decides which questions get more research reports (and with them more
+    predictions) after a first pass of one research report per question.
+    Questions whose predictions disagree with each other or with the
+    community prediction are given budget first.
+    """
+
+    UNCERTAINTY_WITH_NOTHING_TO_COMPARE = 0.5
+
+    @classmethod
+    async def calculate_uncertainty(
+        cls, allocation: QuestionAllocation
+    ) -> float:
+        """
+        Largest difference (0 to 1) between the aggregate prediction and any
+        single prediction or the community prediction
+        """
+        question = allocation.question
+        predictions = [
+            reasoned_prediction.prediction_value
+            for unit in allocation.research_with_predictions_units
+            for reasoned_prediction in unit.predictions
+        ]
+        if len(predictions) == 0:
+            return 0
+        report_type = ReportOrganizer.get_report_type_for_question_type(
+            type(question)
+        )
+        aggregate = await report_type.aggregate_predictions(
+            predictions, question
+        )
+        differences = [
+            report_type.calculate_prediction_difference(aggregate, prediction)
+            for prediction in predictions
+        ]
+        if (
+            isinstance(question, BinaryQuestion)
+            and question.community_prediction_at_access_time is not None
+        ):
+            differences.append(
+                report_type.calculate_prediction_difference(
+                    aggregate, question.community_prediction_at_access_time
+                )
+            )
+        if len(differences) == 1 and differences[0] == 0:
+            return cls.UNCERTAINTY_WITH_NOTHING_TO_COMPARE
+        return max(differences)
+
+    @classmethod
+    def choose_questions_for_next_round(
+        cls,
+        allocations: list[QuestionAllocation],
+        max_research_reports_per_question: int,
+        dollars_left: float | None,
+        cost_per_research_report: float,
+    ) -> list[QuestionAllocation]:
+        """
+        Returns the most uncertain questions that can still take another
+        research report, as many as the dollars left can pay for
+        (dollars_left of None means no dollar limit)
+        """
+        candidates = [
+            allocation
+            for allocation in allocations
+            if allocation.research_reports_run
+            < max_research_reports_per_question
+            and len(allocation.research_with_predictions_units) > 0
+            and allocation.uncertainty > 0
+        ]
+        candidates.sort(
+            key=lambda allocation: allocation.priority, reverse=True
+        )
+        if dollars_left is None or cost_per_research_report <= 0:
+            return candidates
+        affordable_reports = max(
+            int(dollars_left // cost_per_research_report), 0
+        )
+        return candidates[:affordable_reports]
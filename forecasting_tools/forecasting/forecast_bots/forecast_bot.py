@@ -2,13 +2,35 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Coroutine, cast
+from typing import Any, Callable, Coroutine, TypeVar, cast
+
+from pydantic import BaseModel
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.exa_searcher import SearchQuoteRecorder
 from forecasting_tools.ai_models.resource_managers.monetary_cost_manager import (
     MonetaryCostManager,
 )
+from forecasting_tools.ai_models.resource_managers.prompt_cache_tracker import (
+    PromptCacheStats,
+    PromptCacheTracker,
+)
+from forecasting_tools.forecasting.forecast_bots.budget_allocator import (
+    BudgetAllocator,
+    QuestionAllocation,
+)
+from forecasting_tools.forecasting.helpers.bulk_forecast_publisher import (
+    BulkForecastPublisher,
+)
 from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.helpers.report_analytics_store import (
+    ReportAnalyticsStore,
+)
+from forecasting_tools.forecasting.helpers.research_store import (
+    ResearchStore,
+    StoredResearch,
+    StoredSearchQuote,
+)
 from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
     ForecastReport,
     ReasonedPrediction,
@@ -31,9 +53,35 @@ from forecasting_tools.forecasting.questions_and_reports.report_organizer import
     ReportOrganizer,
 )
 from forecasting_tools.util import async_batching
+from forecasting_tools.util.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class EnsembleStats(BaseModel):
+    questions: int = 0
+    research_reports_run: int = 0
+    research_reports_in_fixed_ensemble: int = 0
+    predictions_run: int = 0
+    predictions_in_fixed_ensemble: int = 0
+
+    @property
+    def calls_saved(self) -> int:
+        return (
+            self.research_reports_in_fixed_ensemble
+            - self.research_reports_run
+            + self.predictions_in_fixed_ensemble
+            - self.predictions_run
+        )
+
+    @property
+    def fraction_of_predictions_saved(self) -> float:
+        if self.predictions_in_fixed_ensemble == 0:
+            return 0
+        return 1 - self.predictions_run / self.predictions_in_fixed_ensemble
+
 
 class ForecastBot(ABC):
 
@@ -46,7 +94,33 @@ class ForecastBot(ABC):
         publish_reports_to_metaculus: bool = False,
         folder_to_save_reports_to: str | None = None,
         skip_previously_forecasted_questions: bool = False,
+        question_time_limit_in_minutes: float | None = None,
+        early_stopping_tolerance: float | None = None,
+        ensemble_wave_size: int = 2,
+        total_budget_in_dollars: float | None = None,
+        total_time_limit_in_minutes: float | None = None,
+        research_store: ResearchStore | None = None,
+        analytics_store: ReportAnalyticsStore | None = None,
     ) -> None:
+        """
+        If early_stopping_tolerance is set, research reports and predictions
+        are run in waves of ensemble_wave_size and no more waves are run once
+        a wave moves the aggregate prediction by no more than the tolerance
+        (in probability, e.g. 0.01 for one percentage point).
+
+        If a total budget or time limit is set, forecast_questions runs one
+        research report per question first and then spends what is left on
+        more research reports for the questions with the most uncertain
+        forecasts (see BudgetAllocator), up to research_reports_per_question
+        reports per question.
+
+        If a research store is given, fresh research saved there (by this or
+        any other bot) is used instead of running research again. Each
+        stored report is used at most once per question in a run, so
+        research reports stay distinct.
+
+        If an analytics store is given, every run's reports are added to it.
+        """
         assert (
             research_reports_per_question > 0
         ), "Must run at least one research report"
@@ -63,6 +137,20 @@ class ForecastBot(ABC):
         self.skip_previously_forecasted_questions = (
             skip_previously_forecasted_questions
         )
+        assert ensemble_wave_size > 0, "Waves must have at least one run"
+        assert (
+            total_budget_in_dollars is None or total_budget_in_dollars > 0
+        ), "Budget must be positive"
+        self.question_time_limit_in_minutes = question_time_limit_in_minutes
+        self.early_stopping_tolerance = early_stopping_tolerance
+        self.ensemble_wave_size = ensemble_wave_size
+        self.ensemble_stats = EnsembleStats()
+        self.prompt_cache_stats = PromptCacheStats()
+        self.total_budget_in_dollars = total_budget_in_dollars
+        self.total_time_limit_in_minutes = total_time_limit_in_minutes
+        self.research_store = research_store
+        self.analytics_store = analytics_store
+        self.__stored_research_used: dict[str, set[int]] = {}
 
     async def forecast_on_tournament(
         self,
@@ -103,21 +191,69 @@ class ForecastBot(ABC):
                 )
             questions = unforecasted_questions
         reports: list[ForecastReport] = []
-        reports, _ = (
-            async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                [
-                    self._run_individual_question(question)
-                    for question in questions
-                ]
-            )
+        self.__stored_research_used = {}
+        with PromptCacheTracker() as prompt_cache_tracker:
+            if (
+                self.total_budget_in_dollars is None
+                and self.total_time_limit_in_minutes is None
+            ):
+                reports, _ = (
+                    async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                        [
+                            self._run_individual_question(question)
+                            for question in questions
+                        ]
+                    )
+                )
+            else:
+                reports = await self._run_questions_within_total_budget(
+                    questions
+                )
+        self.prompt_cache_stats = prompt_cache_tracker.stats
+        logger.info(
+            f"{round(self.prompt_cache_stats.cached_token_ratio * 100, 1)}% of {self.prompt_cache_stats.prompt_tokens} prompt tokens were read from prompt caches"
         )
+        if self.research_store is not None:
+            store_stats = self.research_store.stats
+            logger.info(
+                f"Reused {round(store_stats.reuse_rate * 100, 1)}% of {store_stats.lookups} research reports from the research store ({store_stats.topped_up} topped up with recent news)"
+            )
         if self.folder_to_save_reports_to:
             file_path = self.__create_file_path_to_save_to(questions)
             ForecastReport.save_object_list_to_file_path(reports, file_path)
+        if self.analytics_store is not None:
+            self.analytics_store.add_reports(
+                reports, bot_name=self.__class__.__name__
+            )
+        if self.publish_reports_to_metaculus:
+            await BulkForecastPublisher().publish_reports(reports)
+        return reports
+
+    async def prepare_research(
+        self,
+        questions: list[MetaculusQuestion],
+        research_reports_per_question: int | None = None,
+    ) -> None:
+        """
+        Runs research reports for each question and saves them to the
+        research store, so any bot sharing the store can forecast from them
+        without researching again. Defaults to research_reports_per_question.
+        """
+        assert (
+            self.research_store is not None
+        ), "Preparing research needs a research store"
+        number_of_reports = (
+            research_reports_per_question or self.research_reports_per_question
+        )
+        self.__stored_research_used = {}
+
+        async def research_question(question: MetaculusQuestion) -> None:
+            for _ in range(number_of_reports):
+                await self._get_research_and_summary(question)
+
         async_batching.run_coroutines_while_removing_and_logging_exceptions(
-            [report.publish_report_to_metaculus() for report in reports]
+            [research_question(question) for question in questions]
         )
-        return reports
 
     @abstractmethod
     async def run_research(self, question: MetaculusQuestion) -> str:
@@ -126,6 +262,16 @@ class ForecastBot(ABC):
         """
         raise NotImplementedError("Subclass must implement this method")
 
+    async def run_research_top_up(
+        self, question: MetaculusQuestion, since: datetime
+    ) -> str | None:
+        """
+        Researches only the news since the given time, to add on top of older
+        research. Returns None if the bot can't do this, in which case
+        research is run from scratch instead.
+        """
+        return None
+
     async def summarize_research(
         self, question: MetaculusQuestion, research: str
     ) -> str:
@@ -136,33 +282,64 @@ class ForecastBot(ABC):
     ) -> ForecastReport:
         with MonetaryCostManager() as cost_manager:
             start_time = time.time()
-            prediction_tasks = [
-                self._research_and_make_predictions(question)
-                for _ in range(self.research_reports_per_question)
-            ]
-            research_with_predictions_units, _ = (
-                async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                    prediction_tasks
-                )
+            time_limit_in_seconds = (
+                self.question_time_limit_in_minutes * 60
+                if self.question_time_limit_in_minutes is not None
+                else None
             )
-            if len(research_with_predictions_units) == 0:
-                raise ValueError("All research reports/predictions failed")
-            report_type = ReportOrganizer.get_report_type_for_question_type(
-                type(question)
+            self.ensemble_stats.questions += 1
+            self.ensemble_stats.research_reports_in_fixed_ensemble += (
+                self.research_reports_per_question
             )
-            all_predictions = [
-                reasoned_prediction.prediction_value
-                for research_prediction_collection in research_with_predictions_units
-                for reasoned_prediction in research_prediction_collection.predictions
-            ]
-            aggregated_prediction = await report_type.aggregate_predictions(
-                all_predictions,
-                question,
+            self.ensemble_stats.predictions_in_fixed_ensemble += (
+                self.research_reports_per_question
+                * self.predictions_per_research_report
             )
+            with Deadline(time_limit_in_seconds):
+                research_with_predictions_units, research_reports_run = (
+                    await self._run_ensemble(
+                        lambda: self._research_and_make_predictions(question),
+                        self.research_reports_per_question,
+                        lambda units: [
+                            reasoned_prediction.prediction_value
+                            for unit in units
+                            for reasoned_prediction in unit.predictions
+                        ],
+                        question,
+                    )
+                )
+            self.ensemble_stats.research_reports_run += research_reports_run
             end_time = time.time()
             time_spent_in_minutes = (end_time - start_time) / 60
             final_cost = cost_manager.current_usage
+        return await self._create_report(
+            question,
+            research_with_predictions_units,
+            final_cost,
+            time_spent_in_minutes,
+        )
 
+    async def _create_report(
+        self,
+        question: MetaculusQuestion,
+        research_with_predictions_units: list[ResearchWithPredictions],
+        final_cost: float,
+        time_spent_in_minutes: float,
+    ) -> ForecastReport:
+        if len(research_with_predictions_units) == 0:
+            raise ValueError("All research reports/predictions failed")
+        report_type = ReportOrganizer.get_report_type_for_question_type(
+            type(question)
+        )
+        all_predictions = [
+            reasoned_prediction.prediction_value
+            for research_prediction_collection in research_with_predictions_units
+            for reasoned_prediction in research_prediction_collection.predictions
+        ]
+        aggregated_prediction = await report_type.aggregate_predictions(
+            all_predictions,
+            question,
+        )
         unified_explanation = self._create_unified_explanation(
             question,
             research_with_predictions_units,
@@ -178,11 +355,113 @@ class ForecastBot(ABC):
             minutes_taken=time_spent_in_minutes,
         )
 
+    async def _run_questions_within_total_budget(
+        self, questions: list[MetaculusQuestion]
+    ) -> list[ForecastReport]:
+        allocations = [
+            QuestionAllocation(question=question) for question in questions
+        ]
+        self.ensemble_stats.questions += len(questions)
+        self.ensemble_stats.research_reports_in_fixed_ensemble += (
+            len(questions) * self.research_reports_per_question
+        )
+        self.ensemble_stats.predictions_in_fixed_ensemble += (
+            len(questions)
+            * self.research_reports_per_question
+            * self.predictions_per_research_report
+        )
+        time_limit_in_seconds = (
+            self.total_time_limit_in_minutes * 60
+            if self.total_time_limit_in_minutes is not None
+            else None
+        )
+        with MonetaryCostManager(
+            self.total_budget_in_dollars or 0
+        ) as total_cost_manager, Deadline(time_limit_in_seconds):
+            next_round = allocations
+            while len(next_round) > 0:
+                round_start_time = time.time()
+                async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                    [
+                        self._run_allocated_research_report(allocation)
+                        for allocation in next_round
+                    ]
+                )
+                for allocation in next_round:
+                    allocation.uncertainty = (
+                        await BudgetAllocator.calculate_uncertainty(allocation)
+                    )
+                round_seconds = time.time() - round_start_time
+                if not Deadline.has_time_for(round_seconds):
+                    break
+                reports_run = sum(
+                    allocation.research_reports_run
+                    for allocation in allocations
+                )
+                next_round = BudgetAllocator.choose_questions_for_next_round(
+                    allocations,
+                    self.research_reports_per_question,
+                    (
+                        total_cost_manager.amount_left
+                        if self.total_budget_in_dollars is not None
+                        else None
+                    ),
+                    total_cost_manager.current_usage / reports_run,
+                )
+            logger.info(
+                f"Spent ${round(total_cost_manager.current_usage, 2)} on {sum(a.research_reports_run for a in allocations)} research reports across {len(questions)} questions"
+            )
+
+        reports: list[ForecastReport] = []
+        for allocation in allocations:
+            if len(allocation.research_with_predictions_units) == 0:
+                logger.error(
+                    f"No research reports succeeded for question {allocation.question.page_url}"
+                )
+                continue
+            reports.append(
+                await self._create_report(
+                    allocation.question,
+                    allocation.research_with_predictions_units,
+                    allocation.cost,
+                    allocation.seconds_spent / 60,
+                )
+            )
+        return reports
+
+    async def _run_allocated_research_report(
+        self, allocation: QuestionAllocation
+    ) -> None:
+        allocation.research_reports_run += 1
+        self.ensemble_stats.research_reports_run += 1
+        start_time = time.time()
+        question_seconds_left = (
+            max(
+                self.question_time_limit_in_minutes * 60
+                - allocation.seconds_spent,
+                0,
+            )
+            if self.question_time_limit_in_minutes is not None
+            else None
+        )
+        cost_manager = MonetaryCostManager()
+        try:
+            with cost_manager, Deadline(question_seconds_left):
+                Deadline.raise_error_if_passed()
+                unit = await self._research_and_make_predictions(
+                    allocation.question
+                )
+            allocation.research_with_predictions_units.append(unit)
+        finally:
+            allocation.cost += cost_manager.current_usage
+            allocation.seconds_spent += time.time() - start_time
+
     async def _research_and_make_predictions(
         self, question: MetaculusQuestion
     ) -> ResearchWithPredictions:
-        research = await self.run_research(question)
-        summary_report = await self.summarize_research(question, research)
+        research, summary_report = await self._get_research_and_summary(
+            question
+        )
         research_to_use = (
             research
             if self.use_research_summary_to_forecast
@@ -204,18 +483,18 @@ class ForecastBot(ABC):
         else:
             raise ValueError(f"Unknown question type: {type(question)}")
 
-        tasks = cast(
-            list[Coroutine[Any, Any, ReasonedPrediction[Any]]],
-            [
-                forecast_function(question, research_to_use)
-                for _ in range(self.predictions_per_research_report)
+        reasoned_predictions, predictions_run = await self._run_ensemble(
+            lambda: cast(
+                Coroutine[Any, Any, ReasonedPrediction[Any]],
+                forecast_function(question, research_to_use),
+            ),
+            self.predictions_per_research_report,
+            lambda predictions: [
+                prediction.prediction_value for prediction in predictions
             ],
+            question,
         )
-        reasoned_predictions, _ = (
-            async_batching.run_coroutines_while_removing_and_logging_exceptions(
-                tasks
-            )
-        )
+        self.ensemble_stats.predictions_run += predictions_run
         if len(reasoned_predictions) == 0:
             raise ValueError("All predictions failed")
 
@@ -225,6 +504,121 @@ class ForecastBot(ABC):
             predictions=reasoned_predictions,
         )
 
+    async def _get_research_and_summary(
+        self, question: MetaculusQuestion
+    ) -> tuple[str, str]:
+        store = self.research_store
+        if store is None:
+            research = await self.run_research(question)
+            return research, await self.summarize_research(question, research)
+
+        store.stats.lookups += 1
+        used_ids = self.__stored_research_used.setdefault(
+            store.get_question_key(question), set()
+        )
+        for stored in store.get_fresh_research(question):
+            if stored.store_id not in used_ids:
+                used_ids.add(cast(int, stored.store_id))
+                store.stats.reused += 1
+                return stored.research_report, stored.summary_report
+
+        research_to_top_up = next(
+            (
+                stored
+                for stored in store.get_research_to_top_up(question)
+                if stored.store_id not in used_ids
+            ),
+            None,
+        )
+        search_quotes: list[StoredSearchQuote] = []
+        with SearchQuoteRecorder() as quote_recorder:
+            top_up = None
+            if research_to_top_up is not None:
+                used_ids.add(cast(int, research_to_top_up.store_id))
+                top_up = await self.run_research_top_up(
+                    question, research_to_top_up.created_at
+                )
+            if research_to_top_up is not None and top_up is not None:
+                research = f"{research_to_top_up.research_report}\n\n## News since {research_to_top_up.created_at.strftime('%Y-%m-%d %H:%M')}\n{top_up}"
+                search_quotes.extend(research_to_top_up.search_quotes)
+                store.stats.topped_up += 1
+            else:
+                research = await self.run_research(question)
+                store.stats.researched_from_scratch += 1
+        search_quotes.extend(
+            StoredSearchQuote.from_highlight_quote(quote)
+            for quote in quote_recorder.quotes
+        )
+        summary_report = await self.summarize_research(question, research)
+        stored = store.save_research(
+            StoredResearch(
+                question_key=store.get_question_key(question),
+                research_report=research,
+                summary_report=summary_report,
+                search_quotes=search_quotes,
+                researched_by=self.__class__.__name__,
+            )
+        )
+        used_ids.add(cast(int, stored.store_id))
+        return research, summary_report
+
+    async def _run_ensemble(
+        self,
+        create_coroutine: Callable[[], Coroutine[Any, Any, T]],
+        max_size: int,
+        get_prediction_values: Callable[[list[T]], list[Any]],
+        question: MetaculusQuestion,
+    ) -> tuple[list[T], int]:
+        """
+        Runs up to max_size coroutines and returns the results that did not
+        error along with how many coroutines were run. See __init__ for how
+        early stopping works.
+        """
+        if self.early_stopping_tolerance is None:
+            results, _ = (
+                async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                    [create_coroutine() for _ in range(max_size)]
+                )
+            )
+            return results, max_size
+
+        report_type = ReportOrganizer.get_report_type_for_question_type(
+            type(question)
+        )
+        results: list[T] = []
+        previous_aggregate: Any | None = None
+        number_launched = 0
+        while number_launched < max_size and not Deadline.has_passed():
+            wave_size = min(
+                self.ensemble_wave_size, max_size - number_launched
+            )
+            wave_results, _ = (
+                async_batching.run_coroutines_while_removing_and_logging_exceptions(
+                    [create_coroutine() for _ in range(wave_size)]
+                )
+            )
+            number_launched += wave_size
+            results.extend(wave_results)
+            prediction_values = get_prediction_values(results)
+            if len(prediction_values) == 0:
+                continue
+            aggregate = await report_type.aggregate_predictions(
+                prediction_values, question
+            )
+            if (
+                previous_aggregate is not None
+                and report_type.calculate_prediction_difference(
+                    aggregate, previous_aggregate
+                )
+                <= self.early_stopping_tolerance
+            ):
+                logger.info(
+                    f"Ensemble stabilised after {number_launched} of {max_size} runs"
+                )
+                break
+            previous_aggregate = aggregate
+        return results, number_launched
+
     @abstractmethod
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
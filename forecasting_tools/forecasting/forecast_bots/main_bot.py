@@ -5,6 +5,10 @@ from forecasting_tools.ai_models.gpt4o import Gpt4o
 from forecasting_tools.forecasting.forecast_bots.template_bot import (
     TemplateBot,
 )
+from forecasting_tools.forecasting.helpers.report_analytics_store import (
+    ReportAnalyticsStore,
+)
+from forecasting_tools.forecasting.helpers.research_store import ResearchStore
 from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
     ReasonedPrediction,
 )
@@ -31,6 +35,13 @@ class MainBot(TemplateBot):
         number_of_background_questions_to_ask: int = 5,
         number_of_base_rate_questions_to_ask: int = 5,
         number_of_base_rates_to_do_deep_research_on: int = 0,
+        question_time_limit_in_minutes: float | None = None,
+        early_stopping_tolerance: float | None = None,
+        ensemble_wave_size: int = 2,
+        total_budget_in_dollars: float | None = None,
+        total_time_limit_in_minutes: float | None = None,
+        research_store: ResearchStore | None = None,
+        analytics_store: ReportAnalyticsStore | None = None,
     ) -> None:
         super().__init__(
             research_reports_per_question=research_reports_per_question,
@@ -39,6 +50,13 @@ class MainBot(TemplateBot):
             publish_reports_to_metaculus=publish_reports_to_metaculus,
             folder_to_save_reports_to=folder_to_save_reports_to,
             skip_previously_forecasted_questions=skip_previously_forecasted_questions,
+            question_time_limit_in_minutes=question_time_limit_in_minutes,
+            early_stopping_tolerance=early_stopping_tolerance,
+            ensemble_wave_size=ensemble_wave_size,
+            total_budget_in_dollars=total_budget_in_dollars,
+            total_time_limit_in_minutes=total_time_limit_in_minutes,
+            research_store=research_store,
+            analytics_store=analytics_store,
         )
         self.number_of_background_questions_to_ask = (
             number_of_background_questions_to_ask
@@ -76,7 +94,7 @@ class MainBot(TemplateBot):
         assert isinstance(
             question, BinaryQuestion
         ), "Question must be a BinaryQuestion"
-        prompt = clean_indents(
+        cacheable_prefix = clean_indents(
             f"""
             You are a professional forecaster interviewing for a job.
             Your interview question is:
@@ -97,8 +115,6 @@ class MainBot(TemplateBot):
             {research}
             ```
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
-
 
             Before answering you write:
             (a) The time left until the outcome to the question is known.
@@ -112,7 +128,10 @@ class MainBot(TemplateBot):
             You write your rationale and then the last thing you write is your final answer as: "Probability: ZZ%", 0-100
             """
         )
-        gpt_forecast = await self.FINAL_DECISION_LLM.invoke(prompt)
+        gpt_forecast = await self.FINAL_DECISION_LLM.invoke(
+            f"Today is {datetime.now().strftime('%Y-%m-%d')}.",
+            cacheable_prefix=cacheable_prefix,
+        )
         prediction = self._extract_forecast_from_binary_rationale(
             gpt_forecast, max_prediction=0.95, min_prediction=0.05
         )
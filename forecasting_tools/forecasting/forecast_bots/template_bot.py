@@ -4,6 +4,10 @@ import re
 from datetime import datetime
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.backend_router import (
+    BackendRouter,
+    RoutedBackend,
+)
 from forecasting_tools.ai_models.gpt4o import Gpt4o
 from forecasting_tools.ai_models.metaculus4o import Gpt4oMetaculusProxy
 from forecasting_tools.ai_models.perplexity import Perplexity
@@ -33,21 +37,41 @@ logger = logging.getLogger(__name__)
 
 
 class TemplateBot(ForecastBot):
-    FINAL_DECISION_LLM = (
-        Gpt4oMetaculusProxy(temperature=0.7)
-        if os.getenv("METACULUS_TOKEN")
-        else Gpt4o(temperature=0.7)
+    FINAL_DECISION_LLM = BackendRouter(
+        [
+            RoutedBackend(
+                "metaculus_proxy",
+                Gpt4oMetaculusProxy(temperature=0.7),
+                is_configured=lambda: bool(os.getenv("METACULUS_TOKEN")),
+            ),
+            RoutedBackend("openai", Gpt4o(temperature=0.7)),
+        ]
+    )
+    RESEARCHER = BackendRouter(
+        [
+            RoutedBackend(
+                "perplexity",
+                Perplexity(
+                    system_prompt=clean_indents(
+                        """
+                        You are an assistant to a superforecaster.
+                        The superforecaster will give you a question they intend to forecast on.
+                        To be a great assistant, you generate a concise but detailed rundown of the most relevant news, including if the question would resolve Yes or No based on current information.
+                        You do not produce forecasts yourself.
+                        """
+                    )
+                ),
+                is_configured=lambda: bool(os.getenv("PERPLEXITY_API_KEY")),
+            ),
+            RoutedBackend(
+                "smart_searcher",
+                SmartSearcher(),
+                is_configured=lambda: bool(os.getenv("EXA_API_KEY")),
+            ),
+        ]
     )
 
     async def run_research(self, question: MetaculusQuestion) -> str:
-        system_prompt = clean_indents(
-            """
-            You are an assistant to a superforecaster.
-            The superforecaster will give you a question they intend to forecast on.
-            To be a great assistant, you generate a concise but detailed rundown of the most relevant news, including if the question would resolve Yes or No based on current information.
-            You do not produce forecasts yourself.
-            """
-        )
         prompt = clean_indents(
             f"""
             Question:
@@ -60,12 +84,8 @@ class TemplateBot(ForecastBot):
             {question.background_info}
             """
         )
-        if os.getenv("PERPLEXITY_API_KEY"):
-            response = await Perplexity(system_prompt=system_prompt).invoke(
-                prompt
-            )
-        elif os.getenv("EXA_API_KEY"):
-            response = await SmartSearcher().invoke(prompt)
+        if self.RESEARCHER.has_configured_backend:
+            response = await self.RESEARCHER.invoke(prompt)
         else:
             logger.error(
                 "No API keys for searching the web. Skipping research and setting it blank."
@@ -73,10 +93,29 @@ class TemplateBot(ForecastBot):
             response = ""
         return response
 
+    async def run_research_top_up(
+        self, question: MetaculusQuestion, since: datetime
+    ) -> str | None:
+        if not self.RESEARCHER.has_configured_backend:
+            return None
+        prompt = clean_indents(
+            f"""
+            Question:
+            {question.question_text}
+
+            {question.resolution_criteria}
+
+            {question.fine_print}
+
+            Only report news published after {since.strftime("%Y-%m-%d %H:%M")}. Say so if there is none.
+            """
+        )
+        return await self.RESEARCHER.invoke(prompt)
+
     async def _run_forecast_on_binary(
         self, question: BinaryQuestion, research: str
     ) -> ReasonedPrediction[float]:
-        prompt = clean_indents(
+        cacheable_prefix = clean_indents(
             f"""
             You are a professional forecaster interviewing for a job.
 
@@ -96,8 +135,6 @@ class TemplateBot(ForecastBot):
             Your research assistant says:
             {research}
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
-
             Before answering you write:
             (a) The time left until the outcome to the question is known.
             (b) The status quo outcome if nothing changed.
@@ -109,7 +146,10 @@ class TemplateBot(ForecastBot):
             The last thing you write is your final answer as: "Probability: ZZ%", 0-100
             """
         )
-        reasoning = await self.FINAL_DECISION_LLM.invoke(prompt)
+        reasoning = await self.FINAL_DECISION_LLM.invoke(
+            f"Today is {datetime.now().strftime('%Y-%m-%d')}.",
+            cacheable_prefix=cacheable_prefix,
+        )
         prediction = self._extract_forecast_from_binary_rationale(
             reasoning, max_prediction=1, min_prediction=0
         )
@@ -120,7 +160,7 @@ class TemplateBot(ForecastBot):
     async def _run_forecast_on_multiple_choice(
         self, question: MultipleChoiceQuestion, research: str
     ) -> ReasonedPrediction[PredictedOptionList]:
-        prompt = clean_indents(
+        cacheable_prefix = clean_indents(
             f"""
             You are a professional forecaster interviewing for a job.
 
@@ -141,8 +181,6 @@ class TemplateBot(ForecastBot):
             Your research assistant says:
             {research}
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
-
             Before answering you write:
             (a) The time left until the outcome to the question is known.
             (b) The status quo outcome if nothing changed.
@@ -157,7 +195,10 @@ class TemplateBot(ForecastBot):
             Option_N: Probability_N
             """
         )
-        reasoning = await self.FINAL_DECISION_LLM.invoke(prompt)
+        reasoning = await self.FINAL_DECISION_LLM.invoke(
+            f"Today is {datetime.now().strftime('%Y-%m-%d')}.",
+            cacheable_prefix=cacheable_prefix,
+        )
         prediction = self._extract_forecast_from_multiple_choice_rationale(
             reasoning, question.options
         )
@@ -181,7 +222,7 @@ class TemplateBot(ForecastBot):
                 f"The outcome can not be lower than {question.lower_bound}."
             )
 
-        prompt = clean_indents(
+        cacheable_prefix = clean_indents(
             f"""
             You are a professional forecaster interviewing for a job.
 
@@ -199,8 +240,6 @@ class TemplateBot(ForecastBot):
             Your research assistant says:
             {research}
 
-            Today is {datetime.now().strftime("%Y-%m-%d")}.
-
             {lower_bound_message}
             {upper_bound_message}
 
@@ -225,7 +264,10 @@ class TemplateBot(ForecastBot):
             "
             """
         )
-        reasoning = await self.FINAL_DECISION_LLM.invoke(prompt)
+        reasoning = await self.FINAL_DECISION_LLM.invoke(
+            f"Today is {datetime.now().strftime('%Y-%m-%d')}.",
+            cacheable_prefix=cacheable_prefix,
+        )
         prediction = self._extract_forecast_from_numeric_rationale(
             reasoning, question
         )
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+import os
+import random
+import sqlite3
+from datetime import datetime
+
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    BinaryQuestion,
+    MetaculusQuestion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkSnapshotStore:
+    """
+    Versioned, frozen sets of benchmark questions saved in SQLite. A
+    snapshot keeps each question as it was when the snapshot was made
+    (including the community prediction at that time), so benchmarks run
+    weeks apart on the same version use exactly the same questions.
+
+    Questions are indexed by type, forecaster count and scheduled resolve
+    date, and sampling with the same seed, filters and version always
+    returns the same questions.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        self.database_path = database_path
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        self.__connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                version TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS snapshot_questions (
+                version TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                question_type TEXT NOT NULL,
+                num_forecasters INTEGER,
+                scheduled_resolution_time TEXT,
+                question_json TEXT NOT NULL,
+                PRIMARY KEY (version, position)
+            );
+            CREATE INDEX IF NOT EXISTS snapshot_questions_by_filters
+            ON snapshot_questions (
+                version,
+                question_type,
+                num_forecasters,
+                scheduled_resolution_time
+            );
+            """
+        )
+        self.__connection.commit()
+
+    def create_snapshot_from_metaculus(
+        self, version: str | None = None
+    ) -> str:
+        questions = MetaculusApi.get_all_benchmark_candidate_questions()
+        return self.create_snapshot(questions, version)
+
+    def create_snapshot(
+        self, questions: list[MetaculusQuestion], version: str | None = None
+    ) -> str:
+        version = version or datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        assert (
+            version not in self.get_versions()
+        ), f"Snapshot version {version} already exists"
+        sorted_questions = sorted(
+            questions,
+            key=lambda question: (
+                question.id_of_post,
+                question.id_of_question or 0,
+            ),
+        )
+        self.__connection.execute(
+            "INSERT INTO snapshots (version, created_at) VALUES (?, ?)",
+            (version, datetime.now().isoformat()),
+        )
+        self.__connection.executemany(
+            "INSERT INTO snapshot_questions (version, position, question_type, num_forecasters, scheduled_resolution_time, question_json) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    version,
+                    position,
+                    question.get_api_type_name(),
+                    question.num_forecasters,
+                    (
+                        question.scheduled_resolution_time.isoformat()
+                        if question.scheduled_resolution_time
+                        else None
+                    ),
+                    question.model_copy(
+                        update={"api_json": {}}
+                    ).model_dump_json(),
+                )
+                for position, question in enumerate(sorted_questions)
+            ],
+        )
+        self.__connection.commit()
+        logger.info(
+            f"Saved benchmark snapshot {version} with {len(questions)} questions"
+        )
+        return version
+
+    def get_versions(self) -> list[str]:
+        rows = self.__connection.execute(
+            "SELECT version FROM snapshots ORDER BY created_at, rowid"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_latest_version(self) -> str | None:
+        versions = self.get_versions()
+        return versions[-1] if versions else None
+
+    def sample_questions(
+        self,
+        num_questions: int,
+        random_seed: int,
+        version: str | None = None,
+        question_type: type[MetaculusQuestion] = BinaryQuestion,
+        min_forecasters: int | None = None,
+        resolves_before: datetime | None = None,
+    ) -> list[MetaculusQuestion]:
+        version = version or self.get_latest_version()
+        if version is None:
+            raise ValueError("There are no benchmark snapshots saved")
+        conditions = ["version = ?", "question_type = ?"]
+        params: list = [version, question_type.get_api_type_name()]
+        if min_forecasters is not None:
+            conditions.append("num_forecasters >= ?")
+            params.append(min_forecasters)
+        if resolves_before is not None:
+            conditions.append("scheduled_resolution_time < ?")
+            params.append(resolves_before.isoformat())
+        matching_positions = [
+            row[0]
+            for row in self.__connection.execute(
+                f"SELECT position FROM snapshot_questions WHERE {' AND '.join(conditions)} ORDER BY position",
+                params,
+            ).fetchall()
+        ]
+        if len(matching_positions) < num_questions:
+            raise ValueError(
+                f"Snapshot {version} only has {len(matching_positions)} matching questions, but {num_questions} were requested"
+            )
+        sampled_positions = random.Random(random_seed).sample(
+            matching_positions, num_questions
+        )
+        rows = self.__connection.execute(
+            f"SELECT position, question_json FROM snapshot_questions WHERE version = ? AND position IN ({','.join('?' * num_questions)})",
+            [version, *sampled_positions],
+        ).fetchall()
+        question_jsons = dict(rows)
+        return [
+            question_type.model_validate_json(question_jsons[position])
+            for position in sampled_positions
+        ]
+
+    def close(self) -> None:
+        self.__connection.close()
@@ -1,13 +1,32 @@
+import asyncio
+import contextlib
+import logging
+import os
 import subprocess
+import tempfile
 from datetime import datetime
 from typing import Literal
 
+import numpy as np
 import typeguard
+from pydantic import BaseModel
 
+from forecasting_tools.ai_models.ai_utils.openai_batcher import OpenAiBatcher
 from forecasting_tools.forecasting.forecast_bots.forecast_bot import (
     ForecastBot,
 )
+from forecasting_tools.forecasting.helpers.benchmark_snapshot_store import (
+    BenchmarkSnapshotStore,
+)
+from forecasting_tools.forecasting.helpers.forecast_scorer import (
+    ForecastScorer,
+    ScoreSummary,
+)
 from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.helpers.report_analytics_store import (
+    ReportAnalyticsStore,
+)
+from forecasting_tools.forecasting.helpers.research_store import ResearchStore
 from forecasting_tools.forecasting.questions_and_reports.binary_report import (
     BinaryReport,
 )
@@ -15,6 +34,22 @@ from forecasting_tools.forecasting.questions_and_reports.questions import (
     MetaculusQuestion,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class BotComparison(BaseModel):
+    bot_name: str
+    average_expected_log_score: float
+    score_difference_to_baseline: ScoreSummary | None
+    fraction_of_questions_beating_baseline: float | None
+
+
+class HeadToHeadResult(BaseModel):
+    baseline_bot_name: str
+    questions_compared: int
+    research_reports_run: int
+    comparisons: list[BotComparison]
+
 
 class Benchmarker:
 
@@ -26,8 +61,24 @@ class Benchmarker:
             Literal["shallow", "medium", "deep"] | int
         ),
         file_path_to_save_reports: str = "logs/forecasts/benchmarks/",
+        use_batch_api: bool = False,
+        snapshot_store: BenchmarkSnapshotStore | None = None,
+        snapshot_version: str | None = None,
+        analytics_store: ReportAnalyticsStore | None = None,
     ) -> float:
         """
+        If use_batch_api is True, OpenAI calls are sent as discounted batch
+        jobs (see OpenAiBatcher), which is cheaper but can take hours.
+
+        If a snapshot store is given, questions are sampled from the given
+        snapshot version (or the latest one) instead of being fetched from
+        Metaculus, so results are comparable across runs. A snapshot is made
+        first if the store has none.
+
+        If an analytics store is given, the reports are added to it with a
+        run name holding the git commit. Don't also give the store to the
+        bot, or the reports are added twice.
+
         Below are the conclusions of a rough (and potentially flawed) simulation of tournaments and skill levels
         to help with choosing sample sizes. See https://chatgpt.com/share/3fbc8106-829d-4fb3-a9e6-af0badf266df
 
@@ -50,28 +101,45 @@ class Benchmarker:
         TODO: Incorporate the following analysis which is more rigorous. TLDR the numbers above are probably wrong: https://forum.effectivealtruism.org/posts/DzqSh7akX28JEHf9H/comparing-two-forecasters-in-an-ideal-world
         """
 
-        if isinstance(number_of_questions_to_test, int):
-            num_questions_to_benchmark_on = number_of_questions_to_test
-        elif number_of_questions_to_test == "shallow":
-            num_questions_to_benchmark_on = 10
-        elif number_of_questions_to_test == "medium":
-            num_questions_to_benchmark_on = 30
-        elif number_of_questions_to_test == "deep":
-            num_questions_to_benchmark_on = 100
-
-        questions = MetaculusApi.get_benchmark_questions(
-            num_questions_to_benchmark_on,
-            random_seed=42,
-            # Choose a random seed so all benchmarks in a similar time period use the same questions
+        questions = cls.__get_benchmark_questions(
+            number_of_questions_to_test, snapshot_store, snapshot_version
         )
-        assert len(questions) == num_questions_to_benchmark_on
-        questions = typeguard.check_type(questions, list[MetaculusQuestion])
-        reports = await forecast_bot.forecast_questions(questions)
+        with (
+            OpenAiBatcher() if use_batch_api else contextlib.nullcontext()
+        ) as batcher:
+            reports = await forecast_bot.forecast_questions(questions)
+        if batcher is not None:
+            logger.info(
+                f"Batch API saved ${round(batcher.stats.cost_saved, 2)} over {batcher.stats.requests_submitted} requests"
+            )
         reports = typeguard.check_type(reports, list[BinaryReport])
+        stats = forecast_bot.ensemble_stats
+        logger.info(
+            f"Benchmark read {round(forecast_bot.prompt_cache_stats.cached_token_ratio * 100, 1)}% of prompt tokens from prompt caches"
+        )
+        if forecast_bot.research_store is not None:
+            logger.info(
+                f"Benchmark reused {round(forecast_bot.research_store.stats.reuse_rate * 100, 1)}% of research reports from the research store"
+            )
+        logger.info(
+            f"Benchmark ran {stats.research_reports_run}/{stats.research_reports_in_fixed_ensemble} research reports and {stats.predictions_run}/{stats.predictions_in_fixed_ensemble} predictions compared to a fixed size ensemble ({stats.calls_saved} calls saved)"
+        )
         average_deviation_score = (
             BinaryReport.calculate_average_expected_log_score(reports)
         )
         rounded_score = round(average_deviation_score, 4)
+        predictions, community_predictions = (
+            BinaryReport.get_prediction_arrays(reports)
+        )
+        score_summary = ForecastScorer.bootstrap_mean(
+            ForecastScorer.binary_expected_log_scores(
+                predictions, community_predictions
+            ),
+            random_seed=42,
+        )
+        logger.info(
+            f"Benchmark expected log score is {rounded_score} (95% CI {round(score_summary.lower_bound, 4)} to {round(score_summary.upper_bound, 4)})"
+        )
 
         git_hash = cls.__get_git_commit_hash()
         if not file_path_to_save_reports.endswith("/"):
@@ -86,8 +154,200 @@ class Benchmarker:
         BinaryReport.save_object_list_to_file_path(
             reports, file_path_to_save_reports
         )
+        if analytics_store is not None:
+            analytics_store.add_reports(
+                reports,  # type: ignore
+                bot_name=forecast_bot.__class__.__name__,
+                run_name=f"benchmark__git_{git_hash}",
+            )
         return average_deviation_score
 
+    @classmethod
+    async def benchmark_head_to_head(
+        cls,
+        forecast_bots: list[ForecastBot],
+        number_of_questions_to_test: (
+            Literal["shallow", "medium", "deep"] | int
+        ),
+        bot_names: list[str] | None = None,
+        file_path_to_save_reports: str = "logs/forecasts/benchmarks/",
+        snapshot_store: BenchmarkSnapshotStore | None = None,
+        snapshot_version: str | None = None,
+    ) -> HeadToHeadResult:
+        """
+        Compares bots on the same questions while researching each question
+        only once. The first bot researches every question into a shared
+        research store (as many reports as the most demanding bot uses),
+        then all bots forecast concurrently from that research. Bots are
+        scored against the first bot on the questions they all forecasted,
+        using paired differences in expected log score (lower is better)
+        with a bootstrap confidence interval.
+        """
+        assert len(forecast_bots) > 1, "Need at least two bots to compare"
+        bot_names = bot_names or [
+            f"{i}_{bot.__class__.__name__}"
+            for i, bot in enumerate(forecast_bots)
+        ]
+        assert len(set(bot_names)) == len(
+            forecast_bots
+        ), "Each bot needs a unique name"
+        questions = cls.__get_benchmark_questions(
+            number_of_questions_to_test, snapshot_store, snapshot_version
+        )
+        original_research_stores = [
+            bot.research_store for bot in forecast_bots
+        ]
+        with tempfile.TemporaryDirectory() as research_directory:
+            shared_research_store = ResearchStore(
+                os.path.join(research_directory, "research.db")
+            )
+            try:
+                for bot in forecast_bots:
+                    bot.research_store = shared_research_store
+                await forecast_bots[0].prepare_research(
+                    questions,
+                    max(
+                        bot.research_reports_per_question
+                        for bot in forecast_bots
+                    ),
+                )
+                reports_per_bot = await asyncio.gather(
+                    *[
+                        bot.forecast_questions(questions)
+                        for bot in forecast_bots
+                    ]
+                )
+            finally:
+                for bot, research_store in zip(
+                    forecast_bots, original_research_stores
+                ):
+                    bot.research_store = research_store
+                research_reports_run = (
+                    shared_research_store.stats.researched_from_scratch
+                )
+                shared_research_store.close()
+
+        git_hash = cls.__get_git_commit_hash()
+        if not file_path_to_save_reports.endswith("/"):
+            file_path_to_save_reports += "/"
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        for bot_name, reports in zip(bot_names, reports_per_bot):
+            BinaryReport.save_object_list_to_file_path(
+                reports,
+                f"{file_path_to_save_reports}{timestamp}__head_to_head__{bot_name}__git_{git_hash}__.json",
+            )
+        result = cls.__compare_reports(
+            bot_names,
+            [
+                typeguard.check_type(reports, list[BinaryReport])
+                for reports in reports_per_bot
+            ],
+            research_reports_run,
+        )
+        for comparison in result.comparisons:
+            logger.info(
+                f"{comparison.bot_name} scored {round(comparison.average_expected_log_score, 4)} over {result.questions_compared} questions"
+                + (
+                    f" ({round(comparison.score_difference_to_baseline.mean, 4)} vs {result.baseline_bot_name}, 95% CI {round(comparison.score_difference_to_baseline.lower_bound, 4)} to {round(comparison.score_difference_to_baseline.upper_bound, 4)})"
+                    if comparison.score_difference_to_baseline is not None
+                    else ""
+                )
+            )
+        return result
+
+    @classmethod
+    def __compare_reports(
+        cls,
+        bot_names: list[str],
+        reports_per_bot: list[list[BinaryReport]],
+        research_reports_run: int,
+    ) -> HeadToHeadResult:
+        reports_by_post_per_bot = [
+            {report.question.id_of_post: report for report in reports}
+            for reports in reports_per_bot
+        ]
+        shared_post_ids = sorted(
+            set.intersection(
+                *[set(reports) for reports in reports_by_post_per_bot]
+            )
+        )
+        if not shared_post_ids:
+            raise ValueError("No question was forecasted by every bot")
+        scores_per_bot = [
+            ForecastScorer.binary_expected_log_scores(
+                *BinaryReport.get_prediction_arrays(
+                    [reports_by_post[post_id] for post_id in shared_post_ids]
+                )
+            )
+            for reports_by_post in reports_by_post_per_bot
+        ]
+        baseline_scores = scores_per_bot[0]
+        comparisons = []
+        for i, (bot_name, scores) in enumerate(zip(bot_names, scores_per_bot)):
+            is_baseline = i == 0
+            comparisons.append(
+                BotComparison(
+                    bot_name=bot_name,
+                    average_expected_log_score=float(scores.mean()),
+                    score_difference_to_baseline=(
+                        None
+                        if is_baseline
+                        else ForecastScorer.bootstrap_mean(
+                            scores - baseline_scores, random_seed=42
+                        )
+                    ),
+                    fraction_of_questions_beating_baseline=(
+                        None
+                        if is_baseline
+                        else float(np.mean(scores < baseline_scores))
+                    ),
+                )
+            )
+        return HeadToHeadResult(
+            baseline_bot_name=bot_names[0],
+            questions_compared=len(shared_post_ids),
+            research_reports_run=research_reports_run,
+            comparisons=comparisons,
+        )
+
+    @classmethod
+    def __get_benchmark_questions(
+        cls,
+        number_of_questions_to_test: (
+            Literal["shallow", "medium", "deep"] | int
+        ),
+        snapshot_store: BenchmarkSnapshotStore | None,
+        snapshot_version: str | None,
+    ) -> list[MetaculusQuestion]:
+        if isinstance(number_of_questions_to_test, int):
+            num_questions_to_benchmark_on = number_of_questions_to_test
+        elif number_of_questions_to_test == "shallow":
+            num_questions_to_benchmark_on = 10
+        elif number_of_questions_to_test == "medium":
+            num_questions_to_benchmark_on = 30
+        elif number_of_questions_to_test == "deep":
+            num_questions_to_benchmark_on = 100
+
+        if snapshot_store is None:
+            questions = MetaculusApi.get_benchmark_questions(
+                num_questions_to_benchmark_on,
+                random_seed=42,
+                # Choose a random seed so all benchmarks in a similar time period use the same questions
+            )
+        else:
+            if snapshot_store.get_latest_version() is None:
+                snapshot_store.create_snapshot_from_metaculus()
+            questions = snapshot_store.sample_questions(
+                num_questions_to_benchmark_on,
+                random_seed=42,
+                version=snapshot_version,
+            )
+            logger.info(
+                f"Benchmarking on snapshot {snapshot_version or snapshot_store.get_latest_version()}"
+            )
+        assert len(questions) == num_questions_to_benchmark_on
+        return typeguard.check_type(questions, list[MetaculusQuestion])
+
     @classmethod
     def __get_git_commit_hash(cls) -> str:
         try:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from pydantic import BaseModel
+
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PublishResult(BaseModel):
+    id_of_post: int
+    id_of_question: int | None
+    prediction_posted: bool = False
+    comment_posted: bool = False
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.prediction_posted and self.comment_posted
+
+
+class BulkForecastPublisher:
+    """
+    Publishes many reports to Metaculus at once. Predictions are grouped
+    into forecast requests of up to forecasts_per_request questions, and
+    comments are posted concurrently (at most max_concurrent_requests
+    requests at a time).
+
+    If a grouped request fails, its forecasts are posted one by one so a
+    single bad forecast only fails its own report. Comments are only posted
+    for reports whose prediction went through. Failures are returned per
+    report rather than raised.
+    """
+
+    def __init__(
+        self,
+        forecasts_per_request: int = 50,
+        max_concurrent_requests: int = 10,
+    ) -> None:
+        assert forecasts_per_request > 0, "Requests must hold a forecast"
+        assert (
+            max_concurrent_requests > 0
+        ), "Must allow at least one request at a time"
+        self.forecasts_per_request = forecasts_per_request
+        self.max_concurrent_requests = max_concurrent_requests
+
+    async def publish_reports(
+        self, reports: list[ForecastReport]
+    ) -> list[PublishResult]:
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        results = [
+            PublishResult(
+                id_of_post=report.question.id_of_post,
+                id_of_question=report.question.id_of_question,
+            )
+            for report in reports
+        ]
+        payloads: dict[int, tuple[PublishResult, dict]] = {}
+        for report, result in zip(reports, results):
+            try:
+                if report.question.id_of_question is None:
+                    raise ValueError("Question ID is None")
+                if report.question.id_of_question in payloads:
+                    raise ValueError(
+                        "Another report for the same question is being published"
+                    )
+                payloads[report.question.id_of_question] = (
+                    result,
+                    report.create_forecast_payload(),
+                )
+            except Exception as e:
+                result.error = f"{e.__class__.__name__}: {e}"
+
+        question_ids = list(payloads)
+        chunks = [
+            question_ids[i : i + self.forecasts_per_request]
+            for i in range(0, len(question_ids), self.forecasts_per_request)
+        ]
+        await asyncio.gather(
+            *[
+                self.__post_chunk_of_predictions(chunk, payloads, semaphore)
+                for chunk in chunks
+            ]
+        )
+        await asyncio.gather(
+            *[
+                self.__post_comment(report, result, semaphore)
+                for report, result in zip(reports, results)
+                if result.prediction_posted
+            ]
+        )
+
+        failures = [result for result in results if not result.succeeded]
+        logger.info(
+            f"Published {len(results) - len(failures)}/{len(results)} reports"
+        )
+        for failure in failures:
+            logger.error(
+                f"Failed to publish report for post {failure.id_of_post}: {failure.error}"
+            )
+        return results
+
+    async def __post_chunk_of_predictions(
+        self,
+        question_ids: list[int],
+        payloads: dict[int, tuple[PublishResult, dict]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            async with semaphore:
+                await asyncio.to_thread(
+                    MetaculusApi.post_question_predictions,
+                    {
+                        question_id: payloads[question_id][1]
+                        for question_id in question_ids
+                    },
+                )
+            for question_id in question_ids:
+                payloads[question_id][0].prediction_posted = True
+        except Exception as e:
+            if len(question_ids) == 1:
+                payloads[question_ids[0]][
+                    0
+                ].error = f"{e.__class__.__name__}: {e}"
+                return
+            logger.warning(
+                f"Posting {len(question_ids)} predictions together failed, posting them one at a time: {e}"
+            )
+            await asyncio.gather(
+                *[
+                    self.__post_chunk_of_predictions(
+                        [question_id], payloads, semaphore
+                    )
+                    for question_id in question_ids
+                ]
+            )
+
+    async def __post_comment(
+        self,
+        report: ForecastReport,
+        result: PublishResult,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        try:
+            async with semaphore:
+                await asyncio.to_thread(
+                    MetaculusApi.post_question_comment,
+                    report.question.id_of_post,
+                    report.explanation,
+                )
+            result.comment_posted = True
+        except Exception as e:
+            result.error = f"{e.__class__.__name__}: {e}"
@@ -0,0 +1,181 @@
+import logging
+import re
+from typing import Callable
+
+from forecasting_tools.ai_models.exa_searcher import ExaHighlightQuote
+
+logger = logging.getLogger(__name__)
+
+
+class ContextPacker:
+    """
+    Chooses which search highlights go into a prompt. Overlapping highlights
+    from the same source are collapsed, then highlights are picked using
+    maximal marginal relevance until the token budget is filled. At least
+    one quote is always returned so a prompt is never left without context.
+    """
+
+    def __init__(
+        self,
+        token_budget: int,
+        count_tokens: Callable[[str], int],
+        max_quotes: int | None = None,
+        relevance_weight: float = 0.5,
+        same_source_similarity: float = 0.5,
+    ) -> None:
+        assert token_budget > 0, "Token budget must be positive"
+        assert (
+            0 <= relevance_weight <= 1
+        ), "Relevance weight must be between 0 and 1"
+        self.token_budget = token_budget
+        self.count_tokens = count_tokens
+        self.max_quotes = max_quotes
+        self.relevance_weight = relevance_weight
+        self.same_source_similarity = same_source_similarity
+
+    def pack(self, quotes: list[ExaHighlightQuote]) -> list[ExaHighlightQuote]:
+        collapsed_quotes = self.collapse_overlapping_quotes(quotes)
+        selected_quotes = self.__select_with_marginal_relevance(
+            collapsed_quotes
+        )
+        logger.info(
+            f"Packed {len(quotes)} quotes into {len(selected_quotes)} quotes ({len(collapsed_quotes)} after collapsing overlaps) using a budget of {self.token_budget} tokens"
+        )
+        return selected_quotes
+
+    def count_quote_tokens(self, quote: ExaHighlightQuote) -> int:
+        return self.count_tokens(
+            f"{quote.highlight_text} {quote.source.url} {quote.source.title}"
+        )
+
+    @classmethod
+    def collapse_overlapping_quotes(
+        cls, quotes: list[ExaHighlightQuote]
+    ) -> list[ExaHighlightQuote]:
+        """
+        Within a source, a highlight contained in another is dropped, and
+        highlights where one ends with the sentences the other starts with
+        are joined into one. The collapsed quote keeps the higher score.
+        """
+        collapsed_quotes: list[ExaHighlightQuote] = []
+        for quote in quotes:
+            for i, existing_quote in enumerate(collapsed_quotes):
+                if existing_quote.source.url != quote.source.url:
+                    continue
+                merged_text = cls.__merge_overlapping_texts(
+                    existing_quote.highlight_text, quote.highlight_text
+                )
+                if merged_text is not None:
+                    collapsed_quotes[i] = ExaHighlightQuote(
+                        highlight_text=merged_text,
+                        score=max(existing_quote.score, quote.score),
+                        source=existing_quote.source,
+                    )
+                    break
+            else:
+                collapsed_quotes.append(quote)
+        return collapsed_quotes
+
+    def __select_with_marginal_relevance(
+        self, quotes: list[ExaHighlightQuote]
+    ) -> list[ExaHighlightQuote]:
+        if len(quotes) == 0:
+            return []
+        max_score = max(quote.score for quote in quotes)
+        relevances = [
+            quote.score / max_score if max_score > 0 else 1 for quote in quotes
+        ]
+        word_sets = [self.__get_word_set(quote) for quote in quotes]
+        token_counts = [self.count_quote_tokens(quote) for quote in quotes]
+
+        remaining_budget = self.token_budget
+        selected_indices: list[int] = []
+        candidate_indices = list(range(len(quotes)))
+        while candidate_indices:
+            if (
+                self.max_quotes is not None
+                and len(selected_indices) >= self.max_quotes
+            ):
+                break
+            affordable_indices = [
+                i
+                for i in candidate_indices
+                if token_counts[i] <= remaining_budget
+            ]
+            nothing_selected_yet = len(selected_indices) == 0
+            if not affordable_indices and nothing_selected_yet:
+                affordable_indices = candidate_indices
+            elif not affordable_indices:
+                break
+            best_index = max(
+                affordable_indices,
+                key=lambda i: self.__marginal_relevance(
+                    i, relevances, word_sets, quotes, selected_indices
+                ),
+            )
+            selected_indices.append(best_index)
+            candidate_indices.remove(best_index)
+            remaining_budget -= token_counts[best_index]
+        return [quotes[i] for i in selected_indices]
+
+    def __marginal_relevance(
+        self,
+        index: int,
+        relevances: list[float],
+        word_sets: list[set[str]],
+        quotes: list[ExaHighlightQuote],
+        selected_indices: list[int],
+    ) -> float:
+        max_similarity_to_selected = max(
+            (
+                self.__similarity(index, selected_index, word_sets, quotes)
+                for selected_index in selected_indices
+            ),
+            default=0,
+        )
+        return (
+            self.relevance_weight * relevances[index]
+            - (1 - self.relevance_weight) * max_similarity_to_selected
+        )
+
+    def __similarity(
+        self,
+        index_1: int,
+        index_2: int,
+        word_sets: list[set[str]],
+        quotes: list[ExaHighlightQuote],
+    ) -> float:
+        words_1 = word_sets[index_1]
+        words_2 = word_sets[index_2]
+        union = words_1 | words_2
+        text_similarity = len(words_1 & words_2) / len(union) if union else 0
+        if quotes[index_1].source.url == quotes[index_2].source.url:
+            return max(text_similarity, self.same_source_similarity)
+        return text_similarity
+
+    @staticmethod
+    def __get_word_set(quote: ExaHighlightQuote) -> set[str]:
+        return set(re.findall(r"\w+", quote.highlight_text.lower()))
+
+    @classmethod
+    def __merge_overlapping_texts(cls, text_1: str, text_2: str) -> str | None:
+        if text_2 in text_1:
+            return text_1
+        if text_1 in text_2:
+            return text_2
+        sentences_1 = cls.__split_into_sentences(text_1)
+        sentences_2 = cls.__split_into_sentences(text_2)
+        for first, second in [
+            (sentences_1, sentences_2),
+            (sentences_2, sentences_1),
+        ]:
+            max_overlap = min(len(first), len(second))
+            for overlap in range(max_overlap, 0, -1):
+                if first[-overlap:] == second[:overlap]:
+                    return " ".join(first + second[overlap:])
+        return None
+
+    @staticmethod
+    def __split_into_sentences(text: str) -> list[str]:
+        sentences = re.split(r"(?<=[.!?])\s+", text.strip())
+        return [sentence for sentence in sentences if sentence]
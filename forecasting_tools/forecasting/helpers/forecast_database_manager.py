@@ -7,6 +7,7 @@ from forecasting_tools.forecasting.questions_and_reports.forecast_report import
 from forecasting_tools.forecasting.sub_question_researchers.base_rate_researcher import (
     BaseRateReport,
 )
+from forecasting_tools.util.coda_batch_writer import CodaBatchWriter
 from forecasting_tools.util.coda_utils import (
     CodaCell,
     CodaColumn,
@@ -68,24 +69,29 @@ class ForecastDatabaseManager:
         REPORTS_TABLE_COLUMNS,
         REPORTS_TABLE_KEY_COLUMNS,
     )
+    REPORTS_WRITER = CodaBatchWriter(REPORTS_TABLE)
 
     @staticmethod
     def add_forecast_report_to_database(
         metaculus_report: ForecastReport, run_type: ForecastRunType
     ) -> None:
+        """
+        Rows are written in the background (see CodaBatchWriter). Call
+        flush_reports_to_database to wait for them to be sent.
+        """
         metaculus_report_copy = metaculus_report.model_copy()
         coda_row = ForecastDatabaseManager._turn_report_into_coda_row(
             metaculus_report_copy, run_type
         )
         try:
-            ForecastDatabaseManager.REPORTS_TABLE.add_row_to_table(coda_row)
-        except Exception as e:
+            ForecastDatabaseManager.REPORTS_WRITER.add_row(coda_row)
+        except ValueError as e:
             logger.error(f"Error while uploading metaculus report: {e}")
             metaculus_report_copy.explanation = "ERROR while uploading to Coda"
             coda_row = ForecastDatabaseManager._turn_report_into_coda_row(
                 metaculus_report_copy, run_type
             )
-            ForecastDatabaseManager.REPORTS_TABLE.add_row_to_table(coda_row)
+            ForecastDatabaseManager.REPORTS_WRITER.add_row(coda_row)
 
     @classmethod
     def add_general_report_to_database(
@@ -111,7 +117,7 @@ class ForecastDatabaseManager:
             price_estimate,
             run_type,
         )
-        cls.REPORTS_TABLE.add_row_to_table(coda_row)
+        cls.REPORTS_WRITER.add_row(coda_row)
 
     @classmethod
     def add_base_rate_report_to_database(
@@ -120,12 +126,16 @@ class ForecastDatabaseManager:
         report_copy = report.model_copy()
         coda_row = cls._turn_report_into_coda_row(report_copy, run_type)
         try:
-            cls.REPORTS_TABLE.add_row_to_table(coda_row)
-        except Exception as e:
+            cls.REPORTS_WRITER.add_row(coda_row)
+        except ValueError as e:
             logger.error(f"Error while uploading metaculus report: {e}")
             report_copy.markdown_report = "ERROR while uploading to Coda"
             coda_row = cls._turn_report_into_coda_row(report_copy, run_type)
-            cls.REPORTS_TABLE.add_row_to_table(coda_row)
+            cls.REPORTS_WRITER.add_row(coda_row)
+
+    @classmethod
+    def flush_reports_to_database(cls) -> None:
+        cls.REPORTS_WRITER.flush()
 
     @classmethod
     def _turn_report_into_coda_row(
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import numpy as np
+from pydantic import BaseModel
+
+MIN_PROBABILITY = 1e-6
+MAX_BOOTSTRAP_BATCH_SIZE = 2_000_000
+
+
+class CalibrationBin(BaseModel):
+    lower_bound: float
+    upper_bound: float
+    count: int
+    average_prediction: float | None
+    observed_frequency: float | None
+
+
+class ScoreSummary(BaseModel):
+    mean: float
+    lower_bound: float
+    upper_bound: float
+    confidence_level: float
+    count: int
+
+
+class ForecastScorer:
+    """
+    Scores many forecasts at once using NumPy arrays (one row per forecast)
+    rather than looping over reports. Expected log scores and deviations
+    compare against community predictions, while Brier and ranked
+    probability scores compare against resolutions. All scores are
+    positive and lower is better.
+    """
+
+    @classmethod
+    def binary_expected_log_scores(
+        cls,
+        predictions: np.ndarray | list[float],
+        community_predictions: np.ndarray | list[float],
+    ) -> np.ndarray:
+        """
+        Inversed expected log score, treating the community prediction as
+        the true probability (see BinaryReport.inversed_expected_log_score)
+        """
+        p = np.asarray(predictions, dtype=float)
+        c = np.asarray(community_predictions, dtype=float)
+        return -(c * np.log2(p) + (1 - c) * np.log2(1 - p))
+
+    @classmethod
+    def binary_deviation_points(
+        cls,
+        predictions: np.ndarray | list[float],
+        community_predictions: np.ndarray | list[float],
+    ) -> np.ndarray:
+        return np.abs(
+            np.asarray(predictions, dtype=float)
+            - np.asarray(community_predictions, dtype=float)
+        )
+
+    @classmethod
+    def binary_brier_scores(
+        cls,
+        predictions: np.ndarray | list[float],
+        outcomes: np.ndarray | list[bool],
+    ) -> np.ndarray:
+        return (
+            np.asarray(predictions, dtype=float)
+            - np.asarray(outcomes, dtype=float)
+        ) ** 2
+
+    @classmethod
+    def multiple_choice_expected_log_scores(
+        cls, probabilities: np.ndarray, community_probabilities: np.ndarray
+    ) -> np.ndarray:
+        """Both arrays are shaped (forecasts, options)"""
+        p = np.clip(np.asarray(probabilities, dtype=float), MIN_PROBABILITY, 1)
+        c = np.asarray(community_probabilities, dtype=float)
+        return -np.sum(c * np.log2(p), axis=1)
+
+    @classmethod
+    def multiple_choice_deviation_points(
+        cls, probabilities: np.ndarray, community_probabilities: np.ndarray
+    ) -> np.ndarray:
+        return np.max(
+            np.abs(
+                np.asarray(probabilities, dtype=float)
+                - np.asarray(community_probabilities, dtype=float)
+            ),
+            axis=1,
+        )
+
+    @classmethod
+    def multiple_choice_brier_scores(
+        cls,
+        probabilities: np.ndarray,
+        outcome_indices: np.ndarray | list[int],
+    ) -> np.ndarray:
+        p = np.asarray(probabilities, dtype=float)
+        outcomes = np.zeros_like(p)
+        outcomes[np.arange(len(p)), np.asarray(outcome_indices)] = 1
+        return np.sum((p - outcomes) ** 2, axis=1)
+
+    @classmethod
+    def numeric_deviation_points(
+        cls, cdfs: np.ndarray, community_cdfs: np.ndarray
+    ) -> np.ndarray:
+        """Largest gap between cdfs that share an x axis"""
+        return np.max(
+            np.abs(
+                np.asarray(cdfs, dtype=float)
+                - np.asarray(community_cdfs, dtype=float)
+            ),
+            axis=1,
+        )
+
+    @classmethod
+    def numeric_ranked_probability_scores(
+        cls,
+        cdf_values: np.ndarray,
+        cdfs: np.ndarray,
+        outcomes: np.ndarray | list[float],
+    ) -> np.ndarray:
+        """
+        Mean squared distance between each cdf and the step function at its
+        resolved value. cdf_values holds the x axis of each cdf.
+        """
+        outcome_steps = np.asarray(cdf_values, dtype=float) >= np.asarray(
+            outcomes, dtype=float
+        ).reshape(-1, 1)
+        return np.mean(
+            (np.asarray(cdfs, dtype=float) - outcome_steps) ** 2, axis=1
+        )
+
+    @classmethod
+    def calibration_bins(
+        cls,
+        predictions: np.ndarray | list[float],
+        outcomes: np.ndarray | list[float],
+        num_bins: int = 10,
+    ) -> list[CalibrationBin]:
+        """
+        Groups predictions into equal width bins and compares the average
+        prediction in each bin to how often it came true. Outcomes can also
+        be community predictions to see calibration against the community.
+        """
+        p = np.asarray(predictions, dtype=float)
+        o = np.asarray(outcomes, dtype=float)
+        edges = np.linspace(0, 1, num_bins + 1)
+        bin_indices = np.clip(np.digitize(p, edges) - 1, 0, num_bins - 1)
+        counts = np.bincount(bin_indices, minlength=num_bins)
+        prediction_sums = np.bincount(
+            bin_indices, weights=p, minlength=num_bins
+        )
+        outcome_sums = np.bincount(bin_indices, weights=o, minlength=num_bins)
+        return [
+            CalibrationBin(
+                lower_bound=float(edges[i]),
+                upper_bound=float(edges[i + 1]),
+                count=int(counts[i]),
+                average_prediction=(
+                    float(prediction_sums[i] / counts[i])
+                    if counts[i]
+                    else None
+                ),
+                observed_frequency=(
+                    float(outcome_sums[i] / counts[i]) if counts[i] else None
+                ),
+            )
+            for i in range(num_bins)
+        ]
+
+    @classmethod
+    def bootstrap_mean(
+        cls,
+        scores: np.ndarray | list[float],
+        confidence_level: float = 0.95,
+        num_resamples: int = 2000,
+        random_seed: int | None = None,
+    ) -> ScoreSummary:
+        """
+        Mean score with a bootstrap confidence interval. To compare two bots
+        on the same questions, pass the difference of their scores.
+        """
+        values = np.asarray(scores, dtype=float)
+        if len(values) == 0:
+            raise ValueError("Cannot summarize an empty list of scores")
+        random_generator = np.random.default_rng(random_seed)
+        resamples_per_batch = max(1, MAX_BOOTSTRAP_BATCH_SIZE // len(values))
+        resampled_means = np.concatenate(
+            [
+                values[
+                    random_generator.integers(
+                        0,
+                        len(values),
+                        size=(
+                            min(resamples_per_batch, num_resamples - start),
+                            len(values),
+                        ),
+                    )
+                ].mean(axis=1)
+                for start in range(0, num_resamples, resamples_per_batch)
+            ]
+        )
+        tail = (1 - confidence_level) / 2
+        lower_bound, upper_bound = np.quantile(
+            resampled_means, [tail, 1 - tail]
+        )
+        return ScoreSummary(
+            mean=float(values.mean()),
+            lower_bound=float(lower_bound),
+            upper_bound=float(upper_bound),
+            confidence_level=confidence_level,
+            count=len(values),
+        )
@@ -63,11 +63,7 @@ class MetaculusApi:
         cls, question_id: int, prediction_in_decimal: float
     ) -> None:
         logger.info(f"Posting prediction on question {question_id}")
-        if prediction_in_decimal < 0.01 or prediction_in_decimal > 0.99:
-            raise ValueError("Prediction value must be between 0.001 and 0.99")
-        payload = {
-            "probability_yes": prediction_in_decimal,
-        }
+        payload = cls.create_binary_prediction_payload(prediction_in_decimal)
         cls._post_question_prediction(question_id, payload)
 
     @classmethod
@@ -80,15 +76,7 @@ class MetaculusApi:
         In this case we use the cdf.
         """
         logger.info(f"Posting prediction on question {question_id}")
-        if len(cdf_values) != 201:
-            raise ValueError("CDF must contain exactly 201 values")
-        if not all(0 <= x <= 1 for x in cdf_values):
-            raise ValueError("All CDF values must be between 0 and 1")
-        if not all(a <= b for a, b in zip(cdf_values, cdf_values[1:])):
-            raise ValueError("CDF values must be monotonically increasing")
-        payload = {
-            "continuous_cdf": cdf_values,
-        }
+        payload = cls.create_numeric_prediction_payload(cdf_values)
         cls._post_question_prediction(question_id, payload)
 
     @classmethod
@@ -99,15 +87,19 @@ class MetaculusApi:
         If the question is multiple choice, forecast must be a dictionary that
         maps question.options labels to floats.
         """
-        payload = {
-            "probability_yes_per_category": options_with_probabilities,
-        }
+        payload = cls.create_multiple_choice_prediction_payload(
+            options_with_probabilities
+        )
         cls._post_question_prediction(question_id, payload)
 
     @classmethod
-    def _post_question_prediction(
-        cls, question_id: int, forecast_payload: dict
+    def post_question_predictions(
+        cls, payloads_by_question_id: dict[int, dict]
     ) -> None:
+        """
+        Posts forecasts on many questions in one request. Payloads come from
+        the create_*_prediction_payload methods.
+        """
         url = f"{cls.API_BASE_URL}/questions/forecast/"
         response = requests.post(
             url,
@@ -115,13 +107,54 @@ class MetaculusApi:
                 {
                     "question": question_id,
                     **forecast_payload,
-                },
+                }
+                for question_id, forecast_payload in payloads_by_question_id.items()
             ],
             **cls.__get_auth_headers(),  # type: ignore
         )
-        logger.info(f"Posted prediction on question {question_id}")
+        logger.info(
+            f"Posted predictions on questions {list(payloads_by_question_id)}"
+        )
         raise_for_status_with_additional_info(response)
 
+    @classmethod
+    def create_binary_prediction_payload(
+        cls, prediction_in_decimal: float
+    ) -> dict:
+        if prediction_in_decimal < 0.01 or prediction_in_decimal > 0.99:
+            raise ValueError("Prediction value must be between 0.001 and 0.99")
+        return {
+            "probability_yes": prediction_in_decimal,
+        }
+
+    @classmethod
+    def create_numeric_prediction_payload(
+        cls, cdf_values: list[float]
+    ) -> dict:
+        if len(cdf_values) != 201:
+            raise ValueError("CDF must contain exactly 201 values")
+        if not all(0 <= x <= 1 for x in cdf_values):
+            raise ValueError("All CDF values must be between 0 and 1")
+        if not all(a <= b for a, b in zip(cdf_values, cdf_values[1:])):
+            raise ValueError("CDF values must be monotonically increasing")
+        return {
+            "continuous_cdf": cdf_values,
+        }
+
+    @classmethod
+    def create_multiple_choice_prediction_payload(
+        cls, options_with_probabilities: dict[str, float]
+    ) -> dict:
+        return {
+            "probability_yes_per_category": options_with_probabilities,
+        }
+
+    @classmethod
+    def _post_question_prediction(
+        cls, question_id: int, forecast_payload: dict
+    ) -> None:
+        cls.post_question_predictions({question_id: forecast_payload})
+
     @classmethod
     def get_question_by_url(cls, question_url: str) -> MetaculusQuestion:
         """
@@ -145,9 +178,7 @@ class MetaculusApi:
         )
         raise_for_status_with_additional_info(response)
         json_question = json.loads(response.content)
-        metaculus_question = MetaculusApi.__metaculus_api_json_to_question(
-            json_question
-        )
+        metaculus_question = MetaculusApi.api_json_to_question(json_question)
         logger.info(f"Retrieved question details for question {post_id}")
         return metaculus_question
 
@@ -177,10 +208,12 @@ class MetaculusApi:
         cls.__validate_requested_benchmark_question_count(
             num_of_questions_to_return
         )
-        questions = cls.__fetch_all_possible_benchmark_questions()
-        filtered_questions = cls.__filter_retrieved_benchmark_questions(
-            questions, num_of_questions_to_return
-        )
+        filtered_questions = cls.get_all_benchmark_candidate_questions()
+        if len(filtered_questions) < num_of_questions_to_return:
+            raise ValueError(
+                f"Not enough questions available ({len(filtered_questions)}) "
+                f"to sample requested number ({num_of_questions_to_return})"
+            )
         questions = cls.__get_random_sample_of_questions(
             filtered_questions, num_of_questions_to_return, random_seed
         )
@@ -191,6 +224,77 @@ class MetaculusApi:
                 pass
         return questions
 
+    @classmethod
+    def get_all_benchmark_candidate_questions(cls) -> list[BinaryQuestion]:
+        """
+        Returns every open binary question that resolves in the next 3 months
+        and has enough forecasters and a community prediction to benchmark on
+        """
+        questions = cls.__fetch_all_possible_benchmark_questions()
+        return cls.__filter_retrieved_benchmark_questions(questions)
+
+    @classmethod
+    def get_posts_page_json(
+        cls, params: dict[str, Any], use_old_api: bool = False
+    ) -> dict[str, Any]:
+        """
+        Returns one page of the post list endpoint, which includes the
+        total number of matching posts under "count" and the posts under
+        "results"
+        """
+        num_requested = params.get("limit")
+        assert (
+            num_requested is None
+            or num_requested <= cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
+        ), "You cannot get more than 100 questions at a time"
+        if use_old_api:
+            url = f"{cls.OLD_API_BASE_URL}/questions/"
+        else:
+            url = f"{cls.API_BASE_URL}/posts/"
+        response = requests.get(url, params=params, **cls.__get_auth_headers())  # type: ignore
+        raise_for_status_with_additional_info(response)
+        return json.loads(response.content)
+
+    @classmethod
+    def remove_unsupported_posts(cls, posts: list[dict]) -> list[dict]:
+        supported_posts = [
+            q
+            for q in posts
+            if "notebook" not in q
+            and "group_of_questions" not in q
+            and "conditional" not in q
+        ]
+        removed_posts = [
+            post for post in posts if post not in supported_posts
+        ]
+        if len(removed_posts) > 0:
+            logger.warning(
+                f"Removed {len(removed_posts)} posts that "
+                "are not supported (e.g. notebook or group question)"
+            )
+        return supported_posts
+
+    @classmethod
+    def api_json_to_question(cls, api_json: dict) -> MetaculusQuestion:
+        assert (
+            "question" in api_json
+        ), f"Question not found in API JSON: {api_json}"
+        question_type_string = api_json["question"]["type"]  # type: ignore
+        if question_type_string == BinaryQuestion.get_api_type_name():
+            question_type = BinaryQuestion
+        elif question_type_string == NumericQuestion.get_api_type_name():
+            question_type = NumericQuestion
+        elif (
+            question_type_string == MultipleChoiceQuestion.get_api_type_name()
+        ):
+            question_type = MultipleChoiceQuestion
+        elif question_type_string == DateQuestion.get_api_type_name():
+            question_type = DateQuestion
+        else:
+            raise ValueError(f"Unknown question type: {question_type_string}")
+        question = question_type.from_metaculus_api_json(api_json)
+        return question
+
     @classmethod
     def __get_auth_headers(cls) -> dict[str, dict[str, str]]:
         METACULUS_TOKEN = os.getenv("METACULUS_TOKEN")
@@ -235,7 +339,7 @@ class MetaculusApi:
 
     @classmethod
     def __filter_retrieved_benchmark_questions(
-        cls, questions: list[BinaryQuestion], num_of_questions_to_return: int
+        cls, questions: list[BinaryQuestion]
     ) -> list[BinaryQuestion]:
         qs_with_enough_forecasters = cls.__filter_questions_by_forecasters(
             questions, min_forecasters=40
@@ -249,12 +353,6 @@ class MetaculusApi:
         logger.info(
             f"Reduced to {len(filtered_questions)} questions with enough forecasters"
         )
-
-        if len(filtered_questions) < num_of_questions_to_return:
-            raise ValueError(
-                f"Not enough questions available ({len(filtered_questions)}) "
-                f"to sample requested number ({num_of_questions_to_return})"
-            )
         return filtered_questions
 
     @classmethod
@@ -298,63 +396,11 @@ class MetaculusApi:
     def __get_questions_from_api(
         cls, params: dict[str, Any], use_old_api: bool = False
     ) -> list[MetaculusQuestion]:
-        num_requested = params.get("limit")
-        assert (
-            num_requested is None
-            or num_requested <= cls.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST
-        ), "You cannot get more than 100 questions at a time"
-        if use_old_api:
-            url = f"{cls.OLD_API_BASE_URL}/questions/"
-        else:
-            url = f"{cls.API_BASE_URL}/posts/"
-        response = requests.get(url, params=params, **cls.__get_auth_headers())  # type: ignore
-        raise_for_status_with_additional_info(response)
-        data = json.loads(response.content)
-        results = data["results"]
-        supported_posts = [
-            q
-            for q in results
-            if "notebook" not in q
-            and "group_of_questions" not in q
-            and "conditional" not in q
-        ]
-        removed_posts = [
-            post for post in results if post not in supported_posts
-        ]
-        if len(removed_posts) > 0:
-            logger.warning(
-                f"Removed {len(removed_posts)} posts that "
-                "are not supported (e.g. notebook or group question)"
-            )
-
-        questions = [
-            cls.__metaculus_api_json_to_question(q) for q in supported_posts
-        ]
+        data = cls.get_posts_page_json(params, use_old_api)
+        supported_posts = cls.remove_unsupported_posts(data["results"])
+        questions = [cls.api_json_to_question(q) for q in supported_posts]
         return questions
 
-    @classmethod
-    def __metaculus_api_json_to_question(
-        cls, api_json: dict
-    ) -> MetaculusQuestion:
-        assert (
-            "question" in api_json
-        ), f"Question not found in API JSON: {api_json}"
-        question_type_string = api_json["question"]["type"]  # type: ignore
-        if question_type_string == BinaryQuestion.get_api_type_name():
-            question_type = BinaryQuestion
-        elif question_type_string == NumericQuestion.get_api_type_name():
-            question_type = NumericQuestion
-        elif (
-            question_type_string == MultipleChoiceQuestion.get_api_type_name()
-        ):
-            question_type = MultipleChoiceQuestion
-        elif question_type_string == DateQuestion.get_api_type_name():
-            question_type = DateQuestion
-        else:
-            raise ValueError(f"Unknown question type: {question_type_string}")
-        question = question_type.from_metaculus_api_json(api_json)
-        return question
-
     @classmethod
     def __filter_questions_by_forecasters(
         cls, questions: list[Q], min_forecasters: int
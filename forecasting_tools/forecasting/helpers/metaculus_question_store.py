@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import zlib
+from typing import Any
+
+from pydantic import BaseModel
+
+from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    MetaculusQuestion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionSyncStats(BaseModel):
+    pages_fetched: int = 0
+    posts_received: int = 0
+    posts_saved: int = 0
+
+    @property
+    def posts_unchanged(self) -> int:
+        return self.posts_received - self.posts_saved
+
+
+class MetaculusQuestionStore:
+    """
+    Local SQLite copy of Metaculus posts so questions can be looked up and
+    tournaments listed without going to the network. Raw API JSON is kept
+    zlib compressed on disk and left out of the questions handed back
+    (use get_api_json if it is needed).
+
+    sync_tournament only asks for posts edited since the newest edit seen
+    in the last sync of that tournament, and fetches the pages of the
+    result concurrently.
+
+    store = MetaculusQuestionStore("logs/questions.db")
+    await store.sync_tournament(MetaculusApi.AI_COMPETITION_ID_Q4)
+    questions = store.get_all_open_questions_from_tournament(
+        MetaculusApi.AI_COMPETITION_ID_Q4
+    )
+    """
+
+    EDITED_AFTER_PARAM = "edited_at__gt"
+
+    def __init__(
+        self, database_path: str, max_concurrent_page_requests: int = 5
+    ) -> None:
+        assert (
+            max_concurrent_page_requests > 0
+        ), "Must allow at least one page request at a time"
+        self.database_path = database_path
+        self.max_concurrent_page_requests = max_concurrent_page_requests
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        self.__connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                post_id INTEGER PRIMARY KEY,
+                status TEXT NOT NULL,
+                edited_at TEXT,
+                compressed_api_json BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tournament_posts (
+                tournament_id INTEGER NOT NULL,
+                post_id INTEGER NOT NULL,
+                PRIMARY KEY (tournament_id, post_id)
+            );
+            CREATE TABLE IF NOT EXISTS tournament_syncs (
+                tournament_id INTEGER PRIMARY KEY,
+                last_edited_at TEXT
+            );
+            """
+        )
+        self.__connection.commit()
+
+    async def sync_tournament(self, tournament_id: int) -> QuestionSyncStats:
+        stats = QuestionSyncStats()
+        params: dict[str, Any] = {
+            "tournaments": [tournament_id],
+            "with_cp": "true",
+            "order_by": "edited_at",
+            "limit": MetaculusApi.MAX_QUESTIONS_FROM_QUESTION_API_PER_REQUEST,
+        }
+        last_edited_at = self.__get_last_edited_at(tournament_id)
+        if last_edited_at is not None:
+            params[self.EDITED_AFTER_PARAM] = last_edited_at
+
+        first_page = await self.__fetch_page(params, 0, stats)
+        page_size = params["limit"]
+        semaphore = asyncio.Semaphore(self.max_concurrent_page_requests)
+
+        async def fetch_page_with_limit(offset: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.__fetch_page(params, offset, stats)
+
+        other_pages = await asyncio.gather(
+            *[
+                fetch_page_with_limit(offset)
+                for offset in range(page_size, first_page["count"], page_size)
+            ]
+        )
+        posts = [
+            post
+            for page in [first_page, *other_pages]
+            for post in page["results"]
+        ]
+        supported_posts = MetaculusApi.remove_unsupported_posts(posts)
+        stats.posts_received = len(supported_posts)
+        stats.posts_saved = self.__save_posts(tournament_id, supported_posts)
+        edit_times = [
+            post["edited_at"] for post in posts if post.get("edited_at")
+        ]
+        if edit_times:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO tournament_syncs (tournament_id, last_edited_at) VALUES (?, ?)",
+                (tournament_id, max([last_edited_at or "", *edit_times])),
+            )
+        self.__connection.commit()
+        logger.info(
+            f"Synced tournament {tournament_id}: {stats.posts_saved} posts saved, {stats.posts_unchanged} unchanged, {stats.pages_fetched} pages fetched"
+        )
+        return stats
+
+    def get_question_by_post_id(
+        self, post_id: int
+    ) -> MetaculusQuestion | None:
+        api_json = self.get_api_json(post_id)
+        if api_json is None:
+            return None
+        return self.__api_json_to_light_question(api_json)
+
+    def get_all_open_questions_from_tournament(
+        self, tournament_id: int
+    ) -> list[MetaculusQuestion]:
+        rows = self.__connection.execute(
+            """
+            SELECT posts.compressed_api_json FROM posts
+            JOIN tournament_posts ON posts.post_id = tournament_posts.post_id
+            WHERE tournament_posts.tournament_id = ? AND posts.status = 'open'
+            ORDER BY posts.post_id
+            """,
+            (tournament_id,),
+        ).fetchall()
+        return [
+            self.__api_json_to_light_question(self.__decompress(row[0]))
+            for row in rows
+        ]
+
+    def get_api_json(self, post_id: int) -> dict | None:
+        row = self.__connection.execute(
+            "SELECT compressed_api_json FROM posts WHERE post_id = ?",
+            (post_id,),
+        ).fetchone()
+        return self.__decompress(row[0]) if row else None
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    async def __fetch_page(
+        self,
+        params: dict[str, Any],
+        offset: int,
+        stats: QuestionSyncStats,
+    ) -> dict[str, Any]:
+        page = await asyncio.to_thread(
+            MetaculusApi.get_posts_page_json, {**params, "offset": offset}
+        )
+        stats.pages_fetched += 1
+        return page
+
+    def __get_last_edited_at(self, tournament_id: int) -> str | None:
+        row = self.__connection.execute(
+            "SELECT last_edited_at FROM tournament_syncs WHERE tournament_id = ?",
+            (tournament_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def __save_posts(self, tournament_id: int, posts: list[dict]) -> int:
+        stored_edit_times = dict(
+            self.__connection.execute(
+                f"SELECT post_id, edited_at FROM posts WHERE post_id IN ({','.join('?' * len(posts))})",
+                [post["id"] for post in posts],
+            ).fetchall()
+        )
+        changed_posts = [
+            post
+            for post in posts
+            if post["id"] not in stored_edit_times
+            or post.get("edited_at") is None
+            or stored_edit_times[post["id"]] != post.get("edited_at")
+        ]
+        self.__connection.executemany(
+            "INSERT OR REPLACE INTO posts (post_id, status, edited_at, compressed_api_json) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    post["id"],
+                    post["status"],
+                    post.get("edited_at"),
+                    zlib.compress(json.dumps(post).encode()),
+                )
+                for post in changed_posts
+            ],
+        )
+        self.__connection.executemany(
+            "INSERT OR IGNORE INTO tournament_posts (tournament_id, post_id) VALUES (?, ?)",
+            [(tournament_id, post["id"]) for post in posts],
+        )
+        return len(changed_posts)
+
+    @staticmethod
+    def __decompress(compressed_api_json: bytes) -> dict:
+        return json.loads(zlib.decompress(compressed_api_json))
+
+    @staticmethod
+    def __api_json_to_light_question(api_json: dict) -> MetaculusQuestion:
+        question = MetaculusApi.api_json_to_question(api_json)
+        question.api_json = {}
+        return question
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import zlib
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from forecasting_tools.forecasting.questions_and_reports.binary_report import (
+    BinaryReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
+    ForecastReport,
+)
+from forecasting_tools.forecasting.questions_and_reports.report_organizer import (
+    ReportOrganizer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReportRow(BaseModel):
+    report_id: int
+    created_at: datetime
+    bot_name: str
+    run_name: str | None
+    id_of_post: int
+    id_of_question: int | None
+    question_type: str
+    question_text: str
+    readable_prediction: str
+    score: float | None
+    price_estimate: float | None
+    minutes_taken: float | None
+
+
+class ReportAnalyticsStore:
+    """
+    SQLite store of forecast reports for looking back over many runs.
+    Queries filter on indexed columns (date, question, bot, question type
+    and score) and return lightweight ReportRows. The full report, with its
+    explanation, is kept compressed in a separate table and only loaded by
+    get_full_report. Score is the inversed expected log score against the
+    community prediction and is only set for binary reports.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        self.database_path = database_path
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        self.__connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS reports (
+                report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                bot_name TEXT NOT NULL,
+                run_name TEXT,
+                id_of_post INTEGER NOT NULL,
+                id_of_question INTEGER,
+                question_type TEXT NOT NULL,
+                question_text TEXT NOT NULL,
+                readable_prediction TEXT NOT NULL,
+                score REAL,
+                price_estimate REAL,
+                minutes_taken REAL
+            );
+            CREATE TABLE IF NOT EXISTS report_bodies (
+                report_id INTEGER PRIMARY KEY,
+                compressed_report_json BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS reports_by_date ON reports (created_at);
+            CREATE INDEX IF NOT EXISTS reports_by_post ON reports (id_of_post);
+            CREATE INDEX IF NOT EXISTS reports_by_bot
+            ON reports (bot_name, created_at);
+            CREATE INDEX IF NOT EXISTS reports_by_type
+            ON reports (question_type, created_at);
+            CREATE INDEX IF NOT EXISTS reports_by_score ON reports (score);
+            """
+        )
+        self.__connection.commit()
+
+    def add_reports(
+        self,
+        reports: list[ForecastReport],
+        bot_name: str,
+        run_name: str | None = None,
+    ) -> None:
+        created_at = datetime.now().isoformat()
+        for report in reports:
+            cursor = self.__connection.execute(
+                "INSERT INTO reports (created_at, bot_name, run_name, id_of_post, id_of_question, question_type, question_text, readable_prediction, score, price_estimate, minutes_taken) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    created_at,
+                    bot_name,
+                    run_name,
+                    report.question.id_of_post,
+                    report.question.id_of_question,
+                    report.question.get_api_type_name(),
+                    report.question.question_text,
+                    report.make_readable_prediction(report.prediction),
+                    (
+                        report.inversed_expected_log_score
+                        if isinstance(report, BinaryReport)
+                        else None
+                    ),
+                    report.price_estimate,
+                    report.minutes_taken,
+                ),
+            )
+            self.__connection.execute(
+                "INSERT INTO report_bodies (report_id, compressed_report_json) VALUES (?, ?)",
+                (
+                    cursor.lastrowid,
+                    zlib.compress(json.dumps(report.to_json()).encode()),
+                ),
+            )
+        self.__connection.commit()
+        logger.info(
+            f"Added {len(reports)} reports from {bot_name} to the analytics store"
+        )
+
+    def query_reports(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        bot_name: str | None = None,
+        run_name: str | None = None,
+        id_of_post: int | None = None,
+        question_type: str | None = None,
+        min_score: float | None = None,
+        max_score: float | None = None,
+        limit: int | None = None,
+    ) -> list[ReportRow]:
+        """Returns matching reports, newest first"""
+        conditions: list[str] = []
+        params: list = []
+        for condition, value in [
+            ("created_at >= ?", start_time and start_time.isoformat()),
+            ("created_at <= ?", end_time and end_time.isoformat()),
+            ("bot_name = ?", bot_name),
+            ("run_name = ?", run_name),
+            ("id_of_post = ?", id_of_post),
+            ("question_type = ?", question_type),
+            ("score >= ?", min_score),
+            ("score <= ?", max_score),
+        ]:
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where_clause = (
+            f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        )
+        limit_clause = f"LIMIT {int(limit)}" if limit is not None else ""
+        cursor = self.__connection.execute(
+            f"SELECT * FROM reports {where_clause} ORDER BY created_at DESC, report_id DESC {limit_clause}",
+            params,
+        )
+        column_names = [column[0] for column in cursor.description]
+        return [
+            ReportRow(**dict(zip(column_names, row)))
+            for row in cursor.fetchall()
+        ]
+
+    def get_full_report(self, report_id: int) -> ForecastReport:
+        row = self.__connection.execute(
+            """
+            SELECT reports.question_type, report_bodies.compressed_report_json
+            FROM reports
+            JOIN report_bodies ON reports.report_id = report_bodies.report_id
+            WHERE reports.report_id = ?
+            """,
+            (report_id,),
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"No report with id {report_id}")
+        api_type_name, compressed_report_json = row
+        question_type = next(
+            question_type
+            for question_type in ReportOrganizer.get_all_question_types()
+            if question_type.get_api_type_name() == api_type_name
+        )
+        report_type = ReportOrganizer.get_report_type_for_question_type(
+            question_type
+        )
+        return report_type.from_json(
+            json.loads(zlib.decompress(compressed_report_json))
+        )
+
+    def close(self) -> None:
+        self.__connection.close()
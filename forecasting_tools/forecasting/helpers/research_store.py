@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel, Field
+
+from forecasting_tools.ai_models.exa_searcher import ExaHighlightQuote
+from forecasting_tools.forecasting.questions_and_reports.questions import (
+    MetaculusQuestion,
+)
+from forecasting_tools.util.jsonable import Jsonable
+
+logger = logging.getLogger(__name__)
+
+
+class StoredSearchQuote(BaseModel, Jsonable):
+    quote_text: str
+    source_url: str | None
+    source_title: str | None
+    published_date: datetime | None
+
+    @classmethod
+    def from_highlight_quote(
+        cls, quote: ExaHighlightQuote
+    ) -> StoredSearchQuote:
+        return cls(
+            quote_text=quote.highlight_text,
+            source_url=quote.source.url,
+            source_title=quote.source.title,
+            published_date=quote.source.published_date,
+        )
+
+
+class StoredResearch(BaseModel, Jsonable):
+    question_key: str
+    research_report: str
+    summary_report: str
+    search_quotes: list[StoredSearchQuote] = Field(default_factory=list)
+    researched_by: str
+    created_at: datetime = Field(default_factory=datetime.now)
+    store_id: int | None = None
+
+
+class ResearchStoreStats(BaseModel):
+    lookups: int = 0
+    reused: int = 0
+    topped_up: int = 0
+    researched_from_scratch: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        if self.lookups == 0:
+            return 0
+        return (self.reused + self.topped_up) / self.lookups
+
+
+class ResearchStore:
+    """
+    SQLite backed store of research reports, their summaries and the search
+    quotes behind them, keyed by question. Research younger than
+    freshness_window is reused as is. If top_up_window is set, research
+    older than the freshness window but younger than the top up window is
+    reused with only the news since it was made added on top.
+
+    The same database file can be shared by bots in different processes
+    (e.g. when A/B testing forecasters) so identical research is bought once.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        freshness_window: timedelta = timedelta(hours=24),
+        top_up_window: timedelta | None = None,
+    ) -> None:
+        assert (
+            top_up_window is None or top_up_window > freshness_window
+        ), "Top up window must be longer than the freshness window"
+        self.database_path = database_path
+        self.freshness_window = freshness_window
+        self.top_up_window = top_up_window
+        self.stats = ResearchStoreStats()
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        self.__connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS research (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                question_key TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                research_json TEXT NOT NULL
+            )
+            """
+        )
+        self.__connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS research_by_question
+            ON research (question_key, created_at)
+            """
+        )
+        self.__connection.commit()
+
+    @staticmethod
+    def get_question_key(question: MetaculusQuestion) -> str:
+        return f"{question.id_of_post}:{question.id_of_question}"
+
+    def get_fresh_research(
+        self, question: MetaculusQuestion
+    ) -> list[StoredResearch]:
+        """Returns research within the freshness window, newest first"""
+        return self.__get_research_since(
+            question, datetime.now() - self.freshness_window
+        )
+
+    def get_research_to_top_up(
+        self, question: MetaculusQuestion
+    ) -> list[StoredResearch]:
+        """Returns research that is stale but within the top up window"""
+        if self.top_up_window is None:
+            return []
+        research = self.__get_research_since(
+            question, datetime.now() - self.top_up_window
+        )
+        freshness_cutoff = datetime.now() - self.freshness_window
+        return [
+            stored
+            for stored in research
+            if stored.created_at < freshness_cutoff
+        ]
+
+    def save_research(self, research: StoredResearch) -> StoredResearch:
+        cursor = self.__connection.execute(
+            "INSERT INTO research (question_key, created_at, research_json) VALUES (?, ?, ?)",
+            (
+                research.question_key,
+                research.created_at.isoformat(),
+                research.model_dump_json(exclude={"store_id"}),
+            ),
+        )
+        self.__connection.commit()
+        logger.debug(
+            f"Saved research for question {research.question_key} to the research store"
+        )
+        return research.model_copy(update={"store_id": cursor.lastrowid})
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __get_research_since(
+        self, question: MetaculusQuestion, earliest_time: datetime
+    ) -> list[StoredResearch]:
+        rows = self.__connection.execute(
+            "SELECT id, research_json FROM research WHERE question_key = ? AND created_at >= ? ORDER BY created_at DESC",
+            (self.get_question_key(question), earliest_time.isoformat()),
+        ).fetchall()
+        return [
+            StoredResearch.model_validate_json(research_json).model_copy(
+                update={"store_id": store_id}
+            )
+            for store_id, research_json in rows
+        ]
@@ -5,6 +5,7 @@ import urllib.parse
 from datetime import datetime
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
+from forecasting_tools.ai_models.ai_utils.openai_utils import OpenAiUtils
 from forecasting_tools.ai_models.basic_model_interfaces.ai_model import AiModel
 from forecasting_tools.ai_models.basic_model_interfaces.outputs_text import (
     OutputsText,
@@ -15,9 +16,11 @@ from forecasting_tools.ai_models.exa_searcher import (
     SearchInput,
 )
 from forecasting_tools.forecasting.helpers.configured_llms import BasicLlm
+from forecasting_tools.forecasting.helpers.context_packer import ContextPacker
 from forecasting_tools.forecasting.helpers.works_cited_creator import (
     WorksCitedCreator,
 )
+from forecasting_tools.util.near_duplicate_index import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,7 @@ class SmartSearcher(OutputsText, AiModel):
         use_brackets_around_citations: bool = True,
         num_searches_to_run: int = 2,
         num_sites_per_search: int = 10,
+        context_token_budget: int = 3000,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -46,10 +50,20 @@ class SmartSearcher(OutputsText, AiModel):
             include_text=False,
             include_highlights=True,
             num_results=num_sites_per_search,
+            use_search_cache=True,
+        )
+        self.llm = BasicLlm(
+            temperature=temperature, coalesce_identical_requests=True
         )
-        self.llm = BasicLlm(temperature=temperature)
         self.include_works_cited_list = include_works_cited_list
         self.use_citation_brackets = use_brackets_around_citations
+        self.context_packer = ContextPacker(
+            token_budget=context_token_budget,
+            count_tokens=lambda text: OpenAiUtils.text_to_tokens_direct(
+                text, self.llm.MODEL_NAME
+            ),
+            max_quotes=self.num_quotes_to_evaluate_from_search,
+        )
 
     async def invoke(self, prompt: str) -> str:
         logger.debug(f"Running search for prompt: {prompt}")
@@ -127,23 +141,25 @@ class SmartSearcher(OutputsText, AiModel):
         flattened_quotes = [
             quote for sublist in all_quotes for quote in sublist
         ]
-        unique_quotes: dict[str, ExaHighlightQuote] = {}
-        for quote in flattened_quotes:
-            if quote.highlight_text not in unique_quotes:
-                unique_quotes[quote.highlight_text] = quote
-        deduplicated_quotes = sorted(
-            unique_quotes.values(), key=lambda x: x.score, reverse=True
+        quotes_by_score = sorted(
+            flattened_quotes, key=lambda x: x.score, reverse=True
         )
+        near_duplicate_index = NearDuplicateIndex()
+        deduplicated_quotes = [
+            quote
+            for quote in quotes_by_score
+            if near_duplicate_index.add_if_not_near_duplicate(
+                quote.highlight_text
+            )
+        ]
         if len(deduplicated_quotes) == 0:
             raise RuntimeError("No quotes found")
         if len(deduplicated_quotes) < self.num_quotes_to_evaluate_from_search:
             logger.warning(
                 f"Couldn't find the number of quotes asked for. Found {len(deduplicated_quotes)} quotes, but need {self.num_quotes_to_evaluate_from_search} quotes"
             )
-        most_relevant_quotes = deduplicated_quotes[
-            : self.num_quotes_to_evaluate_from_search
-        ]
-        return most_relevant_quotes
+        packed_quotes = self.context_packer.pack(deduplicated_quotes)
+        return packed_quotes
 
     async def __compile_report(
         self,
@@ -5,6 +5,9 @@ import statistics
 import numpy as np
 from pydantic import AliasChoices, Field, field_validator
 
+from forecasting_tools.forecasting.helpers.forecast_scorer import (
+    ForecastScorer,
+)
 from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
 from forecasting_tools.forecasting.questions_and_reports.forecast_report import (
     ForecastReport,
@@ -36,6 +39,9 @@ class BinaryReport(ForecastReport):
             self.question.id_of_post, self.explanation
         )
 
+    def create_forecast_payload(self) -> dict:
+        return MetaculusApi.create_binary_prediction_payload(self.prediction)
+
     @classmethod
     async def aggregate_predictions(
         cls, predictions: list[float], question: BinaryQuestion
@@ -49,6 +55,12 @@ class BinaryReport(ForecastReport):
     def make_readable_prediction(cls, prediction: float) -> str:
         return f"{round(prediction * 100, 2)}%"
 
+    @classmethod
+    def calculate_prediction_difference(
+        cls, prediction_1: float, prediction_2: float
+    ) -> float:
+        return abs(prediction_1 - prediction_2)
+
     @property
     def community_prediction(self) -> float | None:
         return self.question.community_prediction_at_access_time
@@ -80,27 +92,41 @@ class BinaryReport(ForecastReport):
     def calculate_average_expected_log_score(
         reports: list[BinaryReport],
     ) -> float:
-        deviation_scores: list[float | None] = [
-            report.inversed_expected_log_score for report in reports
-        ]
-        validated_deviation_scores: list[float] = []
-        for score in deviation_scores:
-            assert score is not None
-            validated_deviation_scores.append(score)
-        average_deviation_score = sum(validated_deviation_scores) / len(
-            validated_deviation_scores
+        predictions, community_predictions = (
+            BinaryReport.get_prediction_arrays(reports)
+        )
+        return float(
+            ForecastScorer.binary_expected_log_scores(
+                predictions, community_predictions
+            ).mean()
         )
-        return average_deviation_score
 
     @staticmethod
     def calculate_average_deviation_points(
         reports: list[BinaryReport],
     ) -> float:
-        validated_deviation_points: list[float] = []
-        for report in reports:
-            assert report.deviation_points is not None
-            validated_deviation_points.append(report.deviation_points)
-        assert validated_deviation_points
-        return sum(validated_deviation_points) / len(
-            validated_deviation_points
+        assert reports
+        predictions, community_predictions = (
+            BinaryReport.get_prediction_arrays(reports)
+        )
+        return float(
+            ForecastScorer.binary_deviation_points(
+                predictions, community_predictions
+            ).mean()
+        )
+
+    @staticmethod
+    def get_prediction_arrays(
+        reports: list[BinaryReport],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the bot and community predictions of the reports"""
+        community_predictions = [
+            report.community_prediction for report in reports
+        ]
+        assert all(
+            prediction is not None for prediction in community_predictions
+        ), "All reports must have a community prediction"
+        return (
+            np.array([report.prediction for report in reports], dtype=float),
+            np.array(community_predictions, dtype=float),
         )
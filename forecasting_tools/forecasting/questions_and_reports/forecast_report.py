@@ -68,6 +68,16 @@ class ForecastReport(BaseModel, Jsonable, ABC):
             "Subclass must implement this abstract method"
         )
 
+    @abstractmethod
+    def create_forecast_payload(self) -> dict:
+        """
+        Returns the prediction in the form the Metaculus forecast endpoint
+        takes, for posting many forecasts at once
+        """
+        raise NotImplementedError(
+            "Subclass must implement this abstract method"
+        )
+
     @classmethod
     @abstractmethod
     async def aggregate_predictions(
@@ -84,6 +94,18 @@ class ForecastReport(BaseModel, Jsonable, ABC):
             "Subclass must implement this abstract method"
         )
 
+    @classmethod
+    @abstractmethod
+    def calculate_prediction_difference(
+        cls, prediction_1: Any, prediction_2: Any
+    ) -> float:
+        """
+        Largest difference in probability between two predictions (0 to 1)
+        """
+        raise NotImplementedError(
+            "Subclass must implement this abstract method"
+        )
+
     def _get_section_content(self, index: int, expected_word: str) -> str:
         if len(self.report_sections) <= index:
             raise ValueError(f"Report must have at least {index + 1} sections")
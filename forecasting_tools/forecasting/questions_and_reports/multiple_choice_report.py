@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 from forecasting_tools.forecasting.helpers.metaculus_api import MetaculusApi
@@ -25,17 +28,25 @@ class MultipleChoiceReport(ForecastReport):
     async def publish_report_to_metaculus(self) -> None:
         if self.question.id_of_question is None:
             raise ValueError("Question ID is None")
-        options_with_probabilities = {
-            option.option_name: option.probability
-            for option in self.prediction.predicted_options
-        }
         MetaculusApi.post_multiple_choice_question_prediction(
-            self.question.id_of_question, options_with_probabilities
+            self.question.id_of_question,
+            self.__get_options_with_probabilities(),
         )
         MetaculusApi.post_question_comment(
             self.question.id_of_post, self.explanation
         )
 
+    def create_forecast_payload(self) -> dict:
+        return MetaculusApi.create_multiple_choice_prediction_payload(
+            self.__get_options_with_probabilities()
+        )
+
+    def __get_options_with_probabilities(self) -> dict[str, float]:
+        return {
+            option.option_name: option.probability
+            for option in self.prediction.predicted_options
+        }
+
     @classmethod
     async def aggregate_predictions(
         cls,
@@ -91,3 +102,38 @@ class MultipleChoiceReport(ForecastReport):
         ]
         combined_bullet_points = "\n".join(option_bullet_points)
         return f"\n{combined_bullet_points}\n"
+
+    @classmethod
+    def calculate_prediction_difference(
+        cls,
+        prediction_1: PredictedOptionList,
+        prediction_2: PredictedOptionList,
+    ) -> float:
+        probabilities_2 = {
+            option.option_name: option.probability
+            for option in prediction_2.predicted_options
+        }
+        if set(probabilities_2) != {
+            option.option_name for option in prediction_1.predicted_options
+        }:
+            raise ValueError("Predictions must have the same option names")
+        return max(
+            abs(option.probability - probabilities_2[option.option_name])
+            for option in prediction_1.predicted_options
+        )
+
+    @staticmethod
+    def get_probability_array(
+        reports: list[MultipleChoiceReport],
+    ) -> np.ndarray:
+        """
+        Returns a (reports, options) array with columns in the order of each
+        question's options. All questions must have the same number of options.
+        """
+        rows = []
+        for report in reports:
+            probabilities = report.__get_options_with_probabilities()
+            rows.append(
+                [probabilities[option] for option in report.question.options]
+            )
+        return np.array(rows, dtype=float)
@@ -245,6 +245,22 @@ class NumericReport(ForecastReport):
             zero_point=question.zero_point,
         )
 
+    @classmethod
+    def calculate_prediction_difference(
+        cls,
+        prediction_1: NumericDistribution,
+        prediction_2: NumericDistribution,
+    ) -> float:
+        cdf_1 = prediction_1.cdf
+        cdf_2 = prediction_2.cdf
+        for percentile_1, percentile_2 in zip(cdf_1, cdf_2):
+            if percentile_1.value != percentile_2.value:
+                raise ValueError("X axis between cdfs is not the same")
+        return max(
+            abs(percentile_1.percentile - percentile_2.percentile)
+            for percentile_1, percentile_2 in zip(cdf_1, cdf_2)
+        )
+
     @classmethod
     def make_readable_prediction(cls, prediction: NumericDistribution) -> str:
         representative_percentiles = (
@@ -258,12 +274,37 @@ class NumericReport(ForecastReport):
     async def publish_report_to_metaculus(self) -> None:
         if self.question.id_of_question is None:
             raise ValueError("Question ID is None")
-        cdf_probabilities = [
-            percentile.percentile for percentile in self.prediction.cdf
-        ]
         MetaculusApi.post_numeric_question_prediction(
-            self.question.id_of_question, cdf_probabilities
+            self.question.id_of_question, self.__get_cdf_probabilities()
         )
         MetaculusApi.post_question_comment(
             self.question.id_of_post, self.explanation
         )
+
+    def create_forecast_payload(self) -> dict:
+        return MetaculusApi.create_numeric_prediction_payload(
+            self.__get_cdf_probabilities()
+        )
+
+    def __get_cdf_probabilities(self) -> list[float]:
+        return [percentile.percentile for percentile in self.prediction.cdf]
+
+    @staticmethod
+    def get_cdf_arrays(
+        reports: list[NumericReport],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the x axis and cdf of each report as (reports, 201) arrays"""
+        cdfs = [report.prediction.cdf for report in reports]
+        return (
+            np.array(
+                [[percentile.value for percentile in cdf] for cdf in cdfs],
+                dtype=float,
+            ),
+            np.array(
+                [
+                    [percentile.percentile for percentile in cdf]
+                    for cdf in cdfs
+                ],
+                dtype=float,
+            ),
+        )
@@ -1,22 +1,25 @@
 import asyncio
+import hashlib
 import logging
 import os
-import random
+from collections import OrderedDict
 
 import numpy as np
 import requests
 from openai import OpenAI
-from sklearn.metrics.pairwise import cosine_similarity
 
 from forecasting_tools.ai_models.ai_utils.ai_misc import clean_indents
 from forecasting_tools.forecasting.helpers.configured_llms import BasicLlm
 from forecasting_tools.forecasting.helpers.smart_searcher import SmartSearcher
 from forecasting_tools.util.misc import raise_for_status_with_additional_info
+from forecasting_tools.util.near_duplicate_index import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
 
 class Deduplicator:
+    MAX_CACHED_EMBEDDINGS = 10_000
+    _embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
     @classmethod
     async def deduplicate_list_in_batches(
@@ -24,38 +27,134 @@ class Deduplicator:
         items_to_deduplicate: list[str],
         prompt_context: str,
         initial_semantic_threshold: float = 0.85,
+        near_duplicate_threshold: float = 0.8,
+        batch_size: int = 8,
+        candidate_similarity_threshold: float = 0.5,
     ) -> list[str]:
+        lexically_deduplicated_items = NearDuplicateIndex.deduplicate(
+            items_to_deduplicate, near_duplicate_threshold
+        )
+        logger.info(
+            f"Deduplicated {len(items_to_deduplicate)} items to {len(lexically_deduplicated_items)} items using local near-duplicate detection"
+        )
         semantic_deduplicated_items = (
             await cls.__deduplicate_list_using_semantic_similarity(
-                items_to_deduplicate, initial_semantic_threshold
+                lexically_deduplicated_items, initial_semantic_threshold
             )
         )
-        shuffled_items = semantic_deduplicated_items.copy()
-        random.shuffle(shuffled_items)
-
-        batch_size = 8  # Roughly what GPT can handle well
-        batches = [
-            shuffled_items[i : i + batch_size]
-            for i in range(0, len(shuffled_items), batch_size)
-        ]
-
-        batch_tasks = [
-            cls.__deduplicate_list_in_batch(batch, prompt_context)
-            for batch in batches
-        ]
-        deduplicated_batches = await asyncio.gather(*batch_tasks)
-        deduplicated_batches_flattened = [
-            item for sublist in deduplicated_batches for item in sublist
-        ]
-
-        final_deduplicated_list = await cls.__deduplicate_list_in_batch(
-            deduplicated_batches_flattened, prompt_context
+        final_deduplicated_list = (
+            await cls.__deduplicate_list_using_tree_reduction(
+                semantic_deduplicated_items,
+                prompt_context,
+                batch_size,
+                candidate_similarity_threshold,
+            )
         )
         cls.__log_deduplication_results(
             items_to_deduplicate, final_deduplicated_list
         )
         return final_deduplicated_list
 
+    @classmethod
+    async def __deduplicate_list_using_tree_reduction(
+        cls,
+        items: list[str],
+        prompt_context: str,
+        batch_size: int,
+        candidate_similarity_threshold: float,
+    ) -> list[str]:
+        """
+        Each level groups items that are plausible duplicates of each other
+        into bounded batches and deduplicates the batches in parallel.
+        Batches already covered by an earlier LLM call are not resent, and
+        levels repeat until every batch is covered, so no LLM call ever sees
+        more than batch_size items.
+        """
+        assert batch_size >= 2, "Batch size must be at least 2"
+        checked_batches: list[set[str]] = []
+        remaining_items = items
+        level = 0
+        while True:
+            batches = cls.__group_items_into_candidate_batches(
+                remaining_items, batch_size, candidate_similarity_threshold
+            )
+            batches_needing_llm = [
+                batch
+                for batch in batches
+                if len(batch) > 1
+                and not any(
+                    set(batch) <= checked_batch
+                    for checked_batch in checked_batches
+                )
+            ]
+            if len(batches_needing_llm) == 0:
+                break
+            deduplicated_batches = await asyncio.gather(
+                *[
+                    cls.__deduplicate_list_in_batch(batch, prompt_context)
+                    for batch in batches_needing_llm
+                ]
+            )
+            checked_batches.extend(set(batch) for batch in batches_needing_llm)
+            items_removed = {
+                item
+                for batch, deduplicated_batch in zip(
+                    batches_needing_llm, deduplicated_batches
+                )
+                for item in batch
+                if item not in deduplicated_batch
+            }
+            reduced_items = [
+                item for item in remaining_items if item not in items_removed
+            ]
+            level += 1
+            logger.info(
+                f"Tree reduction level {level} deduplicated {len(remaining_items)} items to {len(reduced_items)} items across {len(batches_needing_llm)} batches"
+            )
+            remaining_items = reduced_items
+        return remaining_items
+
+    @classmethod
+    def __group_items_into_candidate_batches(
+        cls,
+        items: list[str],
+        batch_size: int,
+        candidate_similarity_threshold: float,
+    ) -> list[list[str]]:
+        """
+        Greedily seeds a batch with the first unassigned item and fills it
+        with that item's most similar unassigned neighbours above the
+        threshold. Items with no plausible duplicate end up alone and are
+        never sent to an LLM.
+        """
+        if len(items) == 0:
+            return []
+        embeddings = cls.__get_normalized_embeddings_with_cache(items)
+        similarity_matrix = embeddings @ embeddings.T
+        np.fill_diagonal(similarity_matrix, -np.inf)
+
+        is_unassigned = np.ones(len(items), dtype=bool)
+        batches: list[list[str]] = []
+        for seed_index in range(len(items)):
+            if not is_unassigned[seed_index]:
+                continue
+            is_unassigned[seed_index] = False
+            seed_similarities = np.where(
+                is_unassigned, similarity_matrix[seed_index], -np.inf
+            )
+            neighbour_indices = np.argsort(-seed_similarities)[
+                : batch_size - 1
+            ]
+            neighbour_indices = [
+                int(index)
+                for index in neighbour_indices
+                if seed_similarities[index] >= candidate_similarity_threshold
+            ]
+            is_unassigned[neighbour_indices] = False
+            batch_indices = sorted([seed_index] + neighbour_indices)
+            batches.append([items[index] for index in batch_indices])
+        return batches
+
     @classmethod
     async def __deduplicate_list_in_batch(
         cls, items_to_deduplicate: list[str], prompt_context: str
@@ -187,13 +286,18 @@ class Deduplicator:
     async def __deduplicate_list_using_semantic_similarity(
         cls, items: list[str], threshold: float
     ) -> list[str]:
-        deduplicated_items: list[str] = []
-        for item in items:
-            is_duplicate = cls.__determine_if_text_is_duplicate_semantically(
-                item, deduplicated_items, threshold
-            )
+        if len(items) == 0:
+            return []
+        embeddings = cls.__get_normalized_embeddings_with_cache(items)
+        similarity_matrix = embeddings @ embeddings.T
+
+        kept_indices: list[int] = []
+        for index in range(len(items)):
+            similarities_to_kept_items = similarity_matrix[index, kept_indices]
+            is_duplicate = bool(np.any(similarities_to_kept_items > threshold))
             if not is_duplicate:
-                deduplicated_items.append(item)
+                kept_indices.append(index)
+        deduplicated_items = [items[index] for index in kept_indices]
 
         logger.info(
             f"Deduplicated {len(items)} items to {len(deduplicated_items)} items using semantic similarity"
@@ -211,29 +315,69 @@ class Deduplicator:
         0.85 is good for an item like "1999 Moldovan referendum: description..."
         0.938 is good for a short item like "1999 Moldovan referendum"
         """
-        texts_to_get_embeddings_for = [text] + list_to_compare_to
-        try:
-            embeddings = cls.__get_embeddings_using_huggingface(
-                texts_to_get_embeddings_for
+        if len(list_to_compare_to) == 0:
+            return False
+        embeddings = cls.__get_normalized_embeddings_with_cache(
+            [text] + list_to_compare_to
+        )
+        similarities = embeddings[1:] @ embeddings[0]
+        return bool(np.any(similarities > semantic_similarity_threshold))
+
+    @classmethod
+    def __get_normalized_embeddings_with_cache(
+        cls, texts: list[str]
+    ) -> np.ndarray:
+        """
+        Embeddings are fetched in one batched request for all texts not yet
+        cached, and stored unit-normalized so cosine similarity is a dot product.
+        The least recently used embeddings are evicted once the cache holds
+        more than MAX_CACHED_EMBEDDINGS.
+        """
+        text_hashes = [cls.__hash_text(text) for text in texts]
+        uncached_texts_by_hash: dict[str, str] = {}
+        for text, text_hash in zip(texts, text_hashes):
+            if text_hash in cls._embedding_cache:
+                cls._embedding_cache.move_to_end(text_hash)
+            else:
+                uncached_texts_by_hash[text_hash] = text
+
+        if uncached_texts_by_hash:
+            new_embeddings = cls.__get_embeddings(
+                list(uncached_texts_by_hash.values())
             )
+            for text_hash, embedding in zip(
+                uncached_texts_by_hash.keys(), new_embeddings
+            ):
+                cls._embedding_cache[text_hash] = cls.__normalize(embedding)
+
+        embeddings = np.array(
+            [cls._embedding_cache[text_hash] for text_hash in text_hashes]
+        )
+        while len(cls._embedding_cache) > cls.MAX_CACHED_EMBEDDINGS:
+            cls._embedding_cache.popitem(last=False)
+        return embeddings
+
+    @classmethod
+    def __get_embeddings(cls, texts: list[str]) -> list[list[float]]:
+        try:
+            return cls.__get_embeddings_using_huggingface(texts)
         except Exception as e:
             logger.warning(
                 f"Could not get embeddings using huggingface. Instead now getting embeddings with OpenAI. Error: {e}"
             )
-            embeddings = cls.__get_embeddings_using_openai(
-                texts_to_get_embeddings_for
-            )
-
-        text_embedding = embeddings[0]
-        list_embeddings = embeddings[1:]
-
-        for list_embedding in list_embeddings:
-            similarity = cosine_similarity(
-                np.array([text_embedding]), np.array([list_embedding])
-            )[0][0]
-            if similarity > semantic_similarity_threshold:
-                return True
-        return False
+            return cls.__get_embeddings_using_openai(texts)
+
+    @staticmethod
+    def __normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return vector
+        return vector / norm
+
+    @staticmethod
+    def __hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
     @classmethod
     def __get_embeddings_using_openai(
@@ -49,7 +49,7 @@ class QuestionRouter:
             Remember to give the research strategy name exactly as written, and put it in all caps
             """
         )
-        model = BasicLlm(temperature=0)
+        model = BasicLlm(temperature=0, coalesce_identical_requests=True)
         response = await model.invoke(q1_routing_prompt)
         response_to_be_logged = response.replace("\n", "|")
         logger.info(f"Response to routing prompt: {response_to_be_logged}")
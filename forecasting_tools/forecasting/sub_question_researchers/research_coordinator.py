@@ -24,11 +24,13 @@ from forecasting_tools.forecasting.sub_question_researchers.question_router impo
     QuestionRouter,
 )
 from forecasting_tools.util import async_batching
+from forecasting_tools.util.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
 
 class ResearchCoordinator:
+    MIN_SECONDS_LEFT_FOR_DEEP_RESEARCH = 10 * 60
 
     def __init__(
         self,
@@ -102,6 +104,13 @@ class ResearchCoordinator:
         questions = await self.brainstorm_base_rate_questions(
             num_base_rate_questions, additional_context
         )
+        if num_base_rate_questions_with_deep_research > 0 and not (
+            Deadline.has_time_for(self.MIN_SECONDS_LEFT_FOR_DEEP_RESEARCH)
+        ):
+            logger.info(
+                "Skipping deep base rate research since the deadline is near"
+            )
+            num_base_rate_questions_with_deep_research = 0
         deep_questions, shallow_questions = (
             await self.pick_best_base_rate_questions(
                 num_base_rate_questions_with_deep_research, questions
@@ -411,7 +420,7 @@ class ResearchCoordinator:
             Now please summarize the research report above using the markdown template given to you. Just fill in the template and give the markdown report, do not include any other text. Your summary will be published as is.
             """
         )
-        model = BasicLlm(temperature=0)
+        model = BasicLlm(temperature=0, coalesce_identical_requests=True)
         summary_markdown = await model.invoke(prompt)
         cleaned_summary_markdown = strip_code_block_markdown(summary_markdown)
         return cleaned_summary_markdown
@@ -455,7 +464,7 @@ class ResearchCoordinator:
             {base_rate_questions}
             """
         )
-        model = BasicLlm(temperature=0)
+        model = BasicLlm(temperature=0, coalesce_identical_requests=True)
         picked_questions: list[str] = (
             await model.invoke_and_return_verified_type(prompt, list[str])
         )
@@ -5,6 +5,8 @@ from typing import Any, Callable, Coroutine, TypeVar
 import nest_asyncio
 from aiolimiter import AsyncLimiter
 
+from forecasting_tools.util.deadline import Deadline
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -40,27 +42,28 @@ async def apply_limiter_to_coroutine(
 def wrap_coroutines_with_timeout(
     coroutine_list: list[Coroutine[Any, Any, T]], timeout_time: float
 ) -> list[Coroutine[Any, Any, T]]:
-    async def coroutine_with_timeout(
-        coroutine: Coroutine, timeout_time: float
-    ) -> Any:
-        try:
-            result = await asyncio.wait_for(coroutine, timeout=timeout_time)
-            return result
-        except asyncio.TimeoutError as e:
-            raise asyncio.TimeoutError(
-                f"Timeout of {timeout_time} seconds exceeded while running coroutine. Here is the exception: {e.__class__.__name__}: {e}"
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"Exception while running coroutine with timeout wrapper. Here is the exception: {e.__class__.__name__}: {e}"
-            )
-
     return [
-        coroutine_with_timeout(coroutine, timeout_time)
+        run_coroutine_with_timeout(coroutine, timeout_time)
         for coroutine in coroutine_list
     ]
 
 
+async def run_coroutine_with_timeout(
+    coroutine: Coroutine[Any, Any, T], timeout_time: float
+) -> T:
+    try:
+        result = await asyncio.wait_for(coroutine, timeout=timeout_time)
+        return result
+    except asyncio.TimeoutError as e:
+        raise asyncio.TimeoutError(
+            f"Timeout of {timeout_time} seconds exceeded while running coroutine. Here is the exception: {e.__class__.__name__}: {e}"
+        )
+    except Exception as e:
+        raise RuntimeError(
+            f"Exception while running coroutine with timeout wrapper. Here is the exception: {e.__class__.__name__}: {e}"
+        )
+
+
 def wrap_coroutines_to_return_not_raise_exceptions(
     coroutine_list: list[Coroutine[Any, Any, T]]
 ) -> list[Coroutine[Any, Any, T | Exception]]:
@@ -68,7 +71,7 @@ def wrap_coroutines_to_return_not_raise_exceptions(
         coroutine: Coroutine,
     ) -> Any | Exception:
         try:
-            return await coroutine
+            return await Deadline.run_within_deadline(coroutine)
         except Exception as e:
             return e
 
@@ -0,0 +1,27 @@
+import functools
+from typing import Any, Callable, Coroutine
+
+CallHandler = Callable[[Any, tuple, dict], Coroutine[Any, Any, Any]]
+CallMiddleware = Callable[
+    [Any, tuple, dict, CallHandler], Coroutine[Any, Any, Any]
+]
+
+
+class CallPipeline:
+    """
+    Chains middleware around a final call once, when the pipeline is built,
+    rather than nesting decorators that make new closures on every call.
+    Each middleware takes (owner, args, kwargs, call_next) as parameters
+    and runs the rest of the chain with call_next(owner, args, kwargs), so
+    settings are read from the owner (e.g. a model instance) at call time.
+    Middleware is listed outermost first.
+    """
+
+    def __init__(
+        self, middleware: list[CallMiddleware], final_call: CallHandler
+    ) -> None:
+        self.middleware = middleware
+        handler = final_call
+        for layer in reversed(middleware):
+            handler = functools.partial(layer, call_next=handler)
+        self.run: CallHandler = handler
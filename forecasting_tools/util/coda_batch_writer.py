@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import threading
+import time
+
+from pydantic import BaseModel
+
+from forecasting_tools.util.coda_utils import CodaRow, CodaTable
+
+logger = logging.getLogger(__name__)
+
+
+class CodaWriterStats(BaseModel):
+    rows_added: int = 0
+    rows_written: int = 0
+    rows_failed: int = 0
+    requests_sent: int = 0
+    retries: int = 0
+
+
+class CodaBatchWriter:
+    """
+    Buffers rows for a Coda table and writes them from a background thread,
+    so adding a row never waits on the network. Each request holds as many
+    rows as fit under the table's payload limit. Rows are sent once a full
+    request's worth is waiting, once the oldest row has waited
+    flush_interval_seconds, or when flush() is called (which also happens
+    at interpreter exit). Failed requests are retried with exponential
+    backoff, and rows are dropped with an error log once retries run out.
+    """
+
+    def __init__(
+        self,
+        table: CodaTable,
+        flush_interval_seconds: float = 10,
+        allowed_tries: int = 4,
+        min_retry_wait_seconds: float = 2,
+    ) -> None:
+        assert allowed_tries > 0, "Must try at least once"
+        self.table = table
+        self.flush_interval_seconds = flush_interval_seconds
+        self.allowed_tries = allowed_tries
+        self.min_retry_wait_seconds = min_retry_wait_seconds
+        self.max_payload_size_in_kb = table.MAX_SIZE_OF_PAYLOAD_UPLOAD_IN_KB
+        self.stats = CodaWriterStats()
+        self.__condition = threading.Condition()
+        self.__buffer: list[tuple[CodaRow, float]] = []
+        self.__buffered_size_in_kb = 0.0
+        self.__oldest_row_time: float | None = None
+        self.__rows_in_flight = 0
+        self.__flush_requested = False
+        self.__thread: threading.Thread | None = None
+
+    def get_row_size_in_kb(self, row: CodaRow) -> float:
+        return (
+            len(json.dumps(row.turn_to_payload_friendly_json()[0]).encode())
+            + 2
+        ) / 1000
+
+    def add_row(self, row: CodaRow) -> None:
+        assert self.table.check_that_row_matches_columns(
+            row
+        ), "Row does not match columns"
+        row_size = self.get_row_size_in_kb(row)
+        if row_size + self.table.get_payload_size_in_kb([]) > (
+            self.max_payload_size_in_kb
+        ):
+            raise ValueError(
+                f"Row is {row_size}kb, which is over the {self.max_payload_size_in_kb}kb request limit"
+            )
+        with self.__condition:
+            self.__buffer.append((row, row_size))
+            self.__buffered_size_in_kb += row_size
+            if self.__oldest_row_time is None:
+                self.__oldest_row_time = time.time()
+            self.stats.rows_added += 1
+            self.__start_thread_if_needed()
+            self.__condition.notify_all()
+
+    def flush(self, timeout_seconds: float | None = None) -> None:
+        """Blocks until every row added so far has been sent or dropped"""
+        with self.__condition:
+            if self.__thread is None:
+                return
+            self.__flush_requested = True
+            self.__condition.notify_all()
+            self.__condition.wait_for(
+                lambda: len(self.__buffer) == 0 and self.__rows_in_flight == 0,
+                timeout=timeout_seconds,
+            )
+            self.__flush_requested = False
+
+    def __start_thread_if_needed(self) -> None:
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(
+            target=self.__write_rows_forever, daemon=True
+        )
+        self.__thread.start()
+        atexit.register(self.flush)
+
+    def __write_rows_forever(self) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    self.__rows_are_ready_to_send,
+                    timeout=self.flush_interval_seconds,
+                )
+                if not self.__rows_are_ready_to_send():
+                    continue
+                rows = self.__take_rows_that_fit_in_one_request()
+                self.__rows_in_flight = len(rows)
+            self.__send_with_retries(rows)
+            with self.__condition:
+                self.__rows_in_flight = 0
+                self.__condition.notify_all()
+
+    def __rows_are_ready_to_send(self) -> bool:
+        if len(self.__buffer) == 0:
+            return False
+        assert self.__oldest_row_time is not None
+        request_size = (
+            self.__buffered_size_in_kb + self.table.get_payload_size_in_kb([])
+        )
+        return (
+            self.__flush_requested
+            or request_size >= self.max_payload_size_in_kb
+            or time.time() - self.__oldest_row_time
+            >= self.flush_interval_seconds
+        )
+
+    def __take_rows_that_fit_in_one_request(self) -> list[CodaRow]:
+        request_size = self.table.get_payload_size_in_kb([])
+        rows_to_send = 0
+        for _, row_size in self.__buffer:
+            if request_size + row_size > self.max_payload_size_in_kb:
+                break
+            request_size += row_size
+            rows_to_send += 1
+        rows = [row for row, _ in self.__buffer[:rows_to_send]]
+        self.__buffered_size_in_kb -= sum(
+            row_size for _, row_size in self.__buffer[:rows_to_send]
+        )
+        self.__buffer = self.__buffer[rows_to_send:]
+        self.__oldest_row_time = time.time() if self.__buffer else None
+        return rows
+
+    def __send_with_retries(self, rows: list[CodaRow]) -> None:
+        for attempt in range(self.allowed_tries):
+            try:
+                self.stats.requests_sent += 1
+                self.table.add_rows_to_table(rows)
+                self.stats.rows_written += len(rows)
+                return
+            except Exception as e:
+                if attempt == self.allowed_tries - 1:
+                    logger.error(
+                        f"Dropping {len(rows)} rows after {self.allowed_tries} failed attempts to write them to Coda: {e}"
+                    )
+                    self.stats.rows_failed += len(rows)
+                    return
+                wait_seconds = self.min_retry_wait_seconds * 2**attempt
+                logger.warning(
+                    f"Writing {len(rows)} rows to Coda failed, retrying in {wait_seconds}s: {e}"
+                )
+                self.stats.retries += 1
+                time.sleep(wait_seconds)
@@ -1,6 +1,7 @@
 import logging
 
 logger = logging.getLogger(__name__)
+import json
 import os
 from typing import Any
 
@@ -60,20 +61,34 @@ class CodaTable:
         self.key_columns = key_columns
 
     def add_row_to_table(self, row: CodaRow):
-        assert self.check_that_row_matches_columns(
-            row
-        ), "Row does not match columns"
-        json_payload = row.turn_to_payload_friendly_json()
-        key_columns = [column.column_id for column in self.key_columns]
+        return self.add_rows_to_table([row])
+
+    def add_rows_to_table(self, rows: list[CodaRow]):
+        for row in rows:
+            assert self.check_that_row_matches_columns(
+                row
+            ), "Row does not match columns"
+        full_payload = self.create_payload(rows)
         headers = {"Authorization": f"Bearer {CodaUtils.CODA_API_KEY}"}
         uri = f"https://coda.io/apis/v1/docs/{self.doc_id}/tables/{self.table_id}/rows"
-        logger.info(f"Attempting to insert {len(json_payload)} rows into")
-        full_payload = {"rows": json_payload, "keyColumns": key_columns}
+        logger.info(f"Attempting to insert {len(rows)} rows into")
         response = requests.post(uri, headers=headers, json=full_payload)
         logger.info(f"Got response back - {response}")
         raise_for_status_with_additional_info(response)
         return response
 
+    def create_payload(self, rows: list[CodaRow]) -> dict:
+        json_payload = [
+            row_json
+            for row in rows
+            for row_json in row.turn_to_payload_friendly_json()
+        ]
+        key_columns = [column.column_id for column in self.key_columns]
+        return {"rows": json_payload, "keyColumns": key_columns}
+
+    def get_payload_size_in_kb(self, rows: list[CodaRow]) -> float:
+        return len(json.dumps(self.create_payload(rows)).encode()) / 1000
+
     def check_that_row_matches_columns(self, row: CodaRow):
         cell_columns = [cell.column for cell in row.cells]
 
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Coroutine, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(Exception):
+    """Raised when work is started or still running after the deadline"""
+
+
+class Deadline:
+    """
+    Sets a time budget for everything run inside the with block, including
+    tasks created from it (tasks copy the current context). Nested
+    deadlines can only shorten the active deadline, never extend it.
+    A deadline of None sets no limit.
+
+    with Deadline(seconds=600):
+        ...
+    """
+
+    CANCELLATION_GRACE_SECONDS = 1.0
+    _active_deadline: ContextVar[float | None] = ContextVar(
+        "_active_deadline", default=None
+    )
+    _cancellation_depth: ContextVar[int] = ContextVar(
+        "_cancellation_depth", default=0
+    )
+
+    def __init__(self, seconds: float | None) -> None:
+        assert seconds is None or seconds >= 0, "Deadline cannot be negative"
+        self.seconds = seconds
+        self.__token: Token[float | None] | None = None
+
+    def __enter__(self) -> Deadline:
+        current_deadline = self._active_deadline.get()
+        new_deadline = (
+            None if self.seconds is None else time.monotonic() + self.seconds
+        )
+        if current_deadline is not None and (
+            new_deadline is None or current_deadline < new_deadline
+        ):
+            new_deadline = current_deadline
+        self.__token = self._active_deadline.set(new_deadline)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        assert self.__token is not None
+        self._active_deadline.reset(self.__token)
+        self.__token = None
+
+    @classmethod
+    def get_remaining_seconds(cls) -> float | None:
+        deadline = cls._active_deadline.get()
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    @classmethod
+    def has_passed(cls) -> bool:
+        remaining_seconds = cls.get_remaining_seconds()
+        return remaining_seconds is not None and remaining_seconds <= 0
+
+    @classmethod
+    def has_time_for(cls, seconds: float) -> bool:
+        remaining_seconds = cls.get_remaining_seconds()
+        return remaining_seconds is None or remaining_seconds >= seconds
+
+    @classmethod
+    def raise_error_if_passed(cls) -> None:
+        if cls.has_passed():
+            raise DeadlineExceededError("The deadline has passed")
+
+    @classmethod
+    def limit_timeout(cls, timeout: float) -> float:
+        cls.raise_error_if_passed()
+        remaining_seconds = cls.get_remaining_seconds()
+        if remaining_seconds is None:
+            return timeout
+        return min(timeout, remaining_seconds)
+
+    @classmethod
+    async def run_within_deadline(cls, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Cancels the coroutine and raises DeadlineExceededError if it is
+        still running when the deadline passes. Outer calls get a longer
+        grace period than the calls nested in them so nested work can stop
+        and hand back partial results before the outer work is cancelled.
+        """
+        remaining_seconds = cls.get_remaining_seconds()
+        if remaining_seconds is None:
+            return await coroutine
+        depth = cls._cancellation_depth.get()
+        grace_seconds = cls.CANCELLATION_GRACE_SECONDS / (depth + 1)
+        token = cls._cancellation_depth.set(depth + 1)
+        try:
+            return await asyncio.wait_for(
+                coroutine, timeout=max(remaining_seconds, 0) + grace_seconds
+            )
+        except asyncio.TimeoutError as e:
+            if cls.has_passed():
+                raise DeadlineExceededError(
+                    "Cancelled since the deadline passed"
+                ) from e
+            raise
+        finally:
+            cls._cancellation_depth.reset(token)
+
+    @classmethod
+    async def run_without_deadline(
+        cls, coroutine: Coroutine[Any, Any, T]
+    ) -> T:
+        """
+        Runs the coroutine with no active deadline. For work shared by
+        callers with different deadlines, where each caller enforces its
+        own deadline while waiting for the result.
+        """
+        token = cls._active_deadline.set(None)
+        try:
+            return await coroutine
+        finally:
+            cls._active_deadline.reset(token)
@@ -0,0 +1,28 @@
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyClassAttribute(Generic[T]):
+    """
+    Class attribute that is built by its factory on first access rather
+    than when the class is defined. The factory is given the class that
+    defines the attribute, and the value then replaces this descriptor on
+    that class, so subclasses and instances share the one value and later
+    lookups are plain attribute access.
+    """
+
+    def __init__(self, factory: Callable[[type], T]) -> None:
+        self.__factory = factory
+        self.__owner: type | None = None
+        self.__name: str | None = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__owner = owner
+        self.__name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> T:
+        assert self.__owner is not None and self.__name is not None
+        value = self.__factory(self.__owner)
+        setattr(self.__owner, self.__name, value)
+        return value
@@ -0,0 +1,153 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+
+class NearDuplicateIndex:
+    """
+    Local near-duplicate detector using character shingling, MinHash
+    signatures, and LSH banding. Items can be added incrementally and
+    queried without comparing against every item already in the index.
+    """
+
+    _MERSENNE_PRIME = (1 << 31) - 1
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.8,
+        num_permutations: int = 128,
+        num_bands: int = 32,
+        shingle_size: int = 5,
+        random_seed: int = 42,
+    ) -> None:
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError("Similarity threshold must be in (0, 1]")
+        if num_permutations % num_bands != 0:
+            raise ValueError(
+                "Number of permutations must be divisible by number of bands"
+            )
+        if shingle_size < 1:
+            raise ValueError("Shingle size must be at least 1")
+        self.similarity_threshold = similarity_threshold
+        self.num_permutations = num_permutations
+        self.num_bands = num_bands
+        self.rows_per_band = num_permutations // num_bands
+        self.shingle_size = shingle_size
+
+        generator = np.random.default_rng(random_seed)
+        self.__hash_multipliers = generator.integers(
+            1, self._MERSENNE_PRIME, size=num_permutations, dtype=np.uint64
+        )
+        self.__hash_offsets = generator.integers(
+            0, self._MERSENNE_PRIME, size=num_permutations, dtype=np.uint64
+        )
+        self.__signatures: list[np.ndarray] = []
+        self.__texts: list[str] = []
+        self.__band_buckets: list[dict[bytes, list[int]]] = [
+            defaultdict(list) for _ in range(num_bands)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.__texts)
+
+    @property
+    def texts(self) -> list[str]:
+        return list(self.__texts)
+
+    def add(self, text: str) -> int:
+        signature = self.__make_signature(text)
+        return self.__add_signature(text, signature)
+
+    def query(self, text: str) -> list[int]:
+        """
+        Returns indices of previously added texts whose estimated Jaccard
+        similarity with the text is at or above the threshold
+        """
+        signature = self.__make_signature(text)
+        return self.__find_near_duplicates_of_signature(signature)
+
+    def add_if_not_near_duplicate(self, text: str) -> bool:
+        signature = self.__make_signature(text)
+        if self.__find_near_duplicates_of_signature(signature):
+            return False
+        self.__add_signature(text, signature)
+        return True
+
+    def estimate_similarity(self, text_1: str, text_2: str) -> float:
+        signature_1 = self.__make_signature(text_1)
+        signature_2 = self.__make_signature(text_2)
+        return float(np.mean(signature_1 == signature_2))
+
+    @classmethod
+    def deduplicate(
+        cls, texts: list[str], similarity_threshold: float = 0.8
+    ) -> list[str]:
+        """
+        Keeps the first occurrence of each group of near-duplicate texts
+        """
+        index = cls(similarity_threshold=similarity_threshold)
+        return [
+            text for text in texts if index.add_if_not_near_duplicate(text)
+        ]
+
+    def __add_signature(self, text: str, signature: np.ndarray) -> int:
+        item_index = len(self.__texts)
+        self.__texts.append(text)
+        self.__signatures.append(signature)
+        for band_number, band_key in enumerate(self.__band_keys(signature)):
+            self.__band_buckets[band_number][band_key].append(item_index)
+        return item_index
+
+    def __find_near_duplicates_of_signature(
+        self, signature: np.ndarray
+    ) -> list[int]:
+        candidate_indices: set[int] = set()
+        for band_number, band_key in enumerate(self.__band_keys(signature)):
+            bucket = self.__band_buckets[band_number].get(band_key)
+            if bucket:
+                candidate_indices.update(bucket)
+
+        near_duplicates = []
+        for candidate_index in sorted(candidate_indices):
+            estimated_similarity = np.mean(
+                self.__signatures[candidate_index] == signature
+            )
+            if estimated_similarity >= self.similarity_threshold:
+                near_duplicates.append(candidate_index)
+        return near_duplicates
+
+    def __band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[
+                band_number
+                * self.rows_per_band : (band_number + 1)
+                * self.rows_per_band
+            ].tobytes()
+            for band_number in range(self.num_bands)
+        ]
+
+    def __make_signature(self, text: str) -> np.ndarray:
+        shingle_hashes = np.array(
+            [
+                zlib.crc32(shingle.encode("utf-8"))
+                for shingle in self.__make_shingles(text)
+            ],
+            dtype=np.uint64,
+        )
+        shingle_hashes %= np.uint64(self._MERSENNE_PRIME)
+        permuted_hashes = (
+            np.outer(self.__hash_multipliers, shingle_hashes)
+            + self.__hash_offsets[:, np.newaxis]
+        ) % np.uint64(self._MERSENNE_PRIME)
+        return permuted_hashes.min(axis=1)
+
+    def __make_shingles(self, text: str) -> set[str]:
+        normalized_text = re.sub(r"\s+", " ", text.lower()).strip()
+        if len(normalized_text) <= self.shingle_size:
+            return {normalized_text}
+        return {
+            normalized_text[i : i + self.shingle_size]
+            for i in range(len(normalized_text) - self.shingle_size + 1)
+        }
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Generic, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls that share a key so only one of them runs.
+    Callers that arrive while a call is in flight wait for and share its
+    result (or exception) instead of starting their own.
+
+    The shared call runs in its own task, so cancelling one caller (e.g.
+    when its deadline passes) does not cancel the others. The task is only
+    cancelled once every caller waiting on it has been cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.__in_flight: dict[Hashable, _Flight[T]] = {}
+
+    def is_in_flight(self, key: Hashable) -> bool:
+        return self.__get_flight_for_running_loop(key) is not None
+
+    async def run(
+        self,
+        key: Hashable,
+        create_coroutine: Callable[[], Coroutine[Any, Any, T]],
+    ) -> tuple[T, bool]:
+        """
+        Returns the result and whether it was shared from another caller
+        """
+        flight = self.__get_flight_for_running_loop(key)
+        was_shared = flight is not None
+        if flight is None:
+            flight = _Flight(asyncio.create_task(create_coroutine()))
+            self.__in_flight[key] = flight
+            flight.task.add_done_callback(
+                lambda _: self.__forget_flight(key, flight)
+            )
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                logger.debug(
+                    f"Cancelling shared call for key {key} since all callers were cancelled"
+                )
+                flight.task.cancel()
+        return result, was_shared
+
+    def __forget_flight(self, key: Hashable, flight: _Flight[T]) -> None:
+        if self.__in_flight.get(key) is flight:
+            del self.__in_flight[key]
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    def __get_flight_for_running_loop(
+        self, key: Hashable
+    ) -> _Flight[T] | None:
+        flight = self.__in_flight.get(key)
+        if flight is None or flight.task.done():
+            return None
+        if flight.task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return flight
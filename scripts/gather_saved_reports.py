@@ -75,6 +75,7 @@ async def republish_reports(all_reports: list[BinaryReport]) -> None:
             time.sleep(10)  # Wait between publications to avoid rate limiting
         except Exception as e:
             logger.error(f"Failed to publish report: {e}")
+    ForecastDatabaseManager.flush_reports_to_database()
 
 
 if __name__ == "__main__":
@@ -66,13 +66,13 @@ async def run_morning_forecasts(bot_type: str, allow_rerun: bool) -> None:
 
     if os.environ.get("CODA_API_KEY"):
         for report in reports:
-            await asyncio.sleep(5)
             try:
                 ForecastDatabaseManager.add_forecast_report_to_database(
                     report, ForecastRunType.REGULAR_FORECAST
                 )
             except Exception as e:
                 logger.error(f"Error adding forecast report to database: {e}")
+        ForecastDatabaseManager.flush_reports_to_database()
 
 
 if __name__ == "__main__":